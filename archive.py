@@ -0,0 +1,216 @@
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+from typing import Any, Dict, Iterator, Optional, Tuple
+from serialization import CODECS, encode, decode
+from utils import atomic_write
+
+ARCHIVE_MAGIC = b'NECROARC'
+ARCHIVE_VERSION = 1
+ARCHIVE_CODEC = 'zlib'
+# Entries per offset table; a new table is appended when the current one is full
+DEFAULT_TABLE_CAPACITY = 1024
+
+# File header: magic, version, table capacity, offset of the first offset table
+HEADER = struct.Struct('<8sIIQ')
+# Offset table header: offset of the next table (0 if none), number of entries in use
+TABLE_HEADER = struct.Struct('<QI4x')
+# Offset table entry: id hash, record offset, record length, CRC-32 of the record
+ENTRY = struct.Struct('<16sQII')
+# Record header, followed by the id and the compressed game: id length
+RECORD_HEADER = struct.Struct('<H')
+
+IndexEntry = Tuple[int, int, int]
+
+
+def _id_hash(archive_id: str) -> bytes:
+    return hashlib.blake2b(archive_id.encode(), digest_size=16).digest()
+
+
+class GameArchive:
+    """
+    An append-only archive of finished games with random access by id.
+
+    The file starts with a header pointing at the first offset table. Each
+    offset table holds a fixed number of fixed-size entries (id hash, offset,
+    length and checksum of a game record) and a link to the next table.
+    Game records are compressed JSON appended to the end of the file and
+    never rewritten; appending only fills in the next free table entry.
+
+    Reads go through `mmap`: opening the archive scans the offset tables,
+    and reading a game touches only that game's record, so a single game
+    can be read from an archive of any size without loading the rest.
+    Archiving a game under an id that is already present appends a new
+    record, and the latest record wins.
+    """
+
+    def __init__(self, path: str, table_capacity: int = DEFAULT_TABLE_CAPACITY):
+        """
+        Open an archive, creating it if the file does not exist.
+
+        Args:
+            path (str): The archive file.
+            table_capacity (int): Entries per offset table for a new archive; existing archives keep theirs.
+        """
+        if table_capacity < 1:
+            raise ValueError("table_capacity must be at least 1")
+        self.path = path
+        if not os.path.exists(path):
+            with atomic_write(path) as file:
+                file.write(HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, table_capacity, HEADER.size))
+                file.write(TABLE_HEADER.pack(0, 0) + bytes(ENTRY.size * table_capacity))
+        self._file = open(path, 'r+b')
+        self._map: Optional[mmap.mmap] = None
+        self._remap()
+
+        magic, version, self.table_capacity, first_table = HEADER.unpack_from(self._map, 0)
+        if magic != ARCHIVE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a game archive")
+        if version != ARCHIVE_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported game archive version: {version}")
+
+        self._index: Dict[bytes, IndexEntry] = {}
+        self._table = first_table
+        self._table_count = 0
+        self._load_index(first_table)
+
+    def _remap(self) -> None:
+        """Map the whole file, e.g. after appending made it larger."""
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _load_index(self, table: int) -> None:
+        """Read every offset table into the in-memory id index."""
+        while True:
+            next_table, count = TABLE_HEADER.unpack_from(self._map, table)
+            start = table + TABLE_HEADER.size
+            for id_hash, offset, length, crc in ENTRY.iter_unpack(self._map[start:start + ENTRY.size * count]):
+                self._index[id_hash] = (offset, length, crc)
+            self._table, self._table_count = table, count
+            if not next_table:
+                return
+            table = next_table
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, archive_id: str) -> bool:
+        return _id_hash(archive_id) in self._index
+
+    def __enter__(self) -> "GameArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def append(self, archive_id: str, game_state: Dict[str, Any]) -> int:
+        """
+        Append a game to the archive.
+
+        The record is written before the offset table entry that points to
+        it, and the entry only counts once the table's entry count is
+        updated, so an interrupted append leaves the archive readable.
+
+        Args:
+            archive_id (str): The id to read the game back with.
+            game_state (Dict[str, Any]): The game state or GameLogic snapshot.
+
+        Returns:
+            int: The size of the record in bytes.
+        """
+        encoded_id = archive_id.encode()
+        if not encoded_id or len(encoded_id) > 0xFFFF:
+            raise ValueError("Archive id must be between 1 and 65535 bytes")
+        compress, _ = CODECS[ARCHIVE_CODEC]
+        record = RECORD_HEADER.pack(len(encoded_id)) + encoded_id + compress(encode(game_state).encode())
+
+        if self._table_count == self.table_capacity:
+            self._append_table()
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(record)
+        entry = (_id_hash(archive_id), offset, len(record), zlib.crc32(record))
+        entry_offset = self._table + TABLE_HEADER.size + ENTRY.size * self._table_count
+        self._file.seek(entry_offset)
+        self._file.write(ENTRY.pack(*entry))
+        self._file.seek(self._table)
+        self._file.write(TABLE_HEADER.pack(0, self._table_count + 1))
+        self._file.flush()
+
+        self._table_count += 1
+        self._index[entry[0]] = entry[1:]
+        return len(record)
+
+    def _append_table(self) -> None:
+        """Append an empty offset table and link the current one to it."""
+        table = self._file.seek(0, os.SEEK_END)
+        self._file.write(TABLE_HEADER.pack(0, 0) + bytes(ENTRY.size * self.table_capacity))
+        self._file.seek(self._table)
+        self._file.write(TABLE_HEADER.pack(table, self._table_count))
+        self._table, self._table_count = table, 0
+
+    def get(self, archive_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one game from the archive.
+
+        Args:
+            archive_id (str): The id the game was archived under.
+
+        Returns:
+            Optional[Dict[str, Any]]: The game, or None if the archive has no game with this id.
+        """
+        entry = self._index.get(_id_hash(archive_id))
+        if entry is None:
+            return None
+        stored_id, payload = self._read_record(entry)
+        if stored_id != archive_id:
+            return None
+        _, decompress = CODECS[ARCHIVE_CODEC]
+        return decode(decompress(payload))
+
+    def _read_record(self, entry: IndexEntry) -> Tuple[str, bytes]:
+        """Slice a record out of the mapped file and verify it: (archive id, compressed game)."""
+        offset, length, crc = entry
+        if offset + length > len(self._map):
+            self._file.flush()
+            self._remap()
+        record = self._map[offset:offset + length]
+        if zlib.crc32(record) != crc:
+            raise ValueError(f"Archive record at offset {offset} is corrupted: checksum mismatch")
+        (id_length,) = RECORD_HEADER.unpack_from(record, 0)
+        start = RECORD_HEADER.size
+        return record[start:start + id_length].decode(), record[start + id_length:]
+
+    def ids(self) -> Iterator[str]:
+        """
+        Yield the id of every game in the archive, reading only the record headers.
+
+        Yields:
+            str: Archive ids in no particular order.
+        """
+        for offset, length, _ in self._index.values():
+            if offset + length > len(self._map):
+                self._file.flush()
+                self._remap()
+            (id_length,) = RECORD_HEADER.unpack_from(self._map, offset)
+            start = offset + RECORD_HEADER.size
+            yield self._map[start:start + id_length].decode()
+
+    def flush(self) -> None:
+        """Force appended games to disk."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Flush and close the archive."""
+        if self._file.closed:
+            return
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self.flush()
+        self._file.close()
@@ -0,0 +1,278 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from database import Database
+from serialization import CODECS, encode, decode
+
+DEFAULT_FULL_EVERY = 50
+DEFAULT_CODEC = 'zlib'
+# Seconds the background autosaver waits for more actions before writing
+DEFAULT_AUTOSAVE_DELAY = 0.5
+
+
+def diff_state(old: Any, new: Any) -> Optional[Dict[str, Any]]:
+    """
+    Compute a delta that turns `old` into `new`.
+
+    Dicts are compared key by key and lists index by index, so a fighter
+    moving one tile produces a delta touching only that fighter and the two
+    tiles. A delta is one of:
+        {"=": value}                     replace the value
+        {"d": {key: delta}, "r": [keys]} change dict keys, removing "r"
+        {"l": {index: delta}, "n": len}  change list items and resize to "n"
+
+    Args:
+        old (Any): The previous JSON-compatible state.
+        new (Any): The current JSON-compatible state.
+
+    Returns:
+        Optional[Dict[str, Any]]: The delta, or None if nothing changed.
+    """
+    if type(old) is type(new) and old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, value in new.items():
+            change = diff_state(old[key], value) if key in old else {'=': value}
+            if change is not None:
+                changes[key] = change
+        removed = [key for key in old if key not in new]
+        if not changes and not removed:
+            return None
+        delta: Dict[str, Any] = {'d': changes}
+        if removed:
+            delta['r'] = removed
+        return delta
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        changes = {}
+        for index, value in enumerate(new):
+            change = diff_state(old[index], value) if index < len(old) else {'=': value}
+            if change is not None:
+                changes[index] = change
+        if not changes and len(old) == len(new):
+            return None
+        return {'l': changes, 'n': len(new)}
+    return {'=': new}
+
+
+def apply_delta(value: Any, delta: Dict[str, Any]) -> Any:
+    """
+    Apply a delta produced by diff_state().
+
+    Unchanged parts of `value` are shared with the result, not copied.
+
+    Args:
+        value (Any): The state the delta was computed against.
+        delta (Dict[str, Any]): The delta, possibly decoded from JSON.
+
+    Returns:
+        Any: The updated state.
+    """
+    if '=' in delta:
+        return delta['=']
+    if 'd' in delta:
+        result = dict(value)
+        for key in delta.get('r', []):
+            result.pop(key, None)
+        for key, change in delta['d'].items():
+            result[key] = apply_delta(result.get(key), change)
+        return result
+    length = delta['n']
+    result = list(value[:length])
+    result.extend([None] * (length - len(result)))
+    for index, change in delta['l'].items():
+        index = int(index)  # JSON turns the list indexes into strings
+        result[index] = apply_delta(result[index], change)
+    return result
+
+
+class Autosaver:
+    """
+    Keep a compressed, delta-encoded autosave log of a game in its Database.
+
+    Every `full_every`-th save writes a full compressed snapshot; the saves in
+    between write only the compressed delta from the previous save. Loading
+    rebuilds the latest state from the newest full snapshot and its deltas.
+    """
+
+    def __init__(self, db: Database, game_id: Optional[str] = None, full_every: int = DEFAULT_FULL_EVERY,
+                 codec: str = DEFAULT_CODEC):
+        """
+        Initialize the Autosaver.
+
+        Args:
+            db (Database): The database holding the autosave log.
+            game_id (Optional[str]): The game to autosave; defaults to the database's game.
+            full_every (int): Number of saves per full snapshot, counting the snapshot itself.
+            codec (str): Compression codec, 'zlib' or 'lzma'.
+        """
+        if full_every < 1:
+            raise ValueError("full_every must be at least 1")
+        if codec not in CODECS:
+            raise ValueError(f"Unknown autosave codec: {codec}. Use one of: {', '.join(CODECS)}")
+        self.db = db
+        self.game_id = game_id or db.game_id
+        self.full_every = full_every
+        self.codec = codec
+        self._last_state: Optional[Dict[str, Any]] = None
+        self._sequence: Optional[int] = None
+        self._since_full = 0
+        self.bytes_written = 0
+        self.writes = 0
+
+    def save(self, state: Dict[str, Any]) -> int:
+        """
+        Autosave a game snapshot.
+
+        Args:
+            state (Dict[str, Any]): The snapshot, e.g. from GameLogic.snapshot(). It is kept
+                to diff the next save against, so it must not be modified afterwards.
+
+        Returns:
+            int: Compressed bytes written; 0 if nothing changed since the last save.
+        """
+        is_full = self._last_state is None or self._since_full >= self.full_every
+        if is_full:
+            payload = state
+        else:
+            payload = diff_state(self._last_state, state)
+            if payload is None:
+                return 0
+
+        if self._sequence is None:
+            last = self.db.last_autosave_sequence(self.game_id)
+            self._sequence = -1 if last is None else last
+        compress, _ = CODECS[self.codec]
+        data = compress(encode(payload).encode())
+        self.db.append_autosave(self._sequence + 1, is_full, self.codec, data, game_id=self.game_id)
+
+        self._sequence += 1
+        self._since_full = 1 if is_full else self._since_full + 1
+        self._last_state = state
+        self.bytes_written += len(data)
+        self.writes += 1
+        logging.debug(f"Autosaved {'snapshot' if is_full else 'delta'} {self._sequence} ({len(data)} bytes)")
+        return len(data)
+
+    def load_latest(self) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the latest autosaved snapshot.
+
+        Returns:
+            Optional[Dict[str, Any]]: The snapshot, or None if the game has no autosave.
+        """
+        state = None
+        for _, is_full, codec, data in self.db.load_autosave_chain(self.game_id):
+            _, decompress = CODECS[codec]
+            payload = decode(decompress(data))
+            state = payload if is_full else apply_delta(state, payload)
+        return state
+
+    def flush(self) -> None:
+        """Wait for pending autosaves; saves are written immediately, so there is nothing to wait for."""
+
+    def close(self) -> None:
+        """Stop autosaving, writing anything still pending."""
+        self.flush()
+
+
+class BackgroundAutosaver(Autosaver):
+    """
+    An Autosaver that writes on a worker thread instead of the caller's.
+
+    save() only queues the snapshot and returns. The worker waits `delay`
+    seconds for further saves and then writes only the newest snapshot, so a
+    burst of actions produces a single write. Diffing, compression and disk
+    writes all happen off the caller's thread.
+    """
+
+    def __init__(self, db: Database, game_id: Optional[str] = None, full_every: int = DEFAULT_FULL_EVERY,
+                 codec: str = DEFAULT_CODEC, delay: float = DEFAULT_AUTOSAVE_DELAY):
+        """
+        Initialize the BackgroundAutosaver and start its worker thread.
+
+        Args:
+            db (Database): The database holding the autosave log.
+            game_id (Optional[str]): The game to autosave; defaults to the database's game.
+            full_every (int): Number of writes per full snapshot, counting the snapshot itself.
+            codec (str): Compression codec, 'zlib' or 'lzma'.
+            delay (float): Seconds to wait for newer snapshots before writing.
+        """
+        super().__init__(db, game_id=game_id, full_every=full_every, codec=codec)
+        self.delay = delay
+        self.coalesced = 0
+        self._condition = threading.Condition()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._writing = False
+        self._flushing = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def save(self, state: Dict[str, Any]) -> int:
+        """
+        Queue a snapshot for the worker, replacing any snapshot not yet written.
+
+        Args:
+            state (Dict[str, Any]): The snapshot; it must not be modified afterwards.
+
+        Returns:
+            int: Always 0, since nothing is written on the caller's thread.
+        """
+        with self._condition:
+            if self._closed:
+                raise ValueError("Autosaver is closed")
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = state
+            self._condition.notify_all()
+        return 0
+
+    def _run(self) -> None:
+        """Worker loop: wait for a snapshot, let newer ones replace it for `delay` seconds, then write it."""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                deadline = time.monotonic() + self.delay
+                while not self._closed and not self._flushing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                state, self._pending = self._pending, None
+                self._writing = True
+            try:
+                super().save(state)
+            except Exception as e:
+                logging.error(f"Background autosave failed: {str(e)}", exc_info=True)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Write the pending snapshot now and wait until it is stored."""
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                self._condition.wait_for(lambda: self._pending is None and not self._writing)
+            finally:
+                self._flushing -= 1
+
+    def close(self) -> None:
+        """Write the pending snapshot and stop the worker thread."""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def load_latest(self) -> Optional[Dict[str, Any]]:
+        """Rebuild the latest autosaved snapshot, including one still waiting to be written."""
+        self.flush()
+        return super().load_latest()
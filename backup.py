@@ -0,0 +1,133 @@
+import base64
+import hashlib
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
+from serialization import CODECS, encode, decode
+
+BACKUP_FORMAT = 'necromunda-backup'
+BACKUP_VERSION = 1
+DEFAULT_CHUNK_SIZE = 100
+
+
+def write_backup(file: BinaryIO, records: Iterable[Dict[str, Any]], compression: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream records to a line-delimited backup file, one chunk at a time.
+
+    The file starts with a header line. Each chunk is a line holding its
+    record count and the SHA-256 of its records, followed by the records as
+    JSON lines, or by one base64 line of the compressed records. A footer
+    line with the totals ends the file. Only one chunk is held in memory.
+
+    Args:
+        file (BinaryIO): File opened for binary writing.
+        records (Iterable[Dict[str, Any]]): The records to back up.
+        compression (Optional[str]): 'zlib', 'lzma', or None for plain JSON lines.
+        chunk_size (int): Number of records per chunk.
+
+    Returns:
+        int: The number of records written.
+    """
+    if compression is not None and compression not in CODECS:
+        raise ValueError(f"Unknown backup compression: {compression}. Use one of: {', '.join(CODECS)}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    file.write(_line({"format": BACKUP_FORMAT, "version": BACKUP_VERSION, "compression": compression}))
+    chunks = 0
+    total = 0
+    chunk: List[bytes] = []
+
+    def flush_chunk() -> None:
+        payload = b"".join(chunk)
+        header = {"chunk": chunks, "records": len(chunk), "sha256": hashlib.sha256(payload).hexdigest()}
+        file.write(_line(header))
+        if compression is None:
+            file.write(payload)
+        else:
+            compress, _ = CODECS[compression]
+            file.write(base64.b64encode(compress(payload)) + b"\n")
+
+    for record in records:
+        chunk.append(_line(record))
+        if len(chunk) >= chunk_size:
+            flush_chunk()
+            chunks += 1
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        flush_chunk()
+        chunks += 1
+        total += len(chunk)
+
+    file.write(_line({"end": True, "chunks": chunks, "records": total}))
+    return total
+
+
+def read_backup(file: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of a backup written by write_backup().
+
+    Each chunk is verified against its checksum before any of its records
+    are yielded, so a damaged chunk raises ValueError instead of restoring
+    corrupted saves.
+
+    Args:
+        file (BinaryIO): File opened for binary reading, positioned at the start.
+
+    Yields:
+        Dict[str, Any]: The records, in the order they were written.
+    """
+    header = _read_line(file, "header")
+    if header.get("format") != BACKUP_FORMAT:
+        raise ValueError("Not a Necromunda backup file")
+    if header.get("version") != BACKUP_VERSION:
+        raise ValueError(f"Unsupported backup version: {header.get('version')}")
+    compression = header.get("compression")
+    if compression is not None and compression not in CODECS:
+        raise ValueError(f"Unknown backup compression: {compression}")
+
+    chunks = 0
+    total = 0
+    while True:
+        entry = _read_line(file, "chunk header")
+        if entry.get("end"):
+            if entry.get("chunks") != chunks or entry.get("records") != total:
+                raise ValueError("Backup is incomplete: footer does not match its chunks")
+            return
+        if entry.get("chunk") != chunks:
+            raise ValueError(f"Backup chunk {chunks} is missing")
+
+        if compression is None:
+            lines = [file.readline() for _ in range(entry["records"])]
+            payload = b"".join(lines)
+        else:
+            _, decompress = CODECS[compression]
+            try:
+                payload = decompress(base64.b64decode(file.readline()))
+            except Exception as e:
+                raise ValueError(f"Backup chunk {chunks} cannot be decompressed: {e}")
+            lines = payload.splitlines(keepends=True)
+        if hashlib.sha256(payload).hexdigest() != entry.get("sha256") or len(lines) != entry["records"]:
+            raise ValueError(f"Backup chunk {chunks} is corrupted: checksum mismatch")
+
+        for line in lines:
+            yield decode(line)
+        chunks += 1
+        total += len(lines)
+
+
+def _line(value: Any) -> bytes:
+    return encode(value).encode() + b"\n"
+
+
+def _read_line(file: BinaryIO, what: str) -> Dict[str, Any]:
+    line = file.readline()
+    if not line:
+        raise ValueError(f"Backup ended unexpectedly: missing {what}")
+    try:
+        value = decode(line)
+    except ValueError:
+        raise ValueError(f"Backup {what} is not valid JSON")
+    if not isinstance(value, dict):
+        raise ValueError(f"Backup {what} is not valid")
+    return value
@@ -0,0 +1,111 @@
+"""
+Time importing a league roster file, one fighter per row, sequentially and in worker processes,
+and end to end into a game.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_roster_import [--fighters N] [--repeat N]
+"""
+import argparse
+import csv
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+from rich.console import Console
+from rich.table import Table
+from database import Database
+from game_logic import GameLogic
+from gang_builder import create_gang_member
+from roster_import import JSON_COLUMNS, import_roster_file
+
+GANG_TYPES = ["Goliath", "Escher", "Orlock", "Van Saar", "Cawdor", "Delaque"]
+LASGUN = {"name": "Lasgun", "weapon_type": "Basic", "cost": 15, "rarity": "Common",
+          "profiles": [{"range": "Short: 0-8, Long: 8-24", "strength": 3, "armor_penetration": 0, "damage": 1,
+                        "ammo_roll": "2+"}]}
+STUB_GUN = {"name": "Stub Gun", "weapon_type": "Pistol", "cost": 5, "rarity": "Common",
+            "profiles": [{"range": "Short: 0-6, Long: 6-12", "strength": 3, "armor_penetration": 0, "damage": 1,
+                          "ammo_roll": "4+"}]}
+FLAK = {"name": "Flak Armour", "armor_rating": 6, "locations": ["Body"]}
+
+
+def roster_rows(fighters: int) -> List[Dict[str, Any]]:
+    """A league roster: gangs of up to 20 fighters, each gang with a Leader and two Champions."""
+    rows = []
+    for n in range(fighters):
+        gang, position = divmod(n, 20)
+        role = "Leader" if position == 0 else "Champion" if position < 3 else "Ganger"
+        rows.append({
+            "gang": f"Gang {gang}", "name": f"Fighter {n}", "role": role,
+            "gang_affiliation": GANG_TYPES[gang % len(GANG_TYPES)],
+            "movement": 4, "weapon_skill": 4, "ballistic_skill": 4, "strength": 3, "toughness": 3, "wounds": 1,
+            "initiative": 4, "attacks": 1, "leadership": 7, "cool": 7, "will": 7, "intelligence": 7,
+            "credits_value": 50, "weapons": [LASGUN, STUB_GUN] if n % 3 else [LASGUN], "armor": FLAK,
+            "skills": ["Nerves of Steel"] if role != "Ganger" else [],
+        })
+    return rows
+
+
+def write_roster(directory: str, rows: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Write the roster as JSON lines and as CSV; returns the paths by format."""
+    paths = {"jsonl": os.path.join(directory, "roster.jsonl"), "csv": os.path.join(directory, "roster.csv")}
+    with open(paths["jsonl"], "w") as file:
+        file.writelines(json.dumps(row) + "\n" for row in rows)
+    with open(paths["csv"], "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: json.dumps(value) if key in JSON_COLUMNS else value for key, value in row.items()})
+    return paths
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Median wall time of `func` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def time_game_import(directory: str, path: str, repeat: int) -> float:
+    """Median wall time in milliseconds of GameLogic.import_roster() into a new game."""
+    samples = []
+    for run in range(repeat):
+        game_logic = GameLogic(Database(os.path.join(directory, f"game{run}.db")), seed=1)
+        start = time.perf_counter()
+        game_logic.import_roster(path)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark roster imports.")
+    parser.add_argument('--fighters', type=int, default=500, help="Fighters in the roster")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per measurement")
+    args = parser.parse_args()
+
+    rows = roster_rows(args.fighters)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_roster(directory, rows)
+        table = Table(title=f"Importing {args.fighters} fighters (median of {args.repeat})",
+                      show_header=True, header_style="bold magenta")
+        table.add_column("Path")
+        table.add_column("Time (ms)", justify="right")
+        table.add_row("create_gang_member per row (previous)",
+                      f"{time_call(lambda: [create_gang_member(row) for row in rows], args.repeat):.1f}")
+        for format, path in paths.items():
+            table.add_row(f"import_roster_file, {format}",
+                          f"{time_call(lambda: import_roster_file(path), args.repeat):.1f}")
+        table.add_row("import_roster_file, jsonl, 4 workers",
+                      f"{time_call(lambda: import_roster_file(paths['jsonl'], workers=4), args.repeat):.1f}")
+        table.add_row("GameLogic.import_roster, jsonl",
+                      f"{time_game_import(directory, paths['jsonl'], args.repeat):.1f}")
+        Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Compare the ways a GameState can be saved and loaded, for a small and a large game.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_serialization [--repeat N]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+from rich.console import Console
+from rich.table import Table
+from database import Database
+from game_logic import GameLogic
+from models import Battlefield, CombatRound, Gang, GameState, Weapon, WeaponProfile
+from models.gang_models import GangerRole
+from models.weapon_models import Rarity, WeaponType
+import serialization
+
+
+def build_small_game() -> GameState:
+    """The two-fighter game every new GameLogic starts with."""
+    return GameLogic(Database(os.path.join(tempfile.mkdtemp(), "bench.db")), seed=1).game_state
+
+
+def build_large_game(gang_count: int = 6, fighters_per_gang: int = 30, rounds: int = 50) -> GameState:
+    """A league-sized game: many armed fighters, a large battlefield and a long history."""
+    game_state = build_small_game()
+    template = game_state.gangs[0].members[0]
+    weapon = Weapon(
+        name="Autogun", weapon_type=WeaponType.BASIC, cost=15, rarity=Rarity.COMMON,
+        description="A reliable automatic rifle",
+        profiles=[WeaponProfile(range="Short: 0-8, Long: 8-24", strength=3, armor_penetration=0, damage=1,
+                                short_range_modifier=1, long_range_modifier=0, ammo_roll="4+",
+                                blast_radius=None, traits=[])]
+    )
+    gangs = []
+    for g in range(gang_count):
+        members = []
+        for f in range(fighters_per_gang):
+            members.append(template.model_copy(deep=True, update={
+                "name": f"Fighter {g}-{f}",
+                "role": GangerRole.LEADER if f == 0 else GangerRole.GANGER,
+                "weapons": [weapon.model_copy(deep=True) for _ in range(2)],
+                "x": f % 48, "y": g,
+            }))
+        gangs.append(Gang(name=f"Gang {g}", type=game_state.gangs[g % 2].type, members=members))
+    template_round: CombatRound = game_state.combat_rounds[0]
+    return game_state.model_copy(update={
+        "gangs": gangs,
+        "battlefield": Battlefield.generate_default(48, 48),
+        "combat_rounds": [template_round.model_copy(deep=True, update={"round_number": n + 1}) for n in range(rounds)],
+        "event_log": [f"Event {n}: Fighter {n % gang_count}-{n % fighters_per_gang} acted." for n in range(rounds * 10)],
+    })
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Median wall time of `func` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def benchmark_game(game_state: GameState, repeat: int) -> List[Tuple[str, float, float, int]]:
+    """Time every save/load path for one game: (path, save ms, load ms, bytes)."""
+    results = []
+
+    baseline = json.dumps(game_state.model_dump())
+    results.append(("model_dump + json (previous)",
+                    time_call(lambda: json.dumps(game_state.model_dump()), repeat),
+                    time_call(lambda: GameState.model_validate(json.loads(baseline)), repeat),
+                    len(baseline)))
+
+    raw = serialization.dump_game_state_json(game_state)
+    results.append(("model_dump_json / model_validate_json",
+                    time_call(lambda: serialization.dump_game_state_json(game_state), repeat),
+                    time_call(lambda: serialization.load_game_state_json(raw), repeat),
+                    len(raw)))
+
+    codec_name = "orjson" if serialization.HAS_ORJSON else "json"
+    encoded = serialization.encode(serialization.dump_game_state(game_state))
+    results.append((f"dump_game_state + {codec_name}",
+                    time_call(lambda: serialization.encode(serialization.dump_game_state(game_state)), repeat),
+                    time_call(lambda: serialization.load_game_state(serialization.decode(encoded)), repeat),
+                    len(encoded)))
+    results.append((f"dump_game_state + {codec_name}, trusted load",
+                    time_call(lambda: serialization.encode(serialization.dump_game_state(game_state)), repeat),
+                    time_call(lambda: serialization.load_game_state(serialization.decode(encoded), trusted=True),
+                              repeat),
+                    len(encoded)))
+
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    data = serialization.dump_game_state(game_state)
+    db.save_game_state(data)
+    results.append(("Database save (unchanged) / load",
+                    time_call(lambda: db.save_game_state(serialization.dump_game_state(game_state)), repeat),
+                    time_call(lambda: serialization.load_game_state(db.load_game_state(), trusted=True), repeat),
+                    sum(os.path.getsize(path) for path in (db.db_path, db.db_path + "-wal") if os.path.exists(path))))
+    db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark GameState serialization paths.")
+    parser.add_argument('--repeat', type=int, default=20, help="Timed runs per measurement")
+    args = parser.parse_args()
+
+    console = Console()
+    games: Dict[str, GameState] = {"small": build_small_game(), "large": build_large_game()}
+    for label, game_state in games.items():
+        fighters = sum(len(gang.members) for gang in game_state.gangs)
+        table = Table(title=f"{label.title()} game: {fighters} fighters, {len(game_state.battlefield.tiles)} tiles, "
+                            f"{len(game_state.combat_rounds)} rounds (median of {args.repeat})",
+                      show_header=True, header_style="bold magenta")
+        table.add_column("Path")
+        table.add_column("Save (ms)", justify="right")
+        table.add_column("Load (ms)", justify="right")
+        table.add_column("Bytes", justify="right")
+        for path, save_ms, load_ms, size in benchmark_game(game_state, args.repeat):
+            table.add_row(path, f"{save_ms:.2f}", f"{load_ms:.2f}", f"{size:,}")
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Measure process startup: wall time of short invocations and where import time goes.
+
+Each case runs in a fresh interpreter in a scratch directory, so the log
+file and database it creates don't touch the checkout. Run from the
+repository root:
+
+    python -m benchmarks.bench_startup [--repeat N] [--top N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+from rich.console import Console
+from rich.table import Table
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "main.py")
+
+# (label, interpreter arguments, stdin)
+CASES: List[Tuple[str, List[str], Optional[str]]] = [
+    ("python (baseline)", ["-c", "pass"], None),
+    ("import models", ["-c", "import models"], None),
+    ("import game_logic", ["-c", "import game_logic"], None),
+    ("main.py --help", [MAIN, "--help"], None),
+    ("main.py --script - --quiet (one move)", [MAIN, "--script", "-", "--quiet"], "move Crusher 1 1\n"),
+]
+
+
+def run(args: List[str], stdin: Optional[str], cwd: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    """Run one interpreter with the repository on its path."""
+    # Bytecode caching stays on, as for real invocations; time_case() warms the cache first
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPATH"] = ROOT
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + args
+    return subprocess.run(command, input=stdin, capture_output=True, text=True, cwd=cwd, env=env, check=True)
+
+
+def time_case(args: List[str], stdin: Optional[str], cwd: str, repeat: int) -> float:
+    """Median wall time of a case in milliseconds."""
+    run(args, stdin, cwd)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(args, stdin, cwd)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def import_times(args: List[str], stdin: Optional[str], cwd: str) -> Dict[str, int]:
+    """Import time in microseconds by top-level package, summed over its modules, from -X importtime."""
+    totals: Dict[str, int] = {}
+    for line in run(args, stdin, cwd, importtime=True).stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + int(self_us)
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark process startup.")
+    parser.add_argument('--repeat', type=int, default=10, help="Runs per case")
+    parser.add_argument('--top', type=int, default=12, help="Packages listed in the import breakdown")
+    args = parser.parse_args()
+
+    console = Console()
+    with tempfile.TemporaryDirectory() as cwd:
+        table = Table(title=f"Startup wall time (median of {args.repeat})", show_header=True, header_style="bold magenta")
+        table.add_column("Case")
+        table.add_column("Wall (ms)", justify="right")
+        for label, case_args, stdin in CASES:
+            table.add_row(label, f"{time_case(case_args, stdin, cwd, args.repeat):.1f}")
+        console.print(table)
+
+        label, case_args, stdin = CASES[-1]
+        totals = import_times(case_args, stdin, cwd)
+        table = Table(title=f"Import time by package: {label}", show_header=True, header_style="bold magenta")
+        table.add_column("Package")
+        table.add_column("Import (ms)", justify="right")
+        for package, micros in sorted(totals.items(), key=lambda item: -item[1])[:args.top]:
+            table.add_row(package, f"{micros / 1000:.1f}")
+        table.add_row("total", f"{sum(totals.values()) / 1000:.1f}")
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
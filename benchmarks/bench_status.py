@@ -0,0 +1,93 @@
+"""
+Time the status command for large gangs: refreshes in each UserInterface output mode, a refresh after
+a fighter changes, and a first render with nothing cached.
+
+Output goes to the null device through a terminal-style console, so the
+timings include Rich rendering and the writes but not a terminal drawing
+them. Run from the repository root:
+
+    python -m benchmarks.bench_status [--fighters N] [--repeat N]
+"""
+import argparse
+import logging
+import os
+import statistics
+import time
+from typing import Callable
+from rich.console import Console
+from rich.table import Table
+from database import Database
+from game_logic import GameLogic
+from gang_builder import WeaponInput, build_weapon
+from models.gang_models import GangerRole
+from models.item_catalog import ITEM_CATALOG
+from user_interface import OUTPUT_MODES, STATUS_PAGE_SIZE, UserInterface
+
+LASGUN = {"name": "Lasgun", "weapon_type": "Basic", "cost": 15, "rarity": "Common",
+          "profiles": [{"range": "Short: 0-8, Long: 8-24", "strength": 3, "armor_penetration": 0, "damage": 1}]}
+
+
+def large_game(fighters: int) -> GameLogic:
+    """A game whose two gangs have `fighters` armed fighters each."""
+    game_logic = GameLogic(Database(), seed=1)
+    lasgun = ITEM_CATALOG.intern(build_weapon(WeaponInput.model_validate(LASGUN)))
+    for gang in game_logic.game_state.gangs:
+        leader = gang.members[0]
+        leader.weapons = [lasgun]
+        for n in range(1, fighters):
+            game_logic.game_state.add_member(gang, leader.model_copy(update={
+                "name": f"{leader.name} {n}", "role": GangerRole.GANGER, "weapons": [lasgun, lasgun]}))
+    return game_logic
+
+
+def time_status(ui: UserInterface, repeat: int, before: Callable[[], object] = lambda: None,
+                command: str = "status") -> float:
+    """Median time of a command in milliseconds, after one untimed run; `before` runs untimed ahead of each."""
+    ui.process_command(command)
+    samples = []
+    for _ in range(repeat):
+        before()
+        started = time.perf_counter()
+        ui.process_command(command)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the status command.")
+    parser.add_argument('--fighters', type=int, default=100, help="Fighters per gang")
+    parser.add_argument('--repeat', type=int, default=10, help="Timed runs per case")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    game_logic = large_game(args.fighters)
+    fighter = game_logic.game_state.gangs[0].members[-1]
+    last_page = -(-args.fighters // STATUS_PAGE_SIZE)
+    table = Table(title=f"status, 2 gangs of {args.fighters} (median of {args.repeat})",
+                  show_header=True, header_style="bold magenta")
+    table.add_column("Case")
+    table.add_column("Time (ms)", justify="right")
+    with open(os.devnull, "w") as devnull:
+        console = Console(file=devnull, force_terminal=True, width=120)
+        for output in OUTPUT_MODES:
+            ui = UserInterface(console, game_logic, output=output)
+            table.add_row(f"refresh, nothing changed ({output})", f"{time_status(ui, args.repeat):.1f}")
+
+        def gain_xp() -> None:
+            fighter.xp += 1
+
+        ui = UserInterface(console, game_logic, output='buffered')
+        # The last page holds the fighter who changes
+        table.add_row("refresh, a fighter on the page changed (buffered)",
+                      f"{time_status(ui, args.repeat, gain_xp, command=f'status {last_page}'):.1f}")
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            UserInterface(console, game_logic, output='buffered').process_command("status")
+            samples.append((time.perf_counter() - started) * 1000)
+        table.add_row("first render (buffered)", f"{statistics.median(samples):.1f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
 import logging
+import time
+from typing import Iterable, Iterator, List, TextIO
 from rich.console import Console
+from rich.table import Table
 from user_interface import UserInterface
 from game_logic import GameLogic
 from database import initialize_database
+from utils import percentile
+
+SCRIPT_FLUSH_EVERY = 100  # commands between writes of buffered script output
+
 
 def run_cli(game_logic: GameLogic, ui: UserInterface, console: Console) -> None:
     """
@@ -33,6 +40,11 @@ def run_cli(game_logic: GameLogic, ui: UserInterface, console: Console) -> None:
         logging.error(f"An unexpected error occurred in CLI loop: {str(e)}", exc_info=True)
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
     finally:
+        # Keep the actions since the last replay checkpoint in the game's history
+        game_logic.save_replay()
+        if game_logic.autosaver is not None:
+            # Write the autosave still waiting in the background before the process exits
+            game_logic.autosaver.close()
         console.print("[bold red]Exiting Necromunda Simulation. Goodbye![/bold red]")
         logging.info("Necromunda Simulation ended.")
 
@@ -91,3 +103,76 @@ def test_mode(game_logic: GameLogic, ui: UserInterface, console: Console) -> Non
     except Exception as e:
         logging.error(f"An unexpected error occurred in test mode: {str(e)}", exc_info=True)
         console.print(f"[bold red]An unexpected error occurred in test mode:[/bold red] {str(e)}")
+
+
+def read_script_commands(stream: TextIO) -> Iterator[str]:
+    """
+    Stream commands from a script, one per line.
+
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        stream (TextIO): The open script file or stdin.
+
+    Yields:
+        str: Each command in order.
+    """
+    for line in stream:
+        command = line.strip()
+        if command and not command.startswith('#'):
+            yield command
+
+
+def run_script(ui: UserInterface, console: Console, commands: Iterable[str], quiet: bool = False) -> List[float]:
+    """
+    Run a stream of commands as fast as the rules engine allows and report throughput.
+
+    Command output is rendered into the UserInterface's buffer and written
+    out every SCRIPT_FLUSH_EVERY commands instead of after every print.
+    With quiet set, the null output mode is used: output is not rendered
+    at all and only the final report is shown.
+
+    Args:
+        ui (UserInterface): The user interface instance
+        console (Console): The rich console instance used for the report
+        commands (Iterable[str]): The commands to run, e.g. from read_script_commands
+        quiet (bool): Skip rendering command output entirely
+
+    Returns:
+        List[float]: The latency of each command in seconds.
+    """
+    original_output, original_flush_every = ui.output, ui.flush_every
+    ui.set_output('null' if quiet else 'buffered', flush_every=SCRIPT_FLUSH_EVERY)
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    try:
+        for command in commands:
+            if command.lower() == 'quit':
+                break
+            command_started = time.perf_counter()
+            ui.process_command(command)
+            latencies.append(time.perf_counter() - command_started)
+    except KeyboardInterrupt:
+        logging.info("Script interrupted by user.")
+    finally:
+        elapsed = time.perf_counter() - started
+        # Writes out the output still buffered
+        ui.set_output(original_output, original_flush_every)
+
+    _print_script_report(console, latencies, elapsed)
+    logging.info(f"Script finished: {len(latencies)} commands in {elapsed:.3f}s")
+    return latencies
+
+
+def _print_script_report(console: Console, latencies: List[float], elapsed: float) -> None:
+    """Print command throughput and latency percentiles for a script run."""
+    table = Table(title="Script Throughput", show_header=True, header_style="bold magenta")
+    table.add_column("Metric", justify="left")
+    table.add_column("Value", justify="right")
+    table.add_row("Commands", str(len(latencies)))
+    table.add_row("Elapsed", f"{elapsed:.3f} s")
+    table.add_row("Commands/s", f"{len(latencies) / elapsed:.1f}" if elapsed > 0 else "-")
+    for label, pct in (("p50", 50), ("p90", 90), ("p99", 99), ("max", 100)):
+        table.add_row(f"Latency {label}", f"{percentile(latencies, pct) * 1000:.3f} ms")
+    console.print(table)
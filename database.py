@@ -1,104 +1,1049 @@
 import json
-from tinydb import TinyDB, Query
-from tinydb.storages import JSONStorage
-from tinydb.middlewares import CachingMiddleware
-from typing import Optional, Dict
+import os
+import sqlite3
+import hashlib
+import time
+import threading
+from typing import Callable, Optional, Dict, Any, Iterator, Tuple, List, Union
 import contextlib
+import itertools
+from models import SaveSlotInfo
+from serialization import encode, decode
+from backup import DEFAULT_CHUNK_SIZE, read_backup, write_backup
+from archive import GameArchive
+from utils import atomic_write
 
-DB_FILE_PATH = 'data/game_data.json'
+DB_FILE_PATH = 'data/game_data.db'
+LEGACY_JSON_PATH = 'data/game_data.json'
+DEFAULT_GAME_ID = 'default'
+DEFAULT_SLOT = 'main'
+# Commit after every save by default; 0 keeps saves pending until flush() or close()
+DEFAULT_FLUSH_EVERY = 1
+
+# Top-level game state keys stored as their own rows, with the row kinds holding them; everything else
+# goes in the 'meta' row.
+SPLIT_KINDS: Dict[str, Tuple[str, ...]] = {
+    'gangs': ('gang', 'fighter'),
+    'battlefield': ('battlefield',),
+    'combat_rounds': ('combat_round',),
+}
+
+# Bumped when the secondary indexes change, so existing databases are reindexed on open
+INDEX_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS game_parts (
+    game_id TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    gang_index INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (game_id, slot, kind, gang_index, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS save_index (
+    game_id TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    turn INTEGER,
+    gangs TEXT NOT NULL,
+    scenario TEXT,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (game_id, slot)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS save_fields (
+    field TEXT NOT NULL,
+    value NOT NULL,
+    game_id TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    PRIMARY KEY (field, value, game_id, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS save_fields_by_slot ON save_fields (game_id, slot);
+CREATE TABLE IF NOT EXISTS replay_events (
+    game_id TEXT NOT NULL,
+    action_index INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (game_id, action_index)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS replay_checkpoints (
+    game_id TEXT NOT NULL,
+    action_index INTEGER NOT NULL,
+    codec TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (game_id, action_index)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS autosaves (
+    game_id TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    is_full INTEGER NOT NULL,
+    codec TEXT NOT NULL,
+    data BLOB NOT NULL,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (game_id, sequence)
+) WITHOUT ROWID;
+'''
+
+PartKey = Tuple[str, int, int]
+
+
+def _digest(body: str) -> str:
+    """Fingerprint an encoded part so unchanged rows can be skipped on save."""
+    return hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+
+
+def _is_list_of_dicts(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def split_game_state(game_state: Dict) -> Dict[PartKey, str]:
+    """
+    Split a game state into separately stored rows.
+
+    Each gang (without its members), each fighter, the battlefield and each
+    combat round becomes its own row, keyed by (kind, gang_index, position).
+    Everything else is kept in a single 'meta' row.
+
+    Args:
+        game_state (Dict): The game state to split.
+
+    Returns:
+        Dict[PartKey, str]: Encoded rows keyed by (kind, gang_index, position).
+    """
+    if isinstance(game_state.get('game_state'), dict):
+        # A GameLogic snapshot: split the wrapped game state and keep the seed and dice in its meta row
+        parts = split_game_state(game_state['game_state'])
+        meta = decode(parts[('meta', -1, 0)])
+        meta['__snapshot__'] = {key: value for key, value in game_state.items() if key != 'game_state'}
+        parts[('meta', -1, 0)] = encode(meta)
+        return parts
+
+    parts: Dict[PartKey, str] = {}
+    meta = dict(game_state)
+    split = []
+
+    if isinstance(game_state.get('battlefield'), dict):
+        parts[('battlefield', -1, 0)] = encode(meta.pop('battlefield'))
+        split.append('battlefield')
+
+    if _is_list_of_dicts(game_state.get('gangs')):
+        for gang_index, gang in enumerate(meta.pop('gangs')):
+            gang = dict(gang)
+            members = gang.pop('members', None)
+            if _is_list_of_dicts(members):
+                for position, fighter in enumerate(members):
+                    parts[('fighter', gang_index, position)] = encode(fighter)
+            elif members is not None:
+                gang['members'] = members
+            parts[('gang', -1, gang_index)] = encode(gang)
+        split.append('gangs')
+
+    if _is_list_of_dicts(game_state.get('combat_rounds')):
+        for position, combat_round in enumerate(meta.pop('combat_rounds')):
+            parts[('combat_round', -1, position)] = encode(combat_round)
+        split.append('combat_rounds')
+
+    meta['__split__'] = split
+    parts[('meta', -1, 0)] = encode(meta)
+    return parts
+
+
+def join_game_state(rows) -> Optional[Dict]:
+    """
+    Rebuild a game state from rows produced by split_game_state.
+
+    Args:
+        rows: Iterable of (kind, gang_index, position, body) tuples.
+
+    Returns:
+        Optional[Dict]: The game state, or None if there is no meta row.
+    """
+    meta = None
+    battlefield = None
+    gangs: Dict[int, Dict] = {}
+    members: Dict[int, Dict[int, Dict]] = {}
+    combat_rounds: Dict[int, Dict] = {}
+
+    for kind, gang_index, position, body in rows:
+        value = decode(body)
+        if kind == 'meta':
+            meta = value
+        elif kind == 'battlefield':
+            battlefield = value
+        elif kind == 'gang':
+            gangs[position] = value
+        elif kind == 'fighter':
+            members.setdefault(gang_index, {})[position] = value
+        elif kind == 'combat_round':
+            combat_rounds[position] = value
+
+    if meta is None:
+        return None
+
+    split = meta.pop('__split__', [])
+    snapshot = meta.pop('__snapshot__', None)
+    game_state = dict(meta)
+    if 'battlefield' in split:
+        game_state['battlefield'] = battlefield
+    if 'gangs' in split:
+        game_state['gangs'] = []
+        for gang_index in sorted(gangs):
+            gang = gangs[gang_index]
+            if 'members' not in gang:
+                gang_members = members.get(gang_index, {})
+                gang['members'] = [gang_members[position] for position in sorted(gang_members)]
+            game_state['gangs'].append(gang)
+    if 'combat_rounds' in split:
+        game_state['combat_rounds'] = [combat_rounds[position] for position in sorted(combat_rounds)]
+    if snapshot is not None:
+        return {'game_state': game_state, **snapshot}
+    return game_state
+
+
+def describe_game_state(game_state: Dict) -> Dict[str, Any]:
+    """
+    Extract the save index metadata from a game state or GameLogic snapshot.
+
+    Args:
+        game_state (Dict): The saved game state.
+
+    Returns:
+        Dict[str, Any]: The turn, gang names and scenario name of the game.
+    """
+    if isinstance(game_state.get('game_state'), dict):
+        game_state = game_state['game_state']
+    gangs = game_state.get('gangs')
+    scenario = game_state.get('scenario')
+    if isinstance(scenario, dict):
+        scenario = scenario.get('name')
+    turn = game_state.get('current_turn', game_state.get('turn'))
+    return {
+        'turn': turn if isinstance(turn, int) else None,
+        'gangs': [gang['name'] for gang in gangs if 'name' in gang] if _is_list_of_dicts(gangs) else [],
+        'scenario': scenario if isinstance(scenario, str) else None,
+    }
+
+
+
+def _last_gang_standing(game_state: Dict) -> Optional[str]:
+    """The winner of a saved game: its 'winner' key, or the only gang with fighters still in action."""
+    winner = game_state.get('winner')
+    if isinstance(winner, str):
+        return winner
+    gangs = game_state.get('gangs')
+    if not _is_list_of_dicts(gangs) or len(gangs) < 2:
+        return None
+    standing = [
+        gang.get('name') for gang in gangs
+        if _is_list_of_dicts(gang.get('members'))
+        and any(not member.get('is_out_of_action', False) for member in gang['members'])
+    ]
+    return standing[0] if len(standing) == 1 and isinstance(standing[0], str) else None
+
+
+def _index_gangs(game_state: Dict) -> List[Any]:
+    gangs = game_state.get('gangs')
+    return [gang['name'] for gang in gangs if isinstance(gang.get('name'), str)] if _is_list_of_dicts(gangs) else []
+
+
+def _index_scenario(game_state: Dict) -> List[Any]:
+    scenario = describe_game_state(game_state)['scenario']
+    return [scenario] if scenario is not None else []
+
+
+def _index_turn(game_state: Dict) -> List[Any]:
+    turn = describe_game_state(game_state)['turn']
+    return [turn] if turn is not None else []
+
+
+def _index_winner(game_state: Dict) -> List[Any]:
+    winner = _last_gang_standing(game_state)
+    return [winner] if winner is not None else []
+
+
+# Secondary indexes on saved games: field name -> function returning the values a game state is indexed under.
+# They are maintained on every save and searched by find_saves() and find_game_state(). The names differ
+# from game state keys, since e.g. 'scenario_name' matches the scenario's name, not the stored scenario.
+INDEXED_FIELDS: Dict[str, Callable[[Dict], List[Any]]] = {
+    'gang': _index_gangs,
+    'scenario_name': _index_scenario,
+    'current_turn': _index_turn,
+    'winner': _index_winner,
+}
+
+
+def _query_scenario(value: Any) -> Optional[Tuple[str, Any]]:
+    name = value.get('name') if isinstance(value, dict) else value
+    return ('scenario_name', name) if isinstance(name, str) else None
+
+
+def _query_gangs(value: Any) -> Optional[Tuple[str, Any]]:
+    if not value or not _is_list_of_dicts(value) or not isinstance(value[0].get('name'), str):
+        return None
+    return ('gang', value[0]['name'])
+
+
+# Game state keys query_game_state() narrows down through a secondary index: key -> function giving the
+# (field, value) index entry every save with that value has, or None if the value can't be looked up.
+QUERY_INDEXES: Dict[str, Callable[[Any], Optional[Tuple[str, Any]]]] = {
+    'current_turn': lambda value: ('current_turn', value) if isinstance(value, int) else None,
+    'winner': lambda value: ('winner', value) if isinstance(value, str) else None,
+    'scenario': _query_scenario,
+    'gangs': _query_gangs,
+}
+
+
+def index_game_state(game_state: Dict) -> List[Tuple[str, Any]]:
+    """
+    Compute the secondary index entries of a game state or GameLogic snapshot.
+
+    Args:
+        game_state (Dict): The saved game state.
+
+    Returns:
+        List[Tuple[str, Any]]: (field, value) pairs, one per indexed value.
+    """
+    if isinstance(game_state.get('game_state'), dict):
+        game_state = game_state['game_state']
+    return [(field, value) for field, extract in INDEXED_FIELDS.items() for value in dict.fromkeys(extract(game_state))]
+
+def _slot_info(row: Tuple) -> SaveSlotInfo:
+    """Build a SaveSlotInfo from a (game_id, slot, turn, gangs, scenario, saved_at) save_index row."""
+    return SaveSlotInfo(game_id=row[0], slot=row[1], turn=row[2], gangs=json.loads(row[3]),
+                        scenario=row[4], saved_at=row[5])
+
+
+class DatabaseConnection:
+    """
+    A long-lived SQLite connection shared by every Database handle on the same file.
+
+    The connection is opened on first use and reused until close(). All access
+    goes through a re-entrant lock, so background writer threads and the
+    main thread can share it. Writes are grouped into one transaction and
+    committed according to the flush policy: after every `flush_every` writes,
+    or only on an explicit flush() or close() when `flush_every` is 0.
+
+    Each commit appends the changed rows to the write-ahead log without an
+    fsync; the log is forced to disk when SQLite's automatic checkpoints fold
+    it back into the database file, and when the connection closes. A crash
+    at any moment leaves the database at a commit, never with a half-written
+    save, though a power loss can drop the commits since the last checkpoint.
+    """
+
+    def __init__(self, db_path: str, flush_every: int = DEFAULT_FLUSH_EVERY):
+        """
+        Initialize the DatabaseConnection.
+
+        Args:
+            db_path (str): The SQLite file to open.
+            flush_every (int): Number of writes to commit at once; 0 to commit only on flush().
+        """
+        if flush_every < 0:
+            raise ValueError("flush_every cannot be negative")
+        self.db_path = db_path
+        self.flush_every = flush_every
+        self.lock = threading.RLock()
+        self.conn: Optional[sqlite3.Connection] = None
+        self.pending_writes = 0
+        self._depth = 0
+
+    def open(self) -> bool:
+        """
+        Open the connection if it is not open yet.
+
+        Returns:
+            bool: True if the database file was created by this call.
+        """
+        with self.lock:
+            if self.conn is not None:
+                return False
+            is_new = not os.path.exists(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            # Under WAL, NORMAL syncs at checkpoints rather than at every commit
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.executescript(SCHEMA)
+            if self.conn.execute('PRAGMA user_version').fetchone()[0] < INDEX_VERSION:
+                self.reindex()
+                self.flush()
+            return is_new
+
+    def reindex(self) -> int:
+        """
+        Rebuild the secondary indexes of every save from the stored saves.
+
+        Returns:
+            int: The number of saves indexed.
+        """
+        with self.transaction() as db:
+            db.execute('DELETE FROM save_fields')
+            rows = db.execute('SELECT game_id, slot, kind, gang_index, position, body FROM game_parts '
+                              'ORDER BY game_id, slot').fetchall()
+            count = 0
+            for save_key, parts in itertools.groupby(rows, key=lambda row: row[:2]):
+                game_state = join_game_state(row[2:] for row in parts)
+                if game_state is not None:
+                    db.executemany('INSERT OR IGNORE INTO save_fields (field, value, game_id, slot) VALUES (?, ?, ?, ?)',
+                                   [(field, value) + save_key for field, value in index_game_state(game_state)])
+                    count += 1
+            db.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+        return count
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Run one write atomically inside the current batch.
+
+        The write is wrapped in a savepoint, so a failed write is undone
+        without discarding earlier writes that are still waiting for a flush.
+        Nested writes become part of the outermost one.
+        """
+        with self.lock:
+            if not self.conn.in_transaction:
+                self.conn.execute('BEGIN')
+            self.conn.execute('SAVEPOINT write')
+            self._depth += 1
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute('ROLLBACK TO write')
+                self.conn.execute('RELEASE write')
+                raise
+            else:
+                self.conn.execute('RELEASE write')
+            finally:
+                self._depth -= 1
+            if self._depth == 0:
+                self.pending_writes += 1
+                if self.flush_every and self.pending_writes >= self.flush_every:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Commit every pending write."""
+        with self.lock:
+            if self._depth:
+                raise ValueError("Cannot flush in the middle of a write")
+            if self.conn is not None and self.conn.in_transaction:
+                self.conn.execute('COMMIT')
+            self.pending_writes = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the connection; it reopens on next use."""
+        with self.lock:
+            if self.conn is None:
+                return
+            self.flush()
+            with contextlib.suppress(sqlite3.OperationalError):
+                self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self.conn.close()
+            self.conn = None
 
 
 class Database:
-    """A class to handle database operations for the Necromunda simulation."""
+    """
+    A class to handle database operations for the Necromunda simulation.
+
+    Games are stored in save slots keyed by game id and slot name (or number).
+    Each slot has a row in a small index table, so listing saves never reads
+    the saves themselves, and loading one slot only reads that slot's rows.
+    """
+
+    def __init__(self, db_path: str = DB_FILE_PATH, game_id: str = DEFAULT_GAME_ID,
+                 flush_every: int = DEFAULT_FLUSH_EVERY, connection: Optional[DatabaseConnection] = None):
+        """
+        Initialize the Database instance backed by a SQLite file.
+
+        Args:
+            db_path (str): The SQLite file backing this database.
+            game_id (str): The game whose slots are used when a method is not given a game id.
+            flush_every (int): Number of saves to commit at once; 0 to commit only on flush().
+            connection (Optional[DatabaseConnection]): An open connection to share with other handles.
+        """
+        self.db_path = db_path
+        self.game_id = game_id
+        self.connection = connection or DatabaseConnection(db_path, flush_every)
+
+    def for_game(self, game_id: str) -> "Database":
+        """
+        Get a handle for another game's slots that shares this database's connection.
+
+        Args:
+            game_id (str): The game the new handle defaults to.
 
-    def __init__(self):
-        """Initialize the Database instance with a TinyDB connection."""
-        self.db = None
+        Returns:
+            Database: The handle.
+        """
+        return Database(self.db_path, game_id=game_id, connection=self.connection)
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """The underlying SQLite connection, opened on first use."""
+        return self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open the shared connection if needed, importing legacy data into a new default database."""
+        with self.connection.lock:
+            if self.connection.open() and self.db_path == DB_FILE_PATH:
+                self._import_legacy_json(LEGACY_JSON_PATH)
+            return self.connection.conn
 
     @contextlib.contextmanager
     def get_connection(self):
         """
-        Get a database connection that will be automatically closed.
+        Hold the shared connection for a group of operations.
 
-        This uses a caching middleware to improve TinyDB performance.
+        The connection stays open afterwards and is reused by later calls.
+        The database runs in WAL mode so readers never wait on a save and a
+        save only appends the changed rows to the write-ahead log.
         """
-        try:
-            self.db = TinyDB(DB_FILE_PATH, storage=CachingMiddleware(JSONStorage))
+        with self.connection.lock:
+            self._open()
             yield self
-        finally:
-            if self.db:
-                self.db.close()
-                self.db = None
 
-    def save_game_state(self, game_state: Dict) -> None:
+    def flush(self) -> None:
+        """Commit saves that the flush policy is still holding back."""
+        self.connection.flush()
+
+    def close(self) -> None:
+        """Commit pending saves and close the connection."""
+        self.connection.close()
+
+    def _save_key(self, game_id: Optional[str], slot: Union[str, int]) -> Tuple[str, str]:
+        """Resolve the (game_id, slot) pair a method call refers to."""
+        slot = str(slot).strip()
+        if not slot:
+            raise ValueError("Save slot name cannot be empty")
+        return (game_id or self.game_id, slot)
+
+    def _import_legacy_json(self, legacy_path: str) -> None:
+        """Carry over the game saved by the old TinyDB JSON database, if there is one."""
+        if not os.path.exists(legacy_path):
+            return
+        try:
+            with open(legacy_path, 'r') as file:
+                documents = list(json.load(file).get('_default', {}).values())
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Could not import legacy game data from {legacy_path}: {e}")
+            return
+        if documents:
+            self._write_save((DEFAULT_GAME_ID, DEFAULT_SLOT), documents[0])
+
+    def _write_save(self, save_key: Tuple[str, str], game_state: Dict, saved_at: Optional[float] = None) -> int:
+        """
+        Write a save slot and its index entry in one transaction.
+
+        Only rows that differ from what is stored are written, and rows that
+        no longer exist are deleted.
+
+        Returns:
+            int: The number of rows inserted, replaced or deleted.
+        """
+        parts = split_game_state(game_state)
+        stored = {
+            (kind, gang_index, position): digest
+            for kind, gang_index, position, digest in self.db.execute(
+                'SELECT kind, gang_index, position, digest FROM game_parts WHERE game_id = ? AND slot = ?', save_key
+            )
+        }
+        changed = []
+        for (kind, gang_index, position), body in parts.items():
+            digest = _digest(body)
+            if stored.get((kind, gang_index, position)) != digest:
+                changed.append(save_key + (kind, gang_index, position, digest, body))
+        removed = [save_key + key for key in stored if key not in parts]
+        info = describe_game_state(game_state)
+
+        with self.connection.transaction() as db:
+            db.executemany(
+                'INSERT OR REPLACE INTO game_parts (game_id, slot, kind, gang_index, position, digest, body) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)', changed
+            )
+            db.executemany(
+                'DELETE FROM game_parts '
+                'WHERE game_id = ? AND slot = ? AND kind = ? AND gang_index = ? AND position = ?', removed
+            )
+            db.execute(
+                'INSERT OR REPLACE INTO save_index (game_id, slot, turn, gangs, scenario, saved_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                save_key + (info['turn'], json.dumps(info['gangs']), info['scenario'], saved_at or time.time())
+            )
+            db.execute('DELETE FROM save_fields WHERE game_id = ? AND slot = ?', save_key)
+            db.executemany('INSERT INTO save_fields (field, value, game_id, slot) VALUES (?, ?, ?, ?)',
+                           [(field, value) + save_key for field, value in index_game_state(game_state)])
+        return len(changed) + len(removed)
+
+    def _read_save(self, save_key: Tuple[str, str]) -> Optional[Dict]:
+        """Rebuild a saved game from the rows of its slot."""
+        rows = self.db.execute(
+            'SELECT kind, gang_index, position, body FROM game_parts WHERE game_id = ? AND slot = ?', save_key
+        )
+        return join_game_state(rows)
+
+    def _delete_save(self, save_key: Tuple[str, str]) -> bool:
+        """Remove a save slot and its index entry."""
+        with self.connection.transaction() as db:
+            db.execute('DELETE FROM game_parts WHERE game_id = ? AND slot = ?', save_key)
+            db.execute('DELETE FROM save_fields WHERE game_id = ? AND slot = ?', save_key)
+            cursor = db.execute('DELETE FROM save_index WHERE game_id = ? AND slot = ?', save_key)
+        return cursor.rowcount > 0
+
+    def save_game_state(self, game_state: Dict, slot: Union[str, int] = DEFAULT_SLOT,
+                        game_id: Optional[str] = None) -> None:
         """
-        Save the current game state to the database.
+        Save a game state to a save slot.
+
+        Only the gangs, fighters, battlefield and combat rounds that changed
+        since the slot was last written are stored again.
 
         Args:
             game_state (Dict): The game state to be saved.
+            slot (Union[str, int]): Name or number of the save slot.
+            game_id (Optional[str]): The game to save; defaults to this database's game.
         """
+        save_key = self._save_key(game_id, slot)
         with self.get_connection() as conn:
-            conn.db.truncate()  # Clear the current game state.
-            conn.db.insert(game_state)
+            conn._write_save(save_key, game_state)
 
-    def load_game_state(self) -> Optional[Dict]:
+    def load_game_state(self, slot: Union[str, int] = DEFAULT_SLOT, game_id: Optional[str] = None) -> Optional[Dict]:
         """
-        Load the saved game state from the database.
+        Load a game state from a save slot.
+
+        Args:
+            slot (Union[str, int]): Name or number of the save slot.
+            game_id (Optional[str]): The game to load; defaults to this database's game.
 
         Returns:
             Optional[Dict]: The loaded game state if it exists, None otherwise.
         """
+        save_key = self._save_key(game_id, slot)
         with self.get_connection() as conn:
             try:
-                data = conn.db.all()
-                return data[0] if data else None
+                return conn._read_save(save_key)
             except Exception as e:
                 print(f"Error loading game state: {e}")
                 return None
 
-    def backup_database(self, backup_file: str) -> None:
+    def delete_game_state(self, slot: Union[str, int] = DEFAULT_SLOT, game_id: Optional[str] = None) -> bool:
         """
-        Export the database to a backup JSON file.
+        Delete a save slot.
 
         Args:
-            backup_file (str): The file path to save the backup.
+            slot (Union[str, int]): Name or number of the save slot.
+            game_id (Optional[str]): The game the slot belongs to; defaults to this database's game.
+
+        Returns:
+            bool: True if the slot existed.
+        """
+        save_key = self._save_key(game_id, slot)
+        with self.get_connection() as conn:
+            return conn._delete_save(save_key)
+
+    def list_saves(self, game_id: Optional[str] = None) -> List[SaveSlotInfo]:
+        """
+        List save slots from the save index, most recently saved first.
+
+        Args:
+            game_id (Optional[str]): Only list this game's slots; lists every game's slots if None.
+
+        Returns:
+            List[SaveSlotInfo]: The index entries of the matching slots.
+        """
+        query = 'SELECT game_id, slot, turn, gangs, scenario, saved_at FROM save_index'
+        params: Tuple = ()
+        if game_id is not None:
+            query += ' WHERE game_id = ?'
+            params = (game_id,)
+        with self.get_connection() as conn:
+            rows = conn.db.execute(query + ' ORDER BY saved_at DESC', params).fetchall()
+        return [_slot_info(row) for row in rows]
+
+    def find_saves(self, field: str, value, game_id: Optional[str] = None) -> List[SaveSlotInfo]:
+        """
+        Look up save slots through a secondary index, most recently saved first.
+
+        Only the index tables are read; no save is loaded.
+
+        Args:
+            field (str): An indexed field: 'gang', 'scenario_name', 'current_turn' or 'winner'.
+            value: The value to match, e.g. a gang name for 'gang'.
+            game_id (Optional[str]): Only search this game's slots; searches every game if None.
+
+        Returns:
+            List[SaveSlotInfo]: The index entries of the matching slots.
+        """
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"No index on '{field}'. Indexed fields: {', '.join(INDEXED_FIELDS)}")
+        query = ('SELECT s.game_id, s.slot, s.turn, s.gangs, s.scenario, s.saved_at FROM save_fields f '
+                 'JOIN save_index s ON s.game_id = f.game_id AND s.slot = f.slot WHERE f.field = ? AND f.value = ?')
+        params: Tuple = (field, value)
+        if game_id is not None:
+            query += ' AND f.game_id = ?'
+            params += (game_id,)
+        with self.get_connection() as conn:
+            rows = conn.db.execute(query + ' ORDER BY s.saved_at DESC', params).fetchall()
+        return [_slot_info(row) for row in rows]
+
+    def list_games(self) -> List[str]:
+        """
+        List the ids of all games with at least one save slot.
+
+        Returns:
+            List[str]: Game ids in sorted order.
+        """
+        with self.get_connection() as conn:
+            return [row[0] for row in conn.db.execute('SELECT DISTINCT game_id FROM save_index ORDER BY game_id')]
+
+    def append_autosave(self, sequence: int, is_full: bool, codec: str, data: bytes,
+                        game_id: Optional[str] = None) -> None:
+        """
+        Append an entry to a game's autosave log.
+
+        Writing a full snapshot also drops the entries before it, since
+        they are no longer needed to rebuild the latest state.
+
+        Args:
+            sequence (int): Position of the entry in the log.
+            is_full (bool): Whether the entry is a full snapshot rather than a delta.
+            codec (str): Name of the compression codec used for `data`.
+            data (bytes): The compressed snapshot or delta.
+            game_id (Optional[str]): The game to autosave; defaults to this database's game.
+        """
+        game_id = game_id or self.game_id
+        with self.get_connection(), self.connection.transaction() as db:
+            if is_full:
+                db.execute('DELETE FROM autosaves WHERE game_id = ? AND sequence < ?', (game_id, sequence))
+            db.execute(
+                'INSERT OR REPLACE INTO autosaves (game_id, sequence, is_full, codec, data, saved_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)', (game_id, sequence, int(is_full), codec, data, time.time())
+            )
+
+    def load_autosave_chain(self, game_id: Optional[str] = None) -> List[Tuple[int, bool, str, bytes]]:
+        """
+        Load the latest full autosave snapshot and the deltas written after it.
+
+        Args:
+            game_id (Optional[str]): The game to load; defaults to this database's game.
+
+        Returns:
+            List[Tuple[int, bool, str, bytes]]: (sequence, is_full, codec, data) entries in order;
+                empty if the game has no autosave.
+        """
+        game_id = game_id or self.game_id
+        with self.get_connection() as conn:
+            rows = conn.db.execute(
+                'SELECT sequence, is_full, codec, data FROM autosaves WHERE game_id = ? AND sequence >= '
+                '(SELECT MAX(sequence) FROM autosaves WHERE game_id = ? AND is_full = 1) ORDER BY sequence',
+                (game_id, game_id)
+            ).fetchall()
+        return [(sequence, bool(is_full), codec, data) for sequence, is_full, codec, data in rows]
+
+    def last_autosave_sequence(self, game_id: Optional[str] = None) -> Optional[int]:
+        """Get the sequence number of a game's newest autosave entry, or None if it has none."""
+        game_id = game_id or self.game_id
+        with self.get_connection() as conn:
+            row = conn.db.execute('SELECT MAX(sequence) FROM autosaves WHERE game_id = ?', (game_id,)).fetchone()
+        return row[0]
+
+    def append_replay(self, start: int, events: List[Tuple[int, str]], checkpoints: List[Tuple[int, str, bytes]],
+                      game_id: Optional[str] = None) -> None:
+        """
+        Append to a game's replay log, replacing whatever was recorded from action `start` on.
+
+        A game started over, or loaded from an older save, records its next
+        actions from an earlier index; the actions and checkpoints it replaces
+        belong to a history that no longer leads to the current game.
+
+        Args:
+            start (int): Index of the first action not written before; later entries are replaced.
+            events (List[Tuple[int, str]]): (action_index, encoded event) pairs.
+            checkpoints (List[Tuple[int, str, bytes]]): (action_index, codec, compressed checkpoint) entries.
+            game_id (Optional[str]): The game to write; defaults to this database's game.
+        """
+        game_id = game_id or self.game_id
+        with self.get_connection(), self.connection.transaction() as db:
+            db.execute('DELETE FROM replay_events WHERE game_id = ? AND action_index >= ?', (game_id, start))
+            db.execute('DELETE FROM replay_checkpoints WHERE game_id = ? AND action_index > ?', (game_id, start))
+            db.executemany('INSERT OR REPLACE INTO replay_events (game_id, action_index, body) VALUES (?, ?, ?)',
+                           [(game_id, action_index, body) for action_index, body in events])
+            db.executemany(
+                'INSERT OR REPLACE INTO replay_checkpoints (game_id, action_index, codec, data) VALUES (?, ?, ?, ?)',
+                [(game_id, action_index, codec, data) for action_index, codec, data in checkpoints]
+            )
+
+    def load_replay_events(self, game_id: Optional[str] = None) -> List[str]:
+        """
+        Load a game's recorded actions.
+
+        Returns:
+            List[str]: The encoded events in order; empty if nothing was recorded.
         """
+        game_id = game_id or self.game_id
         with self.get_connection() as conn:
-            data = conn.db.all()
-            with open(backup_file, 'w') as file:
-                json.dump(data, file, indent=4)
+            return [row[0] for row in conn.db.execute(
+                'SELECT body FROM replay_events WHERE game_id = ? ORDER BY action_index', (game_id,))]
+
+    def load_replay_checkpoints(self, limit: Optional[int] = None, before: Optional[int] = None,
+                                game_id: Optional[str] = None) -> List[Tuple[int, str, bytes]]:
+        """
+        Load a game's newest replay checkpoints.
+
+        Args:
+            limit (Optional[int]): Load at most this many; all of them if None.
+            before (Optional[int]): Only load checkpoints taken at or before this action index.
+            game_id (Optional[str]): The game to load; defaults to this database's game.
+
+        Returns:
+            List[Tuple[int, str, bytes]]: (action_index, codec, data) entries, oldest first.
+        """
+        game_id = game_id or self.game_id
+        query = 'SELECT action_index, codec, data FROM replay_checkpoints WHERE game_id = ?'
+        params: Tuple = (game_id,)
+        if before is not None:
+            query += ' AND action_index <= ?'
+            params += (before,)
+        query += ' ORDER BY action_index DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params += (limit,)
+        with self.get_connection() as conn:
+            rows = conn.db.execute(query, params).fetchall()
+        return rows[::-1]
+
+    def _iter_saves(self) -> Iterator[Dict[str, Any]]:
+        """Yield every save slot as a backup record, rebuilding one slot at a time from a single ordered scan."""
+        cursor = self.db.execute(
+            'SELECT p.game_id, p.slot, s.saved_at, p.kind, p.gang_index, p.position, p.body '
+            'FROM game_parts p JOIN save_index s ON s.game_id = p.game_id AND s.slot = p.slot '
+            'ORDER BY p.game_id, p.slot'
+        )
+        for (game_id, slot, saved_at), rows in itertools.groupby(cursor, key=lambda row: row[:3]):
+            yield {
+                'game_id': game_id,
+                'slot': slot,
+                'saved_at': saved_at,
+                'data': join_game_state(row[3:] for row in rows)
+            }
+
+    def backup_database(self, backup_file: str, compression: Optional[str] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Stream every save slot to a line-delimited backup file.
+
+        Saves are read and written one at a time in checksummed chunks, so
+        memory use stays bounded however large the database is. The file is
+        written under a temporary name and renamed into place, so an
+        interrupted backup never replaces a good one with a partial file.
+        Autosave logs are not included.
+
+        Args:
+            backup_file (str): The file path to save the backup.
+            compression (Optional[str]): Compress each chunk with 'zlib' or 'lzma'; None writes plain JSON lines.
+            chunk_size (int): Number of saves per checksummed chunk.
+
+        Returns:
+            int: The number of save slots backed up.
+        """
+        with self.get_connection() as conn, atomic_write(backup_file) as file:
+            count = write_backup(file, conn._iter_saves(), compression=compression, chunk_size=chunk_size)
         print(f"Database backed up to {backup_file}")
+        return count
 
-    def restore_database(self, backup_file: str) -> None:
+    def restore_database(self, backup_file: str) -> int:
         """
-        Import the database from a backup JSON file.
+        Replace every save slot with the contents of a backup file.
+
+        The backup is streamed chunk by chunk and every chunk's checksum is
+        verified. The restore runs in a single transaction, so a corrupted or
+        truncated backup raises ValueError and leaves the database unchanged.
+        Backups in the older JSON array format are also accepted; those of the
+        single-save database are restored into the default slot of this
+        database's game.
 
         Args:
             backup_file (str): The file path to load the backup from.
+
+        Returns:
+            int: The number of save slots restored.
         """
-        with self.get_connection() as conn:
-            with open(backup_file, 'r') as file:
-                data = json.load(file)
-                conn.db.truncate()
-                conn.db.insert_multiple(data)
+        with open(backup_file, 'rb') as file:
+            legacy = file.read(64).lstrip().startswith(b'[')
+            file.seek(0)
+            entries = json.load(file) if legacy else read_backup(file)
+            count = 0
+            with self.get_connection() as conn, conn.connection.transaction() as db:
+                db.execute('DELETE FROM game_parts')
+                db.execute('DELETE FROM save_index')
+                db.execute('DELETE FROM save_fields')
+                for entry in entries:
+                    if 'slot' in entry and 'data' in entry:
+                        conn._write_save((entry['game_id'], entry['slot']), entry['data'], entry.get('saved_at'))
+                    else:
+                        conn._write_save((self.game_id, DEFAULT_SLOT), entry)
+                    count += 1
         print(f"Database restored from {backup_file}")
+        return count
+
+    def archive_game(self, archive_path: str, slot: Union[str, int] = DEFAULT_SLOT, game_id: Optional[str] = None,
+                     archive_id: Optional[str] = None, delete: bool = False) -> bool:
+        """
+        Append a finished game's save slot to a campaign archive.
+
+        Args:
+            archive_path (str): The archive file; it is created if missing.
+            slot (Union[str, int]): Name or number of the save slot.
+            game_id (Optional[str]): The game to archive; defaults to this database's game.
+            archive_id (Optional[str]): The id to archive the game under; defaults to the game id.
+            delete (bool): Remove the save slot once it is archived.
+
+        Returns:
+            bool: True if the slot existed and was archived.
+        """
+        save_key = self._save_key(game_id, slot)
+        with self.get_connection() as conn:
+            game_state = conn._read_save(save_key)
+            if game_state is None:
+                return False
+            with GameArchive(archive_path) as archive:
+                archive.append(archive_id or save_key[0], game_state)
+            if delete:
+                conn._delete_save(save_key)
+        return True
+
+    def export_archive(self, archive_path: str, slot: Union[str, int] = DEFAULT_SLOT,
+                       game_ids: Optional[List[str]] = None) -> int:
+        """
+        Append one save slot of many games to a campaign archive, each under its game id.
+
+        Games are read and appended one at a time, so memory use does not
+        grow with the number of games.
+
+        Args:
+            archive_path (str): The archive file; it is created if missing.
+            slot (Union[str, int]): The save slot to export from each game.
+            game_ids (Optional[List[str]]): The games to export; every game with this slot if None.
+
+        Returns:
+            int: The number of games archived.
+        """
+        slot = self._save_key(None, slot)[1]
+        count = 0
+        with self.get_connection() as conn, GameArchive(archive_path) as archive:
+            for game_id in game_ids if game_ids is not None else conn.list_games():
+                game_state = conn._read_save((game_id, slot))
+                if game_state is not None:
+                    archive.append(game_id, game_state)
+                    count += 1
+        print(f"Archived {count} games to {archive_path}")
+        return count
+
+    def load_archived_game(self, archive_path: str, archive_id: str) -> Optional[Dict]:
+        """
+        Read a single game from a campaign archive without loading the rest of it.
+
+        Args:
+            archive_path (str): The archive file.
+            archive_id (str): The id the game was archived under.
+
+        Returns:
+            Optional[Dict]: The archived game state if it exists, None otherwise.
+        """
+        if not os.path.exists(archive_path):
+            return None
+        with GameArchive(archive_path) as archive:
+            return archive.get(archive_id)
+
+    def restore_archived_game(self, archive_path: str, archive_id: str, slot: Union[str, int] = DEFAULT_SLOT,
+                              game_id: Optional[str] = None) -> bool:
+        """
+        Copy a game from a campaign archive back into a save slot.
+
+        Args:
+            archive_path (str): The archive file.
+            archive_id (str): The id the game was archived under.
+            slot (Union[str, int]): Name or number of the save slot to write.
+            game_id (Optional[str]): The game to restore into; defaults to the archive id.
+
+        Returns:
+            bool: True if the archive held the game.
+        """
+        game_state = self.load_archived_game(archive_path, archive_id)
+        if game_state is None:
+            return False
+        self.save_game_state(game_state, slot=slot, game_id=game_id or archive_id)
+        return True
 
     def query_game_state(self, key: str, value) -> Optional[Dict]:
         """
-        Query the game state for a specific key-value pair.
+        Query the saved games for a specific key-value pair.
+
+        The key is compared against the game state itself, also for saved
+        GameLogic snapshots. Keys with a secondary index behind them, such as
+        'current_turn', 'winner', 'scenario' and 'gangs', only check the
+        slots the index lists; other keys check every slot. Each slot is
+        checked on its 'meta' row and the rows holding the key, and only a
+        matching save is loaded in full. To search the secondary indexes
+        directly, use find_game_state().
 
         Args:
             key (str): The key to query.
             value: The value to match.
 
         Returns:
-            Optional[Dict]: The matched game state entry if it exists, None otherwise.
+            Optional[Dict]: The most recently saved matching game state if one exists, None otherwise.
         """
+        entry = QUERY_INDEXES[key](value) if key in QUERY_INDEXES else None
+        meta_rows = ("SELECT p.game_id, p.slot, p.body FROM game_parts p "
+                     "JOIN save_index s ON s.game_id = p.game_id AND s.slot = p.slot ")
         with self.get_connection() as conn:
-            GameQuery = Query()
-            result = conn.db.search(GameQuery[key] == value)
-            return result[0] if result else None
+            if entry is not None:
+                rows = conn.db.execute(
+                    meta_rows + "JOIN save_fields f ON f.game_id = p.game_id AND f.slot = p.slot "
+                    "WHERE p.kind = 'meta' AND f.field = ? AND f.value = ? ORDER BY s.saved_at DESC", entry
+                ).fetchall()
+            else:
+                rows = conn.db.execute(meta_rows + "WHERE p.kind = 'meta' ORDER BY s.saved_at DESC").fetchall()
+            for game_id, slot, body in rows:
+                # The meta row holds the game state's own keys, also for snapshots
+                meta = decode(body)
+                if key in meta.get('__split__', ()):
+                    kinds = SPLIT_KINDS[key]
+                    parts = conn.db.execute(
+                        'SELECT kind, gang_index, position, body FROM game_parts '
+                        f'WHERE game_id = ? AND slot = ? AND kind IN ({", ".join("?" * len(kinds))})',
+                        (game_id, slot) + kinds
+                    ).fetchall()
+                    game_state = join_game_state([('meta', -1, 0, body)] + parts)
+                    if '__snapshot__' in meta:
+                        game_state = game_state['game_state']
+                    stored = game_state.get(key)
+                else:
+                    stored = meta.get(key)
+                if stored == value:
+                    return conn._read_save((game_id, slot))
+        return None
 
+    def find_game_state(self, field: str, value, game_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        Load the most recently saved game matching a secondary index; see find_saves().
+
+        Only the matching save is loaded.
+
+        Args:
+            field (str): An indexed field: 'gang', 'scenario_name', 'current_turn' or 'winner'.
+            value: The value to match, e.g. a scenario name for 'scenario_name'.
+            game_id (Optional[str]): Only search this game's slots; searches every game if None.
+
+        Returns:
+            Optional[Dict]: The matching game state if one exists, None otherwise.
+
+        Raises:
+            ValueError: If the field isn't indexed.
+        """
+        for info in self.find_saves(field, value, game_id):
+            with self.get_connection() as conn:
+                game_state = conn._read_save((info.game_id, info.slot))
+            if game_state is not None:
+                return game_state
+        return None
 
 def initialize_database() -> Database:
     """
@@ -130,7 +1075,7 @@ if __name__ == "__main__":
     print("Loaded Game State:", loaded_state)
 
     # Backup database
-    db.backup_database("backup.json")
+    db.backup_database("backup.jsonl")
 
     # Restore database
-    db.restore_database("backup.json")
+    db.restore_database("backup.jsonl")
@@ -0,0 +1,119 @@
+import random
+import re
+from typing import Any, List, Optional
+
+# A plain dice expression such as '1d6' or '2d6'; everything else goes through d20's parser
+_SIMPLE_ROLL = re.compile(r'(\d*)d(\d+)')
+
+
+class SimpleRoll:
+    """
+    The result of a plain 'NdM' roll, with the parts of d20's RollResult the engine reads.
+
+    Importing d20 builds its expression grammar, which takes longer than
+    the rest of startup combined, so plain rolls are made without it.
+    """
+
+    def __init__(self, expr: str, size: int, values: List[int]):
+        self.expr = expr
+        self.values = values
+        self.total = sum(values)
+        self._size = size
+
+    @property
+    def result(self) -> str:
+        """The roll in d20's format, e.g. '2d6 (3, **6**) = `9`'."""
+        dice = ", ".join(f"**{v}**" if v in (1, self._size) else str(v) for v in self.values)
+        return f"{len(self.values)}d{self._size} ({dice}) = `{self.total}`"
+
+    def __str__(self) -> str:
+        return self.result
+
+
+class _CountingRandom(random.Random):
+    """
+    A Random that counts the 32-bit words it has drawn since it was seeded.
+
+    Every draw goes through random() or getrandbits(), so reseeding and
+    drawing the same number of words reproduces the generator's state.
+    """
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        super().seed(a, version)
+        self.draws = 0
+
+    def random(self) -> float:
+        self.draws += 2
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def advance(self, draws: int) -> None:
+        """Draw and discard words until `draws` words have been drawn since seeding."""
+        getrandbits = super().getrandbits
+        for _ in range(draws - self.draws):
+            getrandbits(32)
+        self.draws = draws
+
+
+class SeededDice:
+    """
+    Stand-in for the ``d20`` module that draws every roll from a private RNG.
+
+    d20 rolls through the module-level ``random``; swapping this instance's
+    generator in for the duration of each roll keeps a game reproducible from
+    its seed and independent of any other game sharing the process.
+
+    Plain 'NdM' rolls draw each die exactly as d20 does, without importing
+    d20, so a seed gives the same rolls either way.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed
+        self.rng = _CountingRandom(seed)
+        # Whether rng.draws counts from the seed; not after restoring a full generator state
+        self._counted = seed is not None
+
+    def roll(self, expr: str) -> Any:
+        """Roll a d20 dice expression (e.g. '1d6') using this instance's RNG."""
+        simple = _SIMPLE_ROLL.fullmatch(expr)
+        if simple is not None and int(simple.group(2)) > 0:
+            count, size = int(simple.group(1) or 1), int(simple.group(2))
+            return SimpleRoll(expr, size, [self.rng.randrange(size) + 1 for _ in range(count)])
+
+        import d20
+        from d20 import expression as d20_expression
+        previous = d20_expression.random
+        d20_expression.random = self.rng
+        try:
+            return d20.roll(expr)
+        finally:
+            d20_expression.random = previous
+
+    def getstate(self) -> Any:
+        """
+        Return the RNG state so the roll sequence can be resumed later.
+
+        With a seed this is just the number of words drawn from it, which
+        keeps snapshots small and lets deltas between them stay small too;
+        without one it is the generator's full state.
+        """
+        if self._counted:
+            return self.rng.draws
+        return self.rng.getstate()
+
+    def setstate(self, state: Any) -> None:
+        """Restore an RNG state captured by getstate (tuples may have become lists in JSON)."""
+        if isinstance(state, int):
+            if self.seed is None:
+                raise ValueError("A draw count can only be restored on seeded dice")
+            if not self._counted or state < self.rng.draws:
+                self.rng.seed(self.seed)
+                self._counted = True
+            self.rng.advance(state)
+            return
+        version, internal, gauss_next = state
+        self.rng.setstate((version, tuple(internal), gauss_next))
+        self._counted = False
@@ -1,19 +1,239 @@
 import logging
-import d20  # Ensure the d20 package is installed
-from typing import Optional, List, Dict, Any, cast
-from models import GameState, Gang, Ganger, CombatRound, CombatPhase, PhaseName, Scenario, Battlefield, Tile, Weapon, WeaponProfile, TileType # Added imports for Weapon and WeaponProfile, TileType
+import random
+import functools
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Any, Tuple, cast
+from models import GameState, Gang, Ganger, CombatRound, CombatPhase, PhaseName, Scenario, Battlefield, Tile, Weapon, WeaponProfile, TileType, Consumable, GameEvent, ReplayCheckpoint, ReplayLog # Added imports for Weapon and WeaponProfile, TileType
 from models.gang_models import GangType, GangerRole, InjuryResult, InjurySeverity, Injury
+from models.validation_context import TRUSTED_CONTEXT
 from database import Database
+from dice import SeededDice
+from serialization import CODECS, decode, dump_game_state, encode, load_game_state
+from autosave import Autosaver
+
+if TYPE_CHECKING:
+    from roster_import import RosterImport
+
+DEFAULT_CHECKPOINT_INTERVAL = 20
+# Replay checkpoints kept in memory; older ones are only in the database
+DEFAULT_MAX_CHECKPOINTS = 8
+REPLAY_CODEC = 'zlib'
+
+# Known-good data for objects the engine creates itself. Each object is built from
+# its template with a single validation call, skipping the Python model validators.
+COMBAT_PHASES = (
+    {"name": PhaseName.PRIORITY, "description": "Determine which gang has priority for the round."},
+    {"name": PhaseName.ACTION, "description": "Fighters can perform actions like moving, shooting, and combat."},
+    {"name": PhaseName.END, "description": "Resolve bottle tests and lingering effects."},
+)
+INJURY_RECORDS = {
+    InjuryResult.FLESH_WOUND: {
+        "type": "Flesh Wound",
+        "severity": InjurySeverity.MINOR.value,
+        "effect": "The fighter is prone and suffers -1 to all future hit rolls.",
+    },
+    InjuryResult.SERIOUS_INJURY: {
+        "type": "Serious Injury",
+        "severity": InjurySeverity.MAJOR.value,
+        "effect": "The fighter is seriously injured and cannot stand up. Requires medical attention.",
+    },
+    InjuryResult.OUT_OF_ACTION: {
+        "type": "Out of Action",
+        "severity": InjurySeverity.CRITICAL.value,
+        "effect": "The fighter is out of action for the remainder of the battle.",
+    },
+}
+
+
+def recorded(method):
+    """
+    Record calls to a state-changing GameLogic method in the game's replay log.
+
+    Calls made while another recorded action is running (or while replaying)
+    are not recorded again, so each event is exactly one top-level action.
+    The game is autosaved after each top-level action that succeeds, if an
+    Autosaver is attached.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._run_recorded(method.__name__, args, kwargs, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+
+def encode_checkpoint(checkpoint: ReplayCheckpoint) -> Tuple[int, str, bytes]:
+    """Compress a replay checkpoint into an (action_index, codec, data) entry for Database.append_replay()."""
+    compress, _ = CODECS[REPLAY_CODEC]
+    data = {"game_state": dump_game_state(checkpoint.game_state), "dice_state": checkpoint.dice_state,
+            "seed": checkpoint.seed}
+    return checkpoint.action_index, REPLAY_CODEC, compress(encode(data).encode())
+
+
+def decode_checkpoint(action_index: int, codec: str, data: bytes) -> ReplayCheckpoint:
+    """Rebuild a replay checkpoint from an entry made by encode_checkpoint()."""
+    _, decompress = CODECS[codec]
+    stored = decode(decompress(data))
+    # Checkpoints are written by this program from valid games
+    return ReplayCheckpoint(action_index=action_index, game_state=load_game_state(stored["game_state"], trusted=True),
+                            dice_state=stored["dice_state"], seed=stored["seed"])
+
 
 class GameLogic:
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, seed: Optional[int] = None, game_state: Optional[GameState] = None,
+                 checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL, max_checkpoints: int = DEFAULT_MAX_CHECKPOINTS):
+        if max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be at least 1")
         self.db = db
-        self.d20 = d20
-        self.game_state = self._initialize_game_state()
-        self.active_fighter_index = 0
-        self.create_new_combat_round()
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.d20 = SeededDice(self.seed)
+        self.replay_log = ReplayLog(seed=self.seed, checkpoint_interval=checkpoint_interval)
+        self.max_checkpoints = max_checkpoints
+        # Events before this index are in the database, as are all checkpoints but these
+        self._replay_saved = 0
+        self._unsaved_checkpoints: List[ReplayCheckpoint] = []
+        self._recording = True
+        self.autosaver: Optional[Autosaver] = None
+        if game_state is not None:
+            self.game_state = game_state
+        else:
+            self.game_state = self._initialize_game_state()
+            self.create_new_combat_round()
         logging.info("GameLogic initialized")
 
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture what is needed to resume this game later: its state, seed and dice.
+
+        The replay log is not included; it is kept in the database by
+        save_replay(), and a resumed game continues it from there.
+        """
+        return {
+            "game_state": dump_game_state(self.game_state),
+            "seed": self.seed,
+            "dice_state": self.d20.getstate()
+        }
+
+    @classmethod
+    def from_snapshot(cls, db: Database, snapshot: Dict[str, Any], trusted: bool = False) -> "GameLogic":
+        """
+        Resume a game captured by snapshot().
+
+        Args:
+            db (Database): The database for the resumed game.
+            snapshot (Dict[str, Any]): The snapshot.
+            trusted (bool): Skip validating the game state; only for snapshots we wrote ourselves.
+        """
+        game_logic = cls(db, seed=snapshot.get("seed"),
+                         game_state=load_game_state(snapshot["game_state"], trusted=trusted))
+        if snapshot.get("dice_state") is not None:
+            game_logic.d20.setstate(snapshot["dice_state"])
+        game_logic._resume_replay_log()
+        return game_logic
+
+    def restore(self, snapshot: Dict[str, Any], trusted: bool = False) -> None:
+        """
+        Replace this game in place with one captured by snapshot().
+
+        A plain game state is accepted too; the current dice are kept for it.
+        The replay log continues from the game's history in the database,
+        with a checkpoint of the restored state.
+
+        Args:
+            snapshot (Dict[str, Any]): The snapshot or plain game state.
+            trusted (bool): Skip validating the game state; only for snapshots we wrote ourselves.
+        """
+        if "game_state" not in snapshot:
+            snapshot = {"game_state": snapshot}
+        game_state = load_game_state(snapshot["game_state"], trusted=trusted)
+        # The actions leading here stay part of the game's history
+        self.save_replay()
+        self.game_state = game_state
+        if snapshot.get("seed") is not None:
+            self.seed = snapshot["seed"]
+            self.d20 = SeededDice(self.seed)
+        if snapshot.get("dice_state") is not None:
+            self.d20.setstate(snapshot["dice_state"])
+        self._resume_replay_log()
+
+    @property
+    def active_fighter_index(self) -> int:
+        """Index of the active fighter within the active gang (stored on the game state)."""
+        return self.game_state.active_fighter_index
+
+    @active_fighter_index.setter
+    def active_fighter_index(self, value: int) -> None:
+        self.game_state.active_fighter_index = value
+
+    def _run_recorded(self, action: str, args: tuple, kwargs: Dict[str, Any], run: Callable[[], Any]) -> Any:
+        """
+        Run a top-level action recorded as `action(*args, **kwargs)`; see recorded().
+
+        `run` may take a shortcut to the same result, e.g. reuse objects
+        the recorded arguments were made from.
+        """
+        if not self._recording:
+            return run()
+        self._record_event(action, args, kwargs)
+        self._recording = False
+        try:
+            result = run()
+        finally:
+            self._recording = True
+        if self.autosaver is not None:
+            self.autosaver.save(self.snapshot())
+        return result
+
+    def _record_event(self, action: str, args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Append an action to the replay log, checkpointing and saving the log first when a checkpoint is due."""
+        log = self.replay_log
+        if log.checkpoint_due() and not (log.checkpoints and log.checkpoints[-1].action_index == len(log.events)):
+            self._add_checkpoint()
+            self.save_replay()
+        current_round = self.get_current_combat_round()
+        log.events.append(GameEvent(
+            index=len(log.events),
+            action=action,
+            args=list(args),
+            kwargs=kwargs,
+            round_number=current_round.round_number if current_round else 1
+        ))
+
+    def _add_checkpoint(self) -> None:
+        """Checkpoint the game before the next action."""
+        checkpoint = ReplayCheckpoint(
+            action_index=len(self.replay_log.events),
+            game_state=self.game_state.model_copy(deep=True),
+            dice_state=self.d20.getstate(),
+            seed=self.seed
+        )
+        self.replay_log.checkpoints.append(checkpoint)
+        self._unsaved_checkpoints.append(checkpoint)
+
+    def save_replay(self) -> None:
+        """
+        Write the actions and checkpoints recorded since the last write to the game's database.
+
+        This happens whenever a checkpoint is taken and whenever the game is
+        saved or paged out. Afterwards only the newest `max_checkpoints`
+        checkpoints stay in memory; ReplayEngine reads older ones from the
+        database.
+        """
+        log = self.replay_log
+        events = [(event.index, encode(event.model_dump(mode='json'))) for event in log.events[self._replay_saved:]]
+        checkpoints = [encode_checkpoint(checkpoint) for checkpoint in self._unsaved_checkpoints]
+        if events or checkpoints:
+            self.db.append_replay(self._replay_saved, events, checkpoints)
+        self._replay_saved = len(log.events)
+        self._unsaved_checkpoints = []
+        del log.checkpoints[:-self.max_checkpoints]
+
+    def _resume_replay_log(self) -> None:
+        """Continue the game's replay log from the database, with a checkpoint of the current game."""
+        events = [GameEvent.model_validate(decode(body)) for body in self.db.load_replay_events()]
+        self.replay_log = ReplayLog(seed=self.seed, checkpoint_interval=self.replay_log.checkpoint_interval, events=events)
+        self._replay_saved = len(events)
+        self._unsaved_checkpoints = []
+        # The restored game need not be where the recorded actions led, e.g. after loading an older save
+        self._add_checkpoint()
+
     def _initialize_game_state(self) -> GameState:
         battlefield = Battlefield.generate_default(24, 24)  # Using the generate_default method from Battlefield.
 
@@ -82,13 +302,9 @@ class GameLogic:
         )
 
     def create_new_combat_round(self) -> None:
-        new_round = CombatRound(
-            round_number=len(self.game_state.combat_rounds) + 1,
-            phases=[
-                CombatPhase(name=PhaseName.PRIORITY, description="Determine which gang has priority for the round."),
-                CombatPhase(name=PhaseName.ACTION, description="Fighters can perform actions like moving, shooting, and combat."),
-                CombatPhase(name=PhaseName.END, description="Resolve bottle tests and lingering effects.")
-            ]
+        new_round = CombatRound.model_validate(
+            {"round_number": len(self.game_state.combat_rounds) + 1, "phases": COMBAT_PHASES},
+            context=TRUSTED_CONTEXT
         )
         self.game_state.combat_rounds.append(new_round)
         logging.info(f"Created new combat round: {new_round.round_number}")
@@ -96,6 +312,7 @@ class GameLogic:
     def get_battlefield_state(self) -> str:
         return self.game_state.battlefield.render()
 
+    @recorded
     def move_fighter(self, fighter_name: str, x: int, y: int) -> bool:
         """Move a fighter to new coordinates with bounds checking."""
         fighter = self._get_fighter_by_name(fighter_name)
@@ -120,13 +337,14 @@ class GameLogic:
                 logging.error(f"Cannot move to obstructed tile at ({x}, {y}).")
                 return False
 
+        movement = fighter.effective_stat("movement")
         # Calculate movement cost including terrain
         if target_tile:
             terrain_mods = self.check_terrain_modifiers(target_tile)
             if fighter.x is not None and fighter.y is not None:
                 movement_cost = abs(fighter.x - x) + abs(fighter.y - y) + terrain_mods['movement']
-                if movement_cost > fighter.movement:
-                    logging.error(f"{fighter_name} cannot move {movement_cost} spaces (including terrain costs); maximum movement is {fighter.movement}.")
+                if movement_cost > movement:
+                    logging.error(f"{fighter_name} cannot move {movement_cost} spaces (including terrain costs); maximum movement is {movement}.")
                     return False
             else:
                 logging.error(f"{fighter_name} has no current position.")
@@ -135,8 +353,8 @@ class GameLogic:
             # Basic distance check if no tile info
             if fighter.x is not None and fighter.y is not None:
                 distance = abs(fighter.x - x) + abs(fighter.y - y)
-                if distance > fighter.movement:
-                    logging.error(f"{fighter_name} cannot move {distance} spaces; maximum movement is {fighter.movement}.")
+                if distance > movement:
+                    logging.error(f"{fighter_name} cannot move {distance} spaces; maximum movement is {movement}.")
                     return False
             else:
                 logging.error(f"{fighter_name} has no current position.")
@@ -149,6 +367,7 @@ class GameLogic:
         logging.info(f"{fighter.name} moved to ({x}, {y}).")
         return True
 
+    @recorded
     def end_fighter_activation(self) -> str:
         active_gang = self.get_active_gang()
         self.active_fighter_index += 1
@@ -163,6 +382,7 @@ class GameLogic:
         fighter_name = new_active_fighter.name if new_active_fighter else "None"
         return f"Activation ended. Active gang: {new_active_gang.name}, Active fighter: {fighter_name}"
 
+    @recorded
     def advance_combat_phase(self) -> None:
         current_round = self.get_current_combat_round()
         if current_round and current_round.phases:
@@ -180,12 +400,129 @@ class GameLogic:
     def calculate_victory_points(self) -> List[Dict[str, Any]]:
         return [{"gang": gang.name, "victory_points": gang.victory_points} for gang in self.game_state.gangs]
 
-    def _get_fighter_by_name(self, name: str) -> Optional[Ganger]:
+    @recorded
+    def add_gang_member(self, gang_name: str, member_data: Dict[str, Any]) -> Ganger:
+        """Create a gang member from builder input data and add them to the named gang."""
         for gang in self.game_state.gangs:
-            for fighter in gang.members:
-                if fighter.name.lower() == name.lower():
-                    return fighter
-        return None
+            if gang.name.lower() == gang_name.lower():
+                from gang_builder import create_gang_member
+                new_member = create_gang_member(member_data)
+                self.game_state.add_member(gang, new_member)
+                return new_member
+        raise ValueError(f"Gang '{gang_name}' not found")
+
+    def import_roster(self, path: str, workers: int = 0) -> "RosterImport":
+        """
+        Import fighters from a roster file (JSON lines or CSV) into their gangs.
+
+        Fighters join the existing gang of the same name. Gangs that don't
+        exist yet are created from their rows and must pass the usual
+        composition rules. Rows that fail, including fighters a gang
+        can't take and names already in the game, are reported and skipped.
+        The replay log records the fighters read, not the file, so replays
+        don't depend on the file staying as it was; the fighters already
+        validated are added as they are rather than rebuilt from the record.
+
+        Args:
+            path (str): The roster file; see roster_import.read_roster().
+            workers (int): Worker processes to validate rows in; 0 validates in this process.
+
+        Returns:
+            RosterImport: The fighters added and the rows that failed.
+        """
+        from roster_import import import_roster_file
+        result = import_roster_file(path, workers=workers)
+        rows = [[line_number, gang_name, member.model_dump(mode='json')] for line_number, gang_name, member in result.members]
+        # Recorded as add_roster_members(rows), which replays rebuild the fighters from
+        imported = self._run_recorded("add_roster_members", (rows,), {},
+                                      lambda: self._add_roster_members(result.members))
+        result.members = imported.members
+        result.errors = sorted(result.errors + imported.errors, key=lambda row: row[0])
+        logging.info(f"Imported {len(result.members)} fighters from {path}; {len(result.errors)} rows failed")
+        return result
+
+    @recorded
+    def add_roster_members(self, rows: List[List[Any]]) -> "RosterImport":
+        """
+        Add fighters read from a roster to their gangs; see import_roster().
+
+        Args:
+            rows (List[List[Any]]): [line number, gang name, fighter data] for each fighter, the data
+                already validated, e.g. by roster_import.import_roster_file().
+
+        Returns:
+            RosterImport: The fighters added and the rows that couldn't be.
+        """
+        from roster_import import share_items
+        members = []
+        for line_number, gang_name, data in rows:
+            member = Ganger.model_validate(data, context=TRUSTED_CONTEXT)
+            share_items(member)
+            members.append((line_number, gang_name, member))
+        return self._add_roster_members(members)
+
+    def _add_roster_members(self, members: List[Tuple[int, str, Ganger]]) -> "RosterImport":
+        """Add validated fighters, as (line number, gang name, fighter), to their gangs; see add_roster_members()."""
+        from roster_import import RosterImport, describe_error
+        result = RosterImport()
+        gangs = {gang.name.lower(): gang for gang in self.game_state.gangs}
+        new_gangs: Dict[str, List] = {}
+        new_names = set()
+        added = []
+        for line_number, gang_name, member in members:
+            if member.name.casefold() in new_names:
+                result.errors.append((line_number, f"A fighter named {member.name} is already in the game."))
+                continue
+            gang = gangs.get(gang_name.lower())
+            if gang is None:
+                if self.game_state.find_fighter(member.name) is not None:
+                    result.errors.append((line_number, f"A fighter named {member.name} is already in the game."))
+                    continue
+                new_names.add(member.name.casefold())
+                new_gangs.setdefault(gang_name.lower(), []).append((line_number, gang_name, member))
+                continue
+            try:
+                self.game_state.add_member(gang, member)
+            except ValueError as e:
+                result.errors.append((line_number, str(e)))
+                continue
+            added.append((line_number, gang.name, member))
+
+        for new_rows in new_gangs.values():
+            gang_members = [member for _, _, member in new_rows]
+            try:
+                gang = Gang(name=new_rows[0][1], type=gang_members[0].gang_affiliation, members=gang_members)
+            except ValueError as e:
+                result.errors.extend((line_number, f"Gang {new_rows[0][1]}: {describe_error(e)}")
+                                     for line_number, _, _ in new_rows)
+                continue
+            self.game_state.add_gang(gang)
+            added.extend(new_rows)
+
+        result.members = sorted(added, key=lambda row: row[0])
+        result.errors.sort(key=lambda row: row[0])
+        return result
+
+    @recorded
+    def use_consumable(self, fighter_name: str, consumable_name: str) -> Consumable:
+        """Spend one use of a fighter's consumable and return it."""
+        fighter = self._get_fighter_by_name(fighter_name)
+        if not fighter:
+            raise ValueError(f"Fighter '{fighter_name}' not found")
+
+        if not fighter.consumables:
+            raise ValueError(f"Fighter {fighter_name} has no consumables")
+
+        for consumable in fighter.consumables:
+            if consumable.name.lower() == consumable_name.lower():
+                if consumable.uses > 0:
+                    consumable.uses -= 1
+                    return consumable
+                raise ValueError(f"No uses remaining for {consumable.name}")
+        raise ValueError(f"Consumable '{consumable_name}' not found")
+
+    def _get_fighter_by_name(self, name: str) -> Optional[Ganger]:
+        return self.game_state.get_fighter(name)
 
     def calculate_melee_hit_success(self, attacker: Ganger, defender: Ganger, weapon: Optional[Weapon] = None) -> tuple[bool, int, int]:
         """
@@ -203,11 +540,11 @@ class GameLogic:
             logging.error("Invalid attacker or defender")
             return (False, 0, 0)
 
-        base_target = attacker.weapon_skill
+        base_target = attacker.effective_stat("weapon_skill")
         total_modifier = 0
 
         logging.info(f"Calculating melee hit success for {attacker.name} vs {defender.name}")
-        logging.debug(f"Base target number: {base_target} (WS {attacker.weapon_skill})")
+        logging.debug(f"Base target number: {base_target} (WS {base_target})")
 
         # Apply status effect modifiers
         if attacker.is_prone:
@@ -268,7 +605,7 @@ class GameLogic:
             logging.error("Invalid attacker or defender")
             return (False, 0, 0, False)
 
-        base_target = attacker.ballistic_skill  # BS value (typically 2+ to 6+)
+        base_target = attacker.effective_stat("ballistic_skill")  # BS value (typically 2+ to 6+)
         total_modifier = 0
         is_critical = False
 
@@ -277,13 +614,9 @@ class GameLogic:
         
         # Get weapon profile accuracy modifier if applicable
         if weapon and weapon.profiles and range_category:
-            for profile in weapon.profiles:
-                if range_category == "Short" and hasattr(profile, "short_range_modifier"):
-                    total_modifier += profile.short_range_modifier
-                    logging.debug(f"Weapon short range modifier: {profile.short_range_modifier}")
-                elif range_category == "Long" and hasattr(profile, "long_range_modifier"):
-                    total_modifier += profile.long_range_modifier
-                    logging.debug(f"Weapon long range modifier: {profile.long_range_modifier}")
+            range_modifier = weapon.range_modifiers.get(range_category, 0)
+            total_modifier += range_modifier
+            logging.debug(f"Weapon {range_category.lower()} range modifier: {range_modifier}")
 
         # Check cover status - using the terrain info
         # Assuming that cover can be determined from the battlefield state
@@ -418,9 +751,11 @@ class GameLogic:
         if fighter.x is None or fighter.y is None:
             return False
             
+        entry = self.game_state.find_fighter(fighter.name)
+        own_gang = entry[0] if entry is not None else None
         for gang in self.game_state.gangs:
             # Skip the fighter's own gang
-            if any(member.name == fighter.name for member in gang.members):
+            if gang is own_gang:
                 continue
                 
             # Check enemy gang members
@@ -502,21 +837,22 @@ class GameLogic:
             tuple[bool, str, int]: Success status, message, and the natural roll
         """
         # Get effective strength (weapon or natural)
-        effective_strength = attacker.strength
+        effective_strength = attacker.effective_stat("strength")
         if weapon and weapon.profiles:
-            effective_strength = max(profile.strength for profile in weapon.profiles)
+            effective_strength = weapon.max_strength
+        toughness = defender.effective_stat("toughness")
 
         # Calculate wound target according to Necromunda rulebook 2023
         # Strength vs Toughness table
-        if effective_strength >= (defender.toughness * 2):  # Strength TWICE the Toughness or greater
+        if effective_strength >= (toughness * 2):  # Strength TWICE the Toughness or greater
             wound_target = 2  # 2+
-        elif effective_strength > defender.toughness:  # Strength GREATER than the Toughness
+        elif effective_strength > toughness:  # Strength GREATER than the Toughness
             wound_target = 3  # 3+
-        elif effective_strength == defender.toughness:  # Strength EQUAL to the Toughness
+        elif effective_strength == toughness:  # Strength EQUAL to the Toughness
             wound_target = 4  # 4+
-        elif effective_strength < defender.toughness:  # Strength LOWER than the Toughness
+        elif effective_strength < toughness:  # Strength LOWER than the Toughness
             wound_target = 5  # 5+
-        elif effective_strength <= (defender.toughness // 2):  # Strength HALF the Toughness or lower
+        elif effective_strength <= (toughness // 2):  # Strength HALF the Toughness or lower
             wound_target = 6  # 6+
 
         # Apply weapon traits
@@ -545,7 +881,7 @@ class GameLogic:
             # This is a test mock
             success = True
 
-        msg = f"Wound roll: {natural_roll} vs target {wound_target}+ (Strength {effective_strength} vs Toughness {defender.toughness})"
+        msg = f"Wound roll: {natural_roll} vs target {wound_target}+ (Strength {effective_strength} vs Toughness {toughness})"
         return (success, msg, natural_roll)
 
     def resolve_armor_save(self, defender: Ganger, weapon: Optional[Weapon] = None) -> tuple[bool, str, int]:
@@ -566,20 +902,16 @@ class GameLogic:
             tuple[bool, str, int]: Success status, message, and the natural roll
         """
         # Check for weapon traits that disallow saves
-        if weapon and weapon.traits:
-            for trait in weapon.traits:
-                if trait.name == "Gas Weapon":
-                    return (False, "Gas Weapon trait prevents armor saves", 0)
+        if weapon and weapon.has_trait("Gas Weapon"):
+            return (False, "Gas Weapon trait prevents armor saves", 0)
 
         # Get base save value (e.g., 5 for a 5+ save)
-        save_value = 7  # Default for unarmored fighters per Necromunda rules
-        if defender.armor:
-            save_value = defender.armor.save_value
+        save_value = defender.effective_save  # 7 for unarmored fighters per Necromunda rules
 
         # Apply weapon AP (armor penetration) if any
         ap_modifier = 0
         if weapon and weapon.profiles:
-            ap_modifier = max(profile.armor_penetration for profile in weapon.profiles)
+            ap_modifier = weapon.max_armor_penetration
 
         # Apply weapon traits that affect armor penetration
         weapon_trait_mods = self.apply_weapon_traits(defender, defender, weapon)
@@ -626,6 +958,7 @@ class GameLogic:
         msg = f"Armor save: {natural_roll} vs {modified_save}+ ({result_msg})"
         return (success, msg, natural_roll)
 
+    @recorded
     def attack(self, attacker_name: str, target_name: str, weapon_name: Optional[str] = None, attack_type: str = "auto") -> str:
         """
         Execute an attack from one fighter to another with enhanced combat mechanics
@@ -670,8 +1003,9 @@ class GameLogic:
         range_category = "Short"
         if attack_type == "ranged" and attacker.x is not None and attacker.y is not None and defender.x is not None and defender.y is not None:
             distance = abs(attacker.x - defender.x) + abs(attacker.y - defender.y)
-            # Assuming ranges based on typical Necromunda scale
-            if distance > 12:  # Arbitrary threshold, should be based on weapon profile
+            # Beyond the weapon's short range band is long range; 12 for weapons without parsable range bands
+            short_range = weapon.range_bands.get("Short", (0, 12))[1] if weapon else 12
+            if distance > short_range:
                 range_category = "Long"
             
         return self.resolve_combat(attacker, defender, weapon, attack_type, range_category)
@@ -729,7 +1063,7 @@ class GameLogic:
         # Apply damage with critical hit bonus
         base_damage = 1
         if weapon and weapon.profiles:
-            base_damage = max(profile.damage for profile in weapon.profiles)
+            base_damage = weapon.max_damage
             
         # Critical hits do +1 damage in Necromunda
         total_damage = base_damage + (1 if is_critical else 0)
@@ -911,7 +1245,7 @@ class GameLogic:
             return False
 
         charge_distance = self.calculate_charge_distance(attacker, target)
-        return charge_distance <= attacker.movement * 2  # Charge allows double movement
+        return charge_distance <= attacker.effective_stat("movement") * 2  # Charge allows double movement
 
     def perform_charge(self, attacker: Ganger, target: Ganger) -> str:
         """Execute a charge action."""
@@ -932,7 +1266,7 @@ class GameLogic:
         for gang in self.game_state.gangs:
             # Use the leader's initiative if available
             leader = next((m for m in gang.members if m.role == GangerRole.LEADER), None)
-            initiative_bonus = leader.initiative if leader else 0
+            initiative_bonus = leader.effective_stat("initiative") if leader else 0
 
             # Roll initiative
             roll = self.d20.roll('1d20').total + initiative_bonus
@@ -945,7 +1279,8 @@ class GameLogic:
     def handle_multiple_attacks(self, attacker: Ganger, defender: Ganger, weapon: Optional[Weapon] = None) -> str:
         """Handle multiple attacks from a single fighter."""
         results = []
-        for i in range(attacker.attacks):
+        attacks = attacker.effective_stat("attacks")
+        for i in range(attacks):
             if defender.is_out_of_action:
                 break
             result = self.resolve_combat(attacker, defender, weapon)
@@ -953,7 +1288,7 @@ class GameLogic:
 
             # If this is a test mock and we want to ensure multiple attacks are recorded
             # even though one attack would technically kill the defender
-            if i == 0 and attacker.attacks > 1 and hasattr(self.d20, 'roll') and callable(self.d20.roll) and defender.is_out_of_action:
+            if i == 0 and attacks > 1 and hasattr(self.d20, 'roll') and callable(self.d20.roll) and defender.is_out_of_action:
                 # Reset defender for the second test attack
                 defender.is_out_of_action = False
                 defender.wounds = 1
@@ -1063,12 +1398,7 @@ class GameLogic:
             fighter.is_prone = True
             
             # Create an Injury record
-            flesh_wound = Injury(
-                type="Flesh Wound",
-                severity=InjurySeverity.MINOR,
-                effect="The fighter is prone and suffers -1 to all future hit rolls.",
-                attribute_modifiers={}
-            )
+            flesh_wound = Injury.model_validate(INJURY_RECORDS[InjuryResult.FLESH_WOUND])
             fighter.injuries.append(flesh_wound)
             
         elif injury_result == InjuryResult.SERIOUS_INJURY:
@@ -1078,12 +1408,7 @@ class GameLogic:
             fighter.status = "Seriously Injured"
             
             # Create an Injury record
-            serious_injury = Injury(
-                type="Serious Injury",
-                severity=InjurySeverity.MAJOR,
-                effect="The fighter is seriously injured and cannot stand up. Requires medical attention.",
-                attribute_modifiers={}
-            )
+            serious_injury = Injury.model_validate(INJURY_RECORDS[InjuryResult.SERIOUS_INJURY])
             fighter.injuries.append(serious_injury)
             
         elif injury_result == InjuryResult.OUT_OF_ACTION:
@@ -1094,12 +1419,7 @@ class GameLogic:
             fighter.status = "Out of Action"
             
             # Create an Injury record
-            out_of_action = Injury(
-                type="Out of Action",
-                severity=InjurySeverity.CRITICAL,
-                effect="The fighter is out of action for the remainder of the battle.",
-                attribute_modifiers={}
-            )
+            out_of_action = Injury.model_validate(INJURY_RECORDS[InjuryResult.OUT_OF_ACTION])
             fighter.injuries.append(out_of_action)
             
     def apply_weapon_traits(self, attacker: Ganger, defender: Ganger, weapon: Optional[Weapon] = None) -> Dict[str, int]:
@@ -1177,7 +1497,7 @@ class GameLogic:
             modifiers['to_wound'] += 1  # Goliaths get +1 to wound in close combat
             logging.debug(f"Goliath fighter gets +1 to wound")
         elif attacker.gang_affiliation == GangType.ESCHER:
-            if weapon and hasattr(weapon, 'traits') and weapon.traits and any(t.name.lower() == 'toxin' for t in weapon.traits):
+            if weapon and weapon.has_trait('toxin'):
                 modifiers['to_wound'] += 1  # Eschers get +1 to wound with toxin weapons
 
         # Check for status effects
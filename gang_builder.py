@@ -1,8 +1,12 @@
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing_extensions import Annotated
-from typing import List, Optional
-from models import Weapon, WeaponTrait, WeaponProfile, Equipment, SpecialRule, Ganger, Armor
-from models.gang_models import GangType, GangerRole
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from models import Weapon, Equipment, SpecialRule, Ganger, Armor
+from models.armor_models import ArmorType
+from models.gang_models import GangType, GangerRole, UNARMORED_SAVE
+from models.item_catalog import ITEM_CATALOG
+from models.rules_models import RuleEffect
+from serialization import encode
 
 
 # Input models for traits, weapons, equipment, etc.
@@ -44,6 +48,7 @@ class SpecialRuleInput(BaseModel):
 
 class ArmorInput(BaseModel):
     name: str = Field(..., description="Name of the armor.")
+    armor_type: Optional[ArmorType] = Field(None, description="Type of the armor; taken from the name if omitted.")
     armor_rating: int = Field(..., ge=0, le=6, description="Armor rating between 0 and 6.")
     locations: List[str] = Field(..., description="Body locations covered by the armor.")
     special_rules: Optional[List[str]] = Field(default_factory=list, description="Special rules for the armor.")
@@ -68,46 +73,132 @@ class GangerInput(BaseModel):
     intelligence: int = Field(..., ge=2, le=10, description="Intelligence characteristic.")
     credits_value: int = Field(..., ge=0, description="Credits value assigned to this ganger.")
     role: GangerRole = Field(..., description="Role of the gang member.")
-    weapons: List[WeaponInput] = Field(..., min_items=1, description="List of weapons carried.")
+    weapons: List[WeaponInput] = Field(..., min_length=1, description="List of weapons carried.")
     equipment: Optional[List[EquipmentInput]] = Field(default_factory=list, description="List of equipment carried.")
     skills: Optional[List[str]] = Field(default_factory=list, description="List of skills possessed.")
     special_rules: Optional[List[SpecialRuleInput]] = Field(default_factory=list, description="Special rules for the ganger.")
     armor: Optional[ArmorInput] = Field(None, description="Armor worn by the ganger.")
 
-    
+
+# GangerInput fields holding items, which are built into game models separately
+_ITEM_FIELDS = {"weapons", "equipment", "special_rules", "armor"}
+
+# Fields of a game Weapon/WeaponProfile/Equipment that builder input has no column for
+_WEAPON_PROFILE_DEFAULTS = {"short_range_modifier": None, "long_range_modifier": None, "blast_radius": None}
+_EQUIPMENT_DEFAULTS = {"cost": None, "rarity": None, "weight": None}
+
+
+def build_weapon(weapon: WeaponInput) -> Weapon:
+    """Build the game Weapon for a validated weapon input."""
+    data = weapon.model_dump()
+    data["profiles"] = [{**_WEAPON_PROFILE_DEFAULTS, **profile} for profile in data["profiles"]]
+    return Weapon.model_validate(data)
+
+
+def build_equipment(equipment: EquipmentInput) -> Equipment:
+    """Build the game Equipment for a validated equipment input."""
+    return Equipment.model_validate({**_EQUIPMENT_DEFAULTS, **equipment.model_dump()})
+
+
+def build_special_rule(rule: SpecialRuleInput) -> SpecialRule:
+    """Build the game SpecialRule for a validated special rule input; the input's effect becomes its one effect."""
+    return SpecialRule(
+        name=rule.name,
+        description=rule.description,
+        applicability=["Models"],
+        conditions=None,
+        effects=[RuleEffect(target=rule.name, modifier=None, description=rule.effect)],
+    )
+
+
+def build_armor(armor: ArmorInput) -> Armor:
+    """
+    Build the game Armor for a validated armor input.
+
+    The armor type is taken from the input, or else from the armor's name
+    (e.g. 'Flak Armour'). The armor rating is the save value, with 0 for
+    armor that gives no save.
+
+    Raises:
+        ValueError: If the armor type can't be determined.
+    """
+    armor_type = armor.armor_type
+    if armor_type is None:
+        name = armor.name.lower()
+        armor_type = next((t for t in ArmorType if t.value.lower() in name), None)
+        if armor_type is None:
+            raise ValueError(f"Unknown armor type for '{armor.name}'; set armor_type")
+    return Armor(
+        name=armor.name,
+        armor_type=armor_type,
+        save_value=armor.armor_rating or UNARMORED_SAVE,
+        special_rules=armor.special_rules or [],
+        description=f"Covers: {', '.join(armor.locations)}" if armor.locations else None,
+    )
+
+
+class ItemCache:
+    """
+    Item definitions already built from builder input, keyed by the input's raw data.
+
+    Rosters repeat the same weapons, equipment and armor on many fighters;
+    each distinct item is validated and built once per cache and then
+    shared through the item catalog.
+    """
+
+    def __init__(self):
+        self._items: Dict[Tuple[str, str], Any] = {}
+
+    def get(self, kind: str, raw: Any, build: Callable[[], Any]) -> Any:
+        """Get the item built from `raw`, calling `build` only the first time it is seen."""
+        key = (kind, encode(raw))
+        item = self._items.get(key)
+        if item is None:
+            item = self._items[key] = ITEM_CATALOG.intern(build())
+        return item
+
+
+def build_ganger(input_data: Dict[str, Any], cache: Optional[ItemCache] = None) -> Ganger:
+    """
+    Validate builder input once and build the Ganger from it.
+
+    Args:
+        input_data (Dict[str, Any]): The ganger's data as accepted by GangerInput.
+        cache (Optional[ItemCache]): Items built for earlier gangers, to reuse for identical input.
+
+    Returns:
+        Ganger: The new ganger.
+
+    Raises:
+        ValueError: If the data is invalid (pydantic's ValidationError is a ValueError).
+    """
+    cache = cache if cache is not None else ItemCache()
+    validated_input = GangerInput.model_validate(input_data)
+
+    # Identical item definitions are shared with every other fighter through the item catalog
+    weapons = [cache.get("weapon", raw, lambda w=w: build_weapon(w))
+               for w, raw in zip(validated_input.weapons, input_data["weapons"])]
+    equipment = [cache.get("equipment", raw, lambda e=e: build_equipment(e))
+                 for e, raw in zip(validated_input.equipment or [], input_data.get("equipment") or [])]
+    # Special rules aren't frozen, so each fighter gets its own
+    special_rules = [build_special_rule(s) for s in validated_input.special_rules or []]
+    armor = None
+    if validated_input.armor is not None:
+        armor = cache.get("armor", input_data["armor"], lambda: build_armor(validated_input.armor))
+
+    return Ganger.model_validate({
+        **validated_input.model_dump(exclude=_ITEM_FIELDS),
+        "weapons": weapons,
+        "equipment": equipment,
+        "special_rules": special_rules,
+        "armor": armor,
+        "xp": 0,
+    })
 
 
 # Create a Ganger instance
 def create_gang_member(input_data: dict) -> Ganger:
     try:
-        validated_input = GangerInput(**input_data)
-
-        # Convert input models to game models
-        weapons = [
-            Weapon(
-                name=w.name,
-                weapon_type=w.weapon_type,
-                cost=w.cost,
-                rarity=w.rarity,
-                traits=[WeaponTrait(**t.dict()) for t in w.traits],
-                profiles=[WeaponProfile(**p.dict()) for p in w.profiles],
-                is_unwieldy=w.is_unwieldy,
-                description=w.description
-            )
-            for w in validated_input.weapons
-        ]
-
-        equipment = [Equipment(**e.dict()) for e in validated_input.equipment]
-        special_rules = [SpecialRule(**s.dict()) for s in validated_input.special_rules]
-        armor = Armor(**validated_input.armor.dict()) if validated_input.armor else None
-
-        return Ganger(
-            **validated_input.dict(exclude={"weapons", "equipment", "special_rules", "armor"}),
-            weapons=weapons,
-            equipment=equipment,
-            special_rules=special_rules,
-            armor=armor,
-            xp=0
-        )
+        return build_ganger(input_data)
     except ValueError as e:
         raise ValueError(f"Invalid gang member data: {str(e)}")
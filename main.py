@@ -1,16 +1,19 @@
 import logging
 import argparse
-from rich.console import Console
-from user_interface import UserInterface
-from game_logic import GameLogic
-from database import initialize_database
-from cli import run_cli, test_mode
+import sys
+from typing import TYPE_CHECKING, Optional
 
+# The engine, Rich and the database are imported in main() once the arguments are parsed,
+# so --help, bad arguments and --serve don't pay for modules they never use.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from game_logic import GameLogic
 
-def setup_logging() -> None:
+
+def setup_logging(level: int = logging.INFO) -> None:
     """Set up logging configuration with Rich for improved output."""
     logging.basicConfig(
-        level=logging.INFO,
+        level=level,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
             logging.FileHandler("game_log.log"),
@@ -80,7 +83,7 @@ def create_sample_scenario():
     )
 
 
-def initialize_game(game_logic: GameLogic, console: Console) -> None:
+def initialize_game(game_logic: "GameLogic", console: "Console") -> None:
     """
     Initialize the game with default settings and a sample scenario.
 
@@ -96,6 +99,28 @@ def initialize_game(game_logic: GameLogic, console: Console) -> None:
     logging.info("Sample scenario initialized.")
 
 
+def run_server(socket_path: Optional[str] = None, max_games: Optional[int] = None) -> None:
+    """
+    Run the multi-game server until stdin closes or the process is interrupted.
+
+    Args:
+        socket_path (Optional[str]): Unix socket to listen on; stdin/stdout is used if omitted.
+        max_games (Optional[int]): Maximum number of games kept in memory.
+    """
+    import asyncio
+    from server import GameServer
+    from session_manager import DEFAULT_MAX_RESIDENT
+
+    server = GameServer(scenario_factory=create_sample_scenario, max_resident=max_games or DEFAULT_MAX_RESIDENT)
+    try:
+        if socket_path:
+            asyncio.run(server.serve_unix(socket_path))
+        else:
+            asyncio.run(server.serve_stdio())
+    except KeyboardInterrupt:
+        logging.info("Server interrupted by user.")
+
+
 def main() -> None:
     """
     Main function to run the Necromunda Simulation.
@@ -104,20 +129,53 @@ def main() -> None:
     """
     parser = argparse.ArgumentParser(description='Necromunda Text-Based Simulation')
     parser.add_argument('--test', action='store_true', help='Run in test mode')
+    parser.add_argument('--script', metavar='FILE', help='Run commands from FILE (or - for stdin) and report throughput')
+    parser.add_argument('--quiet', action='store_true', help='With --script, skip rendering command output')
+    parser.add_argument('--output', choices=['direct', 'buffered', 'null'], default='direct',
+                        help='How command output is shown: as it is rendered, once per command, or not at all '
+                             '(--script buffers output unless this is null)')
+    parser.add_argument('--serve', action='store_true', help='Host many games, reading "<game_id> <command>" lines')
+    parser.add_argument('--socket', metavar='PATH', help='With --serve, listen on a Unix socket instead of stdin')
+    parser.add_argument('--max-games', type=int, default=None, metavar='N',
+                        help='With --serve, keep at most N games in memory and page the rest to disk')
+    parser.add_argument('--no-autosave', action='store_true', help='Do not autosave the interactive game after each action')
+    parser.add_argument('--sync-autosave', action='store_true',
+                        help='Autosave on the command thread instead of a background worker')
     args = parser.parse_args()
 
-    setup_logging()
+    quiet = args.quiet or args.output == 'null'
+    # Quiet script runs are benchmarks of the rules engine; per-action INFO logging would dominate them
+    setup_logging(logging.WARNING if args.script and quiet else logging.INFO)
+    if args.serve:
+        run_server(args.socket, args.max_games)
+        return
+
+    from rich.console import Console
+    from user_interface import UserInterface
+    from game_logic import GameLogic
+    from database import initialize_database
+    from cli import run_cli, test_mode, run_script, read_script_commands
+    from autosave import Autosaver, BackgroundAutosaver
+
     console = Console()
     db = initialize_database()
     game_logic = GameLogic(db)
     initialize_game(game_logic, console)
-    ui = UserInterface(console, game_logic)
+    ui = UserInterface(console, game_logic, output=args.output)
 
-    if args.test:
+    if args.script:
+        if args.script == '-':
+            run_script(ui, console, read_script_commands(sys.stdin), quiet=quiet)
+        else:
+            with open(args.script) as script:
+                run_script(ui, console, read_script_commands(script), quiet=quiet)
+    elif args.test:
         console.print("[bold yellow]Running in Test Mode...[/bold yellow]")
         test_mode(game_logic, ui, console)
     else:
         console.print("[bold cyan]Starting Interactive Mode...[/bold cyan]")
+        if not args.no_autosave:
+            game_logic.autosaver = Autosaver(db) if args.sync_autosave else BackgroundAutosaver(db)
         run_cli(game_logic, ui, console)
 
 
@@ -1,10 +1,50 @@
-from .armor_models import Armor, ArmorModifier
-from .weapon_models import Weapon, WeaponTrait, WeaponProfile
-from .item_models import Consumable, Equipment
-from .rules_models import SpecialRule
-from .gang_models import Ganger, Gang
-from .battlefield_models import Tile, Battlefield, TileType
-from .scenario_models import ScenarioObjective, ScenarioDeploymentZone, ScenarioSpecialRule, ScenarioRewards, Scenario
-from .combat_models import CombatPhase, CombatRound, PhaseName
-from .game_state_models import GameState
-from .vehicle_models import Vehicle
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public models by the submodule defining them. Each submodule is imported the first time one
+# of its models is used, so a process only pays for building the pydantic models it needs.
+_EXPORTS = {
+    "armor_models": ("Armor", "ArmorModifier"),
+    "weapon_models": ("Weapon", "WeaponTrait", "WeaponProfile"),
+    "item_models": ("Consumable", "Equipment"),
+    "rules_models": ("SpecialRule",),
+    "gang_models": ("Ganger", "Gang"),
+    "battlefield_models": ("Tile", "Battlefield", "TileType"),
+    "scenario_models": ("ScenarioObjective", "ScenarioDeploymentZone", "ScenarioSpecialRule", "ScenarioRewards", "Scenario"),
+    "combat_models": ("CombatPhase", "CombatRound", "PhaseName"),
+    "game_state_models": ("GameState",),
+    "vehicle_models": ("Vehicle",),
+    "replay_models": ("GameEvent", "ReplayCheckpoint", "ReplayLog"),
+    "save_models": ("SaveSlotInfo",),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+if TYPE_CHECKING:
+    from .armor_models import Armor, ArmorModifier
+    from .weapon_models import Weapon, WeaponTrait, WeaponProfile
+    from .item_models import Consumable, Equipment
+    from .rules_models import SpecialRule
+    from .gang_models import Ganger, Gang
+    from .battlefield_models import Tile, Battlefield, TileType
+    from .scenario_models import ScenarioObjective, ScenarioDeploymentZone, ScenarioSpecialRule, ScenarioRewards, Scenario
+    from .combat_models import CombatPhase, CombatRound, PhaseName
+    from .game_state_models import GameState
+    from .vehicle_models import Vehicle
+    from .replay_models import GameEvent, ReplayCheckpoint, ReplayLog
+    from .save_models import SaveSlotInfo
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model's submodule the first time the model is looked up."""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
 from typing import List, Optional, Dict, Annotated
 from enum import Enum
+from .bulk_update import BulkUpdateModel
 
 
 class ArmorType(str, Enum):
@@ -40,7 +41,7 @@ class ArmorModifier(BaseModel):
     description: Annotated[Optional[str], Field(None, description="Details about how the modifier works.")]
 
 
-class Armor(BaseModel):
+class Armor(BulkUpdateModel):
     """Represents armor with detailed mechanics and interactions."""
     name: Annotated[str, Field(description="Name of the armor.")]
     armor_type: Annotated[ArmorType, Field(description="Type of armor.")]
@@ -62,6 +63,7 @@ class Armor(BaseModel):
     description: Annotated[Optional[str], Field(None, description="Additional details about the armor.")]
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [{
                 "name": "Furnace Plates",
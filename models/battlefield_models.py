@@ -1,10 +1,12 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import List, Optional, Annotated
+from pydantic import Field, model_validator, ValidationInfo
+from typing import TYPE_CHECKING, List, Optional, Annotated
 from enum import Enum
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-from rich.panel import Panel
+from .validation_context import TRUSTED_CONTEXT, is_trusted
+from .bulk_update import BulkUpdateModel
+
+if TYPE_CHECKING:  # Rich is imported when rendering, so headless use never loads it
+    from rich.panel import Panel
+    from rich.text import Text
 
 
 class TileType(str, Enum):
@@ -14,7 +16,7 @@ class TileType(str, Enum):
     OBSTRUCTION = "obstruction"
 
 
-class Tile(BaseModel):
+class Tile(BulkUpdateModel):
     """Represents a single tile on the battlefield."""
     x: Annotated[int, Field(description="X-coordinate of the tile on the battlefield.", ge=0)]
     y: Annotated[int, Field(description="Y-coordinate of the tile on the battlefield.", ge=0)]
@@ -37,8 +39,9 @@ class Tile(BaseModel):
         }
     }
 
-    def render(self) -> Text:
+    def render(self) -> "Text":
         """Render the tile as a Rich Text object."""
+        from rich.text import Text
         char = {
             TileType.OPEN: ".",
             TileType.COVER: "#",
@@ -57,15 +60,17 @@ class Tile(BaseModel):
         return Text(char, style=color)
 
 
-class Battlefield(BaseModel):
+class Battlefield(BulkUpdateModel):
     """Represents the game battlefield composed of tiles."""
     width: Annotated[int, Field(description="Width of the battlefield in tiles.")]
     height: Annotated[int, Field(description="Height of the battlefield in tiles.")]
     tiles: Annotated[List[Tile], Field(default_factory=list, description="List of tiles that make up the battlefield.")]
 
     @model_validator(mode='after')
-    def validate_tiles(self) -> 'Battlefield':
+    def validate_tiles(self, info: ValidationInfo) -> 'Battlefield':
         """Validate that all tiles are within the battlefield dimensions."""
+        if is_trusted(info):
+            return self
         for tile in self.tiles:
             if tile.x < 0 or tile.x >= self.width or tile.y < 0 or tile.y >= self.height:
                 raise ValueError(f"Tile at ({tile.x}, {tile.y}) is outside the battlefield dimensions.")
@@ -95,8 +100,10 @@ class Battlefield(BaseModel):
         }
     }
 
-    def render(self) -> Panel:
+    def render(self) -> "Panel":
         """Render the battlefield as a Rich Panel."""
+        from rich.panel import Panel
+        from rich.text import Text
         grid = [["" for _ in range(self.width)] for _ in range(self.height)]
         for tile in self.tiles:
             grid[tile.y][tile.x] = tile.render()
@@ -116,5 +123,7 @@ class Battlefield(BaseModel):
     @classmethod
     def generate_default(cls, width: int, height: int) -> "Battlefield":
         """Generate a default battlefield with all open tiles."""
-        tiles = [Tile(x=x, y=y, type=TileType.OPEN) for y in range(height) for x in range(width)]
-        return cls(width=width, height=height, tiles=tiles)
+        # Tiles are in bounds by construction, so validate the whole battlefield in one
+        # trusted pass instead of one Tile at a time plus the Python bounds check.
+        tiles = [{"x": x, "y": y, "type": TileType.OPEN} for y in range(height) for x in range(width)]
+        return cls.model_validate({"width": width, "height": height, "tiles": tiles}, context=TRUSTED_CONTEXT)
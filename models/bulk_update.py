@@ -0,0 +1,95 @@
+import contextlib
+import threading
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+from pydantic import BaseModel, ValidationError
+
+# Models changed inside the current thread's bulk_update() block, by id, with their field values and set
+# fields from before the block; None outside a block
+_state = threading.local()
+
+Pending = Dict[int, Tuple["BulkUpdateModel", Dict[str, Any], Set[str]]]
+
+
+class BulkUpdateModel(BaseModel):
+    """
+    A model whose per-assignment validation can be deferred with bulk_update().
+
+    Outside a bulk_update() block assignments behave as usual. Inside one,
+    field assignments on any BulkUpdateModel with `validate_assignment` in
+    the same thread are stored without validation, and every changed model
+    is validated once when the block exits. Models without
+    `validate_assignment` never validate assignments, so they are unaffected.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pending = getattr(_state, 'pending', None)
+        if (pending is None or not self.model_config.get('validate_assignment') or self.model_config.get('frozen')
+                or name not in type(self).__pydantic_fields__):
+            super().__setattr__(name, value)
+            return
+        entry = pending.get(id(self))
+        if entry is None:
+            entry = pending[id(self)] = (self, {}, set(self.__pydantic_fields_set__))
+        entry[1].setdefault(name, self.__dict__.get(name))
+        self.__dict__[name] = value
+        self.__pydantic_fields_set__.add(name)
+
+    @contextlib.contextmanager
+    def bulk_update(self) -> Iterator["BulkUpdateModel"]:
+        """
+        Change many fields without validating each assignment.
+
+        When the block exits, every model changed inside the block is
+        validated once, running its field and model validators (e.g. a Gang's
+        composition check), and the validated values are written back. A
+        model that fails validation gets back the values it had before the
+        block, as a failed assignment keeps the old value. This happens even
+        if the block raises, so no invalid value outlives it. Nested blocks
+        join the outermost one.
+
+        Example:
+            with game_state.bulk_update():
+                for tile in game_state.battlefield.tiles:
+                    tile.occupier = None
+
+        Raises:
+            ValidationError: On exit, if a changed model is invalid; the first such error.
+        """
+        if getattr(_state, 'pending', None) is not None:
+            yield self
+            return
+        pending: Pending = {}
+        _state.pending = pending
+        try:
+            yield self
+        except BaseException:
+            _state.pending = None
+            # The block's own exception is the one to raise
+            validate_models(pending)
+            raise
+        _state.pending = None
+        error = validate_models(pending)
+        if error is not None:
+            raise error
+
+
+def validate_models(models: Pending) -> Optional[ValidationError]:
+    """
+    Validate each changed model's current field values once, storing the validated values in place.
+
+    A model that fails validation is restored to its values from before the block.
+
+    Returns:
+        Optional[ValidationError]: The first validation error, or None if every model is valid.
+    """
+    first_error = None
+    for model, original, original_fields_set in models.values():
+        fields_set = model.__pydantic_fields_set__
+        try:
+            model.__pydantic_validator__.validate_python(dict(model.__dict__), self_instance=model)
+        except ValidationError as e:
+            model.__dict__.update(original)
+            fields_set = original_fields_set
+            first_error = first_error or e
+        object.__setattr__(model, '__pydantic_fields_set__', fields_set)
+    return first_error
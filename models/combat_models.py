@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import Field, PositiveInt
 from typing import List, Optional, Annotated
 from enum import Enum
+from .bulk_update import BulkUpdateModel
 
 class PhaseName(str, Enum):
     PRIORITY = "Priority Phase"
@@ -12,7 +13,7 @@ class ActionType(str, Enum):
     BASIC = "Basic"
     DOUBLE = "Double"
 
-class Action(BaseModel):
+class Action(BulkUpdateModel):
     """Represents an action a fighter can perform."""
     name: Annotated[str, Field(description="Name of the action, e.g., Move, Shoot, Charge.")]
     action_type: Annotated[ActionType, Field(description="Type of action: Simple, Basic, or Double.")]
@@ -42,7 +43,7 @@ class Action(BaseModel):
         }
     }
 
-class CombatPhase(BaseModel):
+class CombatPhase(BulkUpdateModel):
     """Represents a phase of combat."""
     name: Annotated[PhaseName, Field(description="Name of the phase: Priority Phase, Action Phase, or End Phase.")]
     description: Annotated[Optional[str], Field(description="Detailed description of what happens during this phase.")]
@@ -87,7 +88,7 @@ class CombatPhase(BaseModel):
         }
     }
 
-class CombatRound(BaseModel):
+class CombatRound(BulkUpdateModel):
     """Represents a combat round, including its phases and events."""
     round_number: Annotated[PositiveInt, Field(description="The number of the combat round, starting from 1.")]
     phases: Annotated[List[CombatPhase], Field(description="List of phases that occur in this round of combat.")]
@@ -0,0 +1,13 @@
+class FieldEqualityMixin:
+    """
+    Compare pydantic models by their fields alone.
+
+    For models whose private attributes only cache values derived from their
+    fields, such as indexes and computed stats: two models with equal fields
+    are equal whether or not those caches have been filled in yet.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FieldEqualityMixin):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
@@ -1,11 +1,14 @@
-from pydantic import BaseModel, Field, PositiveInt, NonNegativeInt, model_validator
+from pydantic import Field, PositiveInt, NonNegativeInt, PrivateAttr, model_validator, ValidationInfo
 from typing_extensions import Annotated
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
-from .gang_models import Gang
+from .gang_models import Gang, Ganger
 from .battlefield_models import Battlefield
 from .scenario_models import Scenario
 from .combat_models import CombatRound
+from .validation_context import is_trusted
+from .bulk_update import BulkUpdateModel
+from .field_equality import FieldEqualityMixin
 
 
 class GamePhase(str, Enum):
@@ -16,29 +19,169 @@ class GamePhase(str, Enum):
     POST_BATTLE = "Post-Battle"
 
 
-class GameState(BaseModel):
+class GameState(FieldEqualityMixin, BulkUpdateModel):
     """Represents the state of the game."""
     gangs: List[Gang] = Field(..., description="List of gangs participating in the game.")
     battlefield: Battlefield = Field(..., description="Representation of the battlefield.")
     scenario: Optional[Scenario] = Field(None, description="The current scenario being played.")
     current_turn: PositiveInt = Field(1, description="Current turn number.")
     active_gang_index: NonNegativeInt = Field(0, description="Index of the currently active gang.")
+    active_fighter_index: NonNegativeInt = Field(0, description="Index of the currently active fighter within the active gang.")
     max_turns: PositiveInt = Field(10, description="Maximum number of turns for the game.")
     combat_rounds: List[CombatRound] = Field(default_factory=list, description="List of combat rounds in the game.")
     game_phase: GamePhase = Field(GamePhase.PRE_BATTLE, description="Current phase of the game.")
     event_log: List[str] = Field(default_factory=list, description="Log of significant game events.")
     fighter_activations: List[str] = Field(default_factory=list, description="Track which fighters have been activated in the current turn.")
 
+    # Fighters by case-folded name with their gangs, kept up to date by add_gang(), add_member() and remove_member()
+    _fighters: Dict[str, Tuple[Gang, Ganger]] = PrivateAttr(default_factory=dict)
+    _indexed_gangs: Optional[List[Gang]] = PrivateAttr(default=None)
+    _indexed_gang_count: int = PrivateAttr(default=0)
+    _indexed_fighter_count: int = PrivateAttr(default=0)
+
     @model_validator(mode='before')
     @classmethod
-    def validate_active_gang_index(cls, values):
+    def validate_active_gang_index(cls, values, info: ValidationInfo):
         """Ensure the active gang index is valid."""
+        if is_trusted(info):
+            return values
         active_index = values.get("active_gang_index", 0)
         gangs = values.get("gangs", [])
         if not gangs or active_index >= len(gangs):
             raise ValueError("Active gang index must correspond to a valid gang.")
         return values
 
+    @model_validator(mode='after')
+    def validate_fighter_names(self, info: ValidationInfo) -> 'GameState':
+        """Ensure no two fighters in the game share a name, ignoring case."""
+        if is_trusted(info):
+            return self
+        duplicates = self.reindex_fighters()
+        if duplicates:
+            raise ValueError(f"Fighter names must be unique across gangs: {', '.join(duplicates)} appear more than once.")
+        return self
+
+    def _registry(self) -> Dict[str, Tuple[Gang, Ganger]]:
+        """The fighter registry, rebuilt only if `gangs` was replaced or resized outside add_gang()."""
+        # Read through __pydantic_private__: plain attribute access to private attributes is several times slower
+        private = self.__pydantic_private__
+        if private['_indexed_gangs'] is not self.gangs or private['_indexed_gang_count'] != len(self.gangs):
+            self.reindex_fighters()
+        return private['_fighters']
+
+    def reindex_fighters(self) -> List[str]:
+        """
+        Rebuild the fighter registry, e.g. after renaming a fighter or changing a gang's members directly.
+
+        Returns:
+            List[str]: Names used by more than one fighter; lookups find the first of them.
+        """
+        fighters: Dict[str, Tuple[Gang, Ganger]] = {}
+        duplicates = []
+        for gang in self.gangs:
+            for member in gang.members:
+                key = member.name.casefold()
+                if key in fighters:
+                    duplicates.append(member.name)
+                else:
+                    fighters[key] = (gang, member)
+        private = self.__pydantic_private__
+        private['_fighters'] = fighters
+        private['_indexed_gangs'] = self.gangs
+        private['_indexed_gang_count'] = len(self.gangs)
+        private['_indexed_fighter_count'] = sum(len(gang.members) for gang in self.gangs)
+        return duplicates
+
+    def find_fighter(self, name: str) -> Optional[Tuple[Gang, Ganger]]:
+        """
+        Look up a fighter and their gang by name, ignoring case.
+
+        Fighters added or removed through a gang directly are still found:
+        a hit is checked against its gang's members, and a miss rebuilds
+        the registry if the gangs' sizes no longer match it.
+
+        Args:
+            name (str): The fighter's name.
+
+        Returns:
+            Optional[Tuple[Gang, Ganger]]: The fighter's gang and the fighter, or None if there is no such fighter.
+        """
+        key = name.casefold()
+        entry = self._registry().get(key)
+        if entry is not None:
+            gang, fighter = entry
+            if fighter.name.casefold() == key and gang.get_member(fighter.name) is fighter:
+                return entry
+        elif self.__pydantic_private__['_indexed_fighter_count'] == sum(len(gang.members) for gang in self.gangs):
+            return None
+        self.reindex_fighters()
+        return self.__pydantic_private__['_fighters'].get(key)
+
+    def get_fighter(self, name: str) -> Optional[Ganger]:
+        """Look up a fighter by name, ignoring case; see find_fighter()."""
+        entry = self.find_fighter(name)
+        return entry[1] if entry is not None else None
+
+    def _check_name_free(self, name: str) -> None:
+        if self.find_fighter(name) is not None:
+            raise ValueError(f"A fighter named {name} is already in the game.")
+
+    def add_gang(self, gang: Gang) -> None:
+        """
+        Add a gang to the game.
+
+        Raises:
+            ValueError: If one of its fighters has the name of a fighter already in the game, or two of them share a name.
+        """
+        names = set()
+        for member in gang.members:
+            key = member.name.casefold()
+            self._check_name_free(member.name)
+            if key in names:
+                raise ValueError(f"Gang {gang.name} has more than one fighter named {member.name}.")
+            names.add(key)
+        # Looked up after the checks, which may rebuild the registry
+        registry = self._registry()
+        self.gangs.append(gang)
+        for member in gang.members:
+            registry[member.name.casefold()] = (gang, member)
+        private = self.__pydantic_private__
+        private['_indexed_gang_count'] += 1
+        private['_indexed_fighter_count'] += len(gang.members)
+
+    def add_member(self, gang: Gang, ganger: Ganger) -> None:
+        """
+        Add a fighter to one of the game's gangs.
+
+        Raises:
+            ValueError: If a fighter with the name is already in the game, or the gang can't take the fighter.
+        """
+        self._check_name_free(ganger.name)
+        gang.add_member(ganger)
+        self._registry()[ganger.name.casefold()] = (gang, ganger)
+        self.__pydantic_private__['_indexed_fighter_count'] += 1
+
+    def remove_member(self, name: str) -> Optional[Ganger]:
+        """
+        Remove a fighter from their gang by name, ignoring case.
+
+        Returns:
+            Optional[Ganger]: The fighter removed, or None if there is no such fighter.
+
+        Raises:
+            ValueError: If the fighter is their gang's Leader.
+        """
+        entry = self.find_fighter(name)
+        if entry is None:
+            return None
+        gang, fighter = entry
+        size = len(gang.members)
+        gang.remove_member(fighter.name)
+        private = self.__pydantic_private__
+        del private['_fighters'][fighter.name.casefold()]
+        private['_indexed_fighter_count'] -= size - len(gang.members)
+        return fighter
+
     def advance_turn(self):
         """Advance the game to the next turn."""
         if self.current_turn < self.max_turns:
@@ -1,11 +1,14 @@
-from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt, model_validator, ValidationError
-from typing import List, Optional, Dict, Annotated
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt, PrivateAttr, model_validator, ValidationError, ValidationInfo
+from typing import Any, List, Optional, Dict, Annotated
 from enum import Enum
 from .armor_models import Armor
 from .weapon_models import Weapon
 from .item_models import Equipment, Consumable
 from .rules_models import SpecialRule
 from .vehicle_models import Vehicle
+from .validation_context import is_trusted
+from .bulk_update import BulkUpdateModel
+from .field_equality import FieldEqualityMixin
 
 
 class GangType(str, Enum):
@@ -54,7 +57,22 @@ class Injury(BaseModel):
     )]
 
 
-class Ganger(BaseModel):
+# Characteristics that equipment modifiers and injuries can change
+STAT_FIELDS = (
+    "movement", "weapon_skill", "ballistic_skill", "strength", "toughness", "wounds",
+    "initiative", "attacks", "leadership", "cool", "will", "intelligence",
+)
+# Save of a fighter without armor; a save needing 7+ always fails
+UNARMORED_SAVE = 7
+
+
+def stat_field(stat: str) -> Optional[str]:
+    """The Ganger field for a modifier's stat name, e.g. 'Ballistic Skill' -> 'ballistic_skill', or None."""
+    name = stat.strip().lower().replace(" ", "_")
+    return name if name in STAT_FIELDS else None
+
+
+class Ganger(FieldEqualityMixin, BaseModel):
     """Represents a ganger in Necromunda."""
     name: Annotated[str, Field(description="Name of the gang member.")]
     gang_affiliation: Annotated[GangType, Field(description="Gang to which this member belongs.")]
@@ -64,7 +82,7 @@ class Ganger(BaseModel):
     ballistic_skill: Annotated[int, Field(ge=2, le=6, description="Ballistic Skill (BS) characteristic, between 2+ and 6+.")]
     strength: Annotated[int, Field(description="Strength characteristic.")]
     toughness: Annotated[int, Field(description="Toughness characteristic.")]
-    wounds: Annotated[PositiveInt, Field(description="Wounds characteristic, minimum 1.")]
+    wounds: Annotated[NonNegativeInt, Field(description="Wounds remaining; 0 once the fighter has been taken down.")]
     initiative: Annotated[int, Field(ge=2, le=6, description="Initiative characteristic, between 2+ and 6+.")]
     attacks: Annotated[PositiveInt, Field(description="Number of attacks.")]
     leadership: Annotated[int, Field(ge=2, le=10, description="Leadership characteristic, between 2 and 10.")]
@@ -91,6 +109,13 @@ class Ganger(BaseModel):
     has_moved: Annotated[bool, Field(default=False, description="Indicates if the fighter has moved this activation.")]
     elevation: Annotated[Optional[int], Field(default=0, description="Current elevation of the fighter.")]
 
+    # Summed stat modifiers from equipment and injuries plus the armor save, and the sources they were computed from
+    _stat_modifiers: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _save: int = PrivateAttr(default=UNARMORED_SAVE)
+    _stat_sources: Optional[tuple] = PrivateAttr(default=None)
+    # Bumped by every field assignment, so views of the fighter can tell when to redraw it
+    _version: int = PrivateAttr(default=0)
+
     model_config = {
         "arbitrary_types_allowed": True,
         "json_schema_extra": {
@@ -116,8 +141,73 @@ class Ganger(BaseModel):
         }
     }
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).__pydantic_fields__:
+            self.__pydantic_private__['_version'] += 1
+
+    @property
+    def version(self) -> int:
+        """
+        A counter that goes up whenever one of the fighter's fields is assigned, e.g. by a move or a wound.
+
+        Changes inside a field, such as appending to `weapons`, are not
+        counted; views that show a list compare its contents as well.
+        """
+        return self.__pydantic_private__['_version']
+
+    def _current_stats(self) -> Dict[str, Any]:
+        """The private stat cache, recomputed only if equipment, injuries or armor were replaced, added or removed."""
+        # Read through __pydantic_private__: plain attribute access to private attributes is several times slower
+        private = self.__pydantic_private__
+        sources = private['_stat_sources']
+        if (sources is None or sources[0] is not self.equipment or sources[1] != len(self.equipment)
+                or sources[2] is not self.injuries or sources[3] != len(self.injuries) or sources[4] is not self.armor):
+            self.refresh_stats()
+        return private
+
+    def refresh_stats(self) -> None:
+        """Recompute the effective stats, e.g. after replacing an item in `equipment` in place."""
+        modifiers: Dict[str, int] = {}
+        for item in self.equipment:
+            for modifier in item.modifiers:
+                field = stat_field(modifier.stat)
+                # Conditional modifiers only apply in some situations, so they are not part of the profile
+                if field is not None and modifier.condition is None:
+                    modifiers[field] = modifiers.get(field, 0) + modifier.value
+        for injury in self.injuries:
+            for stat, value in injury.attribute_modifiers.items():
+                field = stat_field(stat)
+                if field is not None:
+                    modifiers[field] = modifiers.get(field, 0) + value
+        self._stat_modifiers = modifiers
+        # The armor's save modifier applies to the save roll, so a +1 lowers the save needed by one
+        self._save = (self.armor.save_value - (self.armor.save_modifier or 0)) if self.armor else UNARMORED_SAVE
+        self._stat_sources = (self.equipment, len(self.equipment), self.injuries, len(self.injuries), self.armor)
+
+    def effective_stat(self, stat: str) -> int:
+        """
+        Get a characteristic with the fighter's equipment modifiers and injuries applied.
+
+        Modifiers with a condition are left to the rules that check the
+        condition. The summed modifiers are cached until equipment,
+        injuries or armor change, so this costs a dictionary lookup.
+
+        Args:
+            stat (str): The characteristic's field name, e.g. 'toughness'.
+
+        Returns:
+            int: The base characteristic plus its modifiers.
+        """
+        return getattr(self, stat) + self._current_stats()['_stat_modifiers'].get(stat, 0)
 
-class Gang(BaseModel):
+    @property
+    def effective_save(self) -> int:
+        """The armor save needed (e.g. 5 for 5+), or 7 without armor."""
+        return self._current_stats()['_save']
+
+
+class Gang(FieldEqualityMixin, BulkUpdateModel):
     """Represents a gang in Necromunda."""
     name: Annotated[str, Field(description="Name of the gang.")]
     type: Annotated[GangType, Field(description="The type of the gang.")]
@@ -129,15 +219,21 @@ class Gang(BaseModel):
     victory_points: Annotated[NonNegativeInt, Field(default=0, description="Victory points earned.")]
     vehicles: Annotated[List[Vehicle], Field(default_factory=list, description="Vehicles owned by the gang.")]
 
+    # Role counts and case-folded name index of `members`, kept up to date by add_member() and remove_member()
+    _role_counts: Dict[GangerRole, int] = PrivateAttr(default_factory=dict)
+    _members_by_name: Dict[str, Ganger] = PrivateAttr(default_factory=dict)
+    _indexed_members: Optional[List[Ganger]] = PrivateAttr(default=None)
+    _indexed_count: int = PrivateAttr(default=0)
+
     @model_validator(mode='after')
-    def validate_gang_composition(self) -> 'Gang':
+    def validate_gang_composition(self, info: ValidationInfo) -> 'Gang':
         """Validate gang composition rules."""
-        leaders = [m for m in self.members if m.role == GangerRole.LEADER]
-        champions = [m for m in self.members if m.role == GangerRole.CHAMPION]
-
-        if len(leaders) != 1:
+        if is_trusted(info):
+            return self
+        self._roster()
+        if self._role_counts.get(GangerRole.LEADER, 0) != 1:
             raise ValueError("Each gang must have exactly one Leader.")
-        if len(champions) > 2:
+        if self._role_counts.get(GangerRole.CHAMPION, 0) > 2:
             raise ValueError("A gang can have a maximum of two Champions.")
         return self
 
@@ -165,10 +261,72 @@ class Gang(BaseModel):
         """Calculate total experience points across all members."""
         return sum(member.xp for member in self.members)
 
+    def _roster(self) -> Dict[str, Ganger]:
+        """The name index, rebuilt only if `members` was replaced or resized outside add_member/remove_member."""
+        # Read through __pydantic_private__, as in Ganger._current_stats()
+        private = self.__pydantic_private__
+        if private['_indexed_members'] is not self.members or private['_indexed_count'] != len(self.members):
+            self.reindex_members()
+        return private['_members_by_name']
+
+    def reindex_members(self) -> None:
+        """Rebuild the role counts and name index, e.g. after changing a member's role directly."""
+        self._role_counts = {}
+        self._members_by_name = {}
+        for member in self.members:
+            self._role_counts[member.role] = self._role_counts.get(member.role, 0) + 1
+            self._members_by_name.setdefault(member.name.casefold(), member)
+        self._indexed_members = self.members
+        self._indexed_count = len(self.members)
+
+    def role_count(self, role: GangerRole) -> int:
+        """Count the members with a role."""
+        self._roster()
+        return self._role_counts.get(role, 0)
+
+    def get_member(self, name: str) -> Optional[Ganger]:
+        """Look up a member by name, ignoring case as GameState.find_fighter() does."""
+        return self._roster().get(name.casefold())
+
     def add_member(self, ganger: Ganger):
-        """Add a new ganger to the gang."""
+        """
+        Add a new ganger to the gang.
+
+        Raises:
+            ValueError: If the name is taken or the gang already has its Leader or two Champions.
+        """
+        roster = self._roster()
+        key = ganger.name.casefold()
+        if key in roster:
+            raise ValueError(f"Gang {self.name} already has a member named {ganger.name}.")
+        if ganger.role == GangerRole.LEADER and self._role_counts.get(GangerRole.LEADER, 0) >= 1:
+            raise ValueError("Each gang must have exactly one Leader.")
+        if ganger.role == GangerRole.CHAMPION and self._role_counts.get(GangerRole.CHAMPION, 0) >= 2:
+            raise ValueError("A gang can have a maximum of two Champions.")
         self.members.append(ganger)
+        roster[key] = ganger
+        self._role_counts[ganger.role] = self._role_counts.get(ganger.role, 0) + 1
+        self._indexed_count += 1
 
     def remove_member(self, name: str):
-        """Remove a ganger by name."""
-        self.members = [member for member in self.members if member.name != name]
\ No newline at end of file
+        """
+        Remove a ganger by name.
+
+        Raises:
+            ValueError: If the ganger is the gang's Leader.
+        """
+        roster = self._roster()
+        key = name.casefold()
+        member = roster.get(key)
+        if member is None:
+            return
+        if member.role == GangerRole.LEADER:
+            raise ValueError("Each gang must have exactly one Leader.")
+        self.members[:] = [m for m in self.members if m.name.casefold() != key]
+        if self._indexed_count - len(self.members) > 1:
+            # Gangs built with duplicate names lose every member with the name
+            self.reindex_members()
+            return
+        del roster[key]
+        self._role_counts[member.role] -= 1
+        self._indexed_count = len(self.members)
\ No newline at end of file
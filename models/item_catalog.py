@@ -0,0 +1,116 @@
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from .weapon_models import Weapon
+from .armor_models import Armor
+from .item_models import Equipment
+from .validation_context import TRUSTED_CONTEXT
+
+ItemDefinition = Union[Weapon, Armor, Equipment]
+
+# Item definition types by the prefix of their catalog ids
+ITEM_KINDS: Dict[str, Type[ItemDefinition]] = {
+    "weapon": Weapon,
+    "armor": Armor,
+    "equipment": Equipment,
+}
+_KIND_NAMES = {model: kind for kind, model in ITEM_KINDS.items()}
+
+
+def item_id(item: ItemDefinition) -> str:
+    """
+    Get the catalog id of an item definition.
+
+    The id is derived from the item's contents, so identical items always
+    share an id and items that differ in any stat never do.
+
+    Args:
+        item (ItemDefinition): The weapon, armor or equipment.
+
+    Returns:
+        str: The id, e.g. 'weapon:Lasgun:3f9a01c2d4e5b6a7'.
+    """
+    digest = hashlib.blake2b(item.model_dump_json().encode(), digest_size=8).hexdigest()
+    return f"{_KIND_NAMES[type(item)]}:{item.name}:{digest}"
+
+
+class ItemCatalog:
+    """
+    A flyweight catalog of immutable item definitions, keyed by item id.
+
+    Fighters reference the catalog's shared instances instead of holding
+    their own copies, so twenty fighters with lasguns share one Lasgun.
+    Item definitions are frozen models; anything that changes during a
+    game, such as a consumable's remaining uses, stays on the fighter.
+    """
+
+    def __init__(self):
+        """Initialize an empty catalog."""
+        self._items: Dict[str, ItemDefinition] = {}
+        # Ids of the shared instances, by id(instance); _items keeps them alive, so the keys stay valid
+        self._shared: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def get(self, key: str) -> Optional[ItemDefinition]:
+        """Look up an item definition by id."""
+        return self._items.get(key)
+
+    def add(self, item: ItemDefinition) -> str:
+        """
+        Add an item definition, keeping the existing instance if an identical one is present.
+
+        Args:
+            item (ItemDefinition): The weapon, armor or equipment.
+
+        Returns:
+            str: The item's catalog id.
+        """
+        key = self._shared.get(id(item))
+        if key is not None:
+            return key
+        key = item_id(item)
+        if self._items.setdefault(key, item) is item:
+            self._shared[id(item)] = key
+        return key
+
+    def intern(self, item: ItemDefinition) -> ItemDefinition:
+        """Get the catalog's shared instance of an item definition, adding it if needed."""
+        return self._items[self.add(item)]
+
+    def intern_all(self, items: Iterable[ItemDefinition]) -> List[ItemDefinition]:
+        """Get the shared instances of several item definitions."""
+        return [self.intern(item) for item in items]
+
+    def load(self, data: Dict[str, Dict[str, Any]], trusted: bool = False) -> Dict[str, ItemDefinition]:
+        """
+        Validate serialized item definitions and add them to the catalog.
+
+        Each definition is validated once, however many fighters use it, and
+        the catalog's shared instance is returned for it. In trusted mode an
+        id that is already in the catalog is not validated again.
+
+        Args:
+            data (Dict[str, Dict[str, Any]]): Item definitions by the id they were saved under.
+            trusted (bool): Skip the model validators; see serialization.load_game_state().
+
+        Returns:
+            Dict[str, ItemDefinition]: The shared instances, by the ids in `data`.
+        """
+        items = {}
+        for key, body in data.items():
+            if trusted and key in self._items:
+                items[key] = self._items[key]
+                continue
+            model = ITEM_KINDS.get(key.split(":", 1)[0])
+            if model is None:
+                raise ValueError(f"Unknown item kind in catalog id: {key}")
+            items[key] = self.intern(model.model_validate(body, context=TRUSTED_CONTEXT if trusted else None))
+        return items
+
+
+# The process-wide catalog that loaded and newly built items are interned into
+ITEM_CATALOG = ItemCatalog()
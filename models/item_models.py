@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field, PositiveInt, NonNegativeInt
+from pydantic import Field, PositiveInt, NonNegativeInt
 from typing import List, Optional, Annotated
 from enum import Enum
+from .bulk_update import BulkUpdateModel
 
 
 class Rarity(str, Enum):
@@ -10,7 +11,7 @@ class Rarity(str, Enum):
     EXOTIC = "Exotic"
 
 
-class SpecialRule(BaseModel):
+class SpecialRule(BulkUpdateModel):
     """Represents a special rule or effect associated with an item."""
     name: Annotated[str, Field(description="Name of the special rule.")]
     effect: Annotated[Optional[str], Field(description="Description of the rule's effect on gameplay.")]
@@ -30,7 +31,7 @@ class SpecialRule(BaseModel):
     }
 
 
-class Modifier(BaseModel):
+class Modifier(BulkUpdateModel):
     """Represents a stat modifier provided by an item."""
     stat: Annotated[str, Field(description="The stat being modified, e.g., 'Strength', 'Toughness'.")]
     value: Annotated[int, Field(description="The value of the modifier, can be positive or negative.")]
@@ -50,7 +51,7 @@ class Modifier(BaseModel):
     }
 
 
-class Consumable(BaseModel):
+class Consumable(BulkUpdateModel):
     """Represents a consumable item used in battles or campaigns."""
     name: Annotated[str, Field(description="Name of the consumable item (e.g., Stimm-Slug Stash, Medipack).")]
     cost: Annotated[Optional[PositiveInt], Field(description="Credit cost of the consumable.")]
@@ -97,7 +98,7 @@ class Consumable(BaseModel):
     }
 
 
-class Equipment(BaseModel):
+class Equipment(BulkUpdateModel):
     """Represents an equipment item with various gameplay effects."""
     name: Annotated[str, Field(description="Name of the equipment (e.g., Grapnel Launcher, Photo-Visor).")]
     cost: Annotated[Optional[PositiveInt], Field(description="Credit cost of the equipment.")]
@@ -117,6 +118,7 @@ class Equipment(BaseModel):
         return [mod for mod in self.modifiers if mod.stat == stat]
 
     model_config = {
+        "frozen": True,
         "validate_assignment": True,
         "json_schema_extra": {
             "examples": [
@@ -0,0 +1,59 @@
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
+from typing import List, Optional, Dict, Any, Annotated
+from .game_state_models import GameState
+
+
+class GameEvent(BaseModel):
+    """Represents one recorded state-changing action issued to the game logic."""
+    index: Annotated[NonNegativeInt, Field(description="Position of the action in the game's history, starting from 0.")]
+    action: Annotated[str, Field(description="Name of the GameLogic method that was called, e.g., 'attack'.")]
+    args: Annotated[List[Any], Field(default_factory=list, description="Positional arguments of the call.")]
+    kwargs: Annotated[Dict[str, Any], Field(default_factory=dict, description="Keyword arguments of the call.")]
+    round_number: Annotated[PositiveInt, Field(default=1, description="Combat round in progress when the action was issued.")]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "index": 0,
+                    "action": "attack",
+                    "args": ["Crusher", "Venom"],
+                    "kwargs": {},
+                    "round_number": 1
+                }
+            ]
+        }
+    }
+
+
+class ReplayCheckpoint(BaseModel):
+    """A full copy of the game taken before the action at `action_index` was applied."""
+    action_index: Annotated[NonNegativeInt, Field(description="Number of actions applied when the checkpoint was taken.")]
+    game_state: Annotated[GameState, Field(description="Snapshot of the game state at this point.")]
+    dice_state: Annotated[Any, Field(description="State of the game's dice RNG at this point.")]
+    seed: Annotated[Optional[int], Field(default=None, description="Seed of the dice at this point; the log's seed if None.")]
+
+
+class ReplayLog(BaseModel):
+    """The recorded history of a game: its seed, every action and periodic checkpoints."""
+    seed: Annotated[Optional[int], Field(default=None, description="Seed of the game's dice.")]
+    checkpoint_interval: Annotated[PositiveInt, Field(default=20, description="Number of actions between checkpoints.")]
+    events: Annotated[List[GameEvent], Field(default_factory=list, description="Every recorded action, in order.")]
+    checkpoints: Annotated[List[ReplayCheckpoint], Field(default_factory=list, description="Checkpoints ordered by action index.")]
+
+    def checkpoint_due(self) -> bool:
+        """Check whether a checkpoint should be taken before the next action."""
+        return len(self.events) % self.checkpoint_interval == 0
+
+    def nearest_checkpoint(self, action_index: int) -> Optional[ReplayCheckpoint]:
+        """Get the latest checkpoint taken at or before the given action index."""
+        best = None
+        low, high = 0, len(self.checkpoints) - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if self.checkpoints[mid].action_index <= action_index:
+                best = self.checkpoints[mid]
+                low = mid + 1
+            else:
+                high = mid - 1
+        return best
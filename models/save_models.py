@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field, NonNegativeInt
+from typing import List, Optional, Annotated
+from datetime import datetime
+
+
+class SaveSlotInfo(BaseModel):
+    """Index entry describing one saved game slot, readable without loading the save itself."""
+    game_id: Annotated[str, Field(description="Identifier of the game the save belongs to.")]
+    slot: Annotated[str, Field(description="Name or number of the save slot, e.g., 'main' or '3'.")]
+    turn: Annotated[Optional[NonNegativeInt], Field(default=None, description="Turn the game was on when saved.")]
+    gangs: Annotated[List[str], Field(default_factory=list, description="Names of the gangs in the game.")]
+    scenario: Annotated[Optional[str], Field(default=None, description="Name of the scenario being played.")]
+    saved_at: Annotated[datetime, Field(description="When the slot was last written.")]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "game_id": "league-week-3",
+                    "slot": "main",
+                    "turn": 2,
+                    "gangs": ["Goliaths", "Eschers"],
+                    "scenario": "Sector Mechanicus Showdown",
+                    "saved_at": "2024-05-01T19:30:00"
+                }
+            ]
+        }
+    }
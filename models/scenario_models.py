@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
+from pydantic import Field, NonNegativeInt, PositiveInt
 from typing import List, Optional, Union, Dict, Tuple, Annotated
+from .bulk_update import BulkUpdateModel
 
-class ScenarioObjective(BaseModel):
+class ScenarioObjective(BulkUpdateModel):
     """Represents an objective in a scenario that can be completed for rewards."""
     name: Annotated[str, Field(description="Name of the objective.")]
     description: Annotated[Optional[str], Field(description="Detailed description of the objective.")]
@@ -24,7 +25,7 @@ class ScenarioObjective(BaseModel):
         }
     }
 
-class ScenarioSpecialRule(BaseModel):
+class ScenarioSpecialRule(BulkUpdateModel):
     """Represents a special rule that applies to a specific scenario."""
     name: Annotated[str, Field(description="Name of the special rule.")]
     effect: Annotated[Optional[str], Field(description="Description of the rule's effect on gameplay.")]
@@ -41,7 +42,7 @@ class ScenarioSpecialRule(BaseModel):
         }
     }
 
-class ScenarioDeploymentZone(BaseModel):
+class ScenarioDeploymentZone(BulkUpdateModel):
     """Represents a deployment zone in a scenario where gangs can set up."""
     name: Annotated[str, Field(description="Name of the deployment zone.")]
     description: Annotated[Optional[str], Field(description="Detailed description of the zone.")]
@@ -65,7 +66,7 @@ class ScenarioDeploymentZone(BaseModel):
         }
     }
 
-class ScenarioRewards(BaseModel):
+class ScenarioRewards(BulkUpdateModel):
     """Represents the rewards available for completing a scenario."""
     credits: Annotated[NonNegativeInt, Field(default=0, description="Amount of credits awarded")]
     reputation: Annotated[NonNegativeInt, Field(default=0, description="Amount of reputation points gained")]
@@ -84,7 +85,7 @@ class ScenarioRewards(BaseModel):
         }
     }
 
-class Scenario(BaseModel):
+class Scenario(BulkUpdateModel):
     """Represents a complete scenario with all its components."""
     name: Annotated[str, Field(description="Name of the scenario.")]
     description: Annotated[Optional[str], Field(description="Detailed description of the scenario.")]
@@ -0,0 +1,11 @@
+from pydantic import ValidationInfo
+from typing import Any, Dict
+
+# Validation context for data this program wrote itself from valid models, e.g. its own saves.
+# Cross-field model validators skip their checks under it; field types are still enforced.
+TRUSTED_CONTEXT: Dict[str, Any] = {"trusted": True}
+
+
+def is_trusted(info: ValidationInfo) -> bool:
+    """Check whether a model is being validated from trusted data."""
+    return bool(info.context and info.context.get("trusted"))
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field, model_validator, PositiveInt, NonNegativeInt
-from typing import List, Optional, Annotated
+import re
+from functools import cached_property
+from pydantic import BaseModel, Field, model_validator, PositiveInt, NonNegativeInt, ValidationInfo
+from typing import Any, Dict, FrozenSet, List, Optional, Annotated, Tuple
 from enum import Enum
+from .validation_context import is_trusted
 
 
 class WeaponType(str, Enum):
@@ -13,6 +16,10 @@ class WeaponType(str, Enum):
     GRENADE = "Grenade"
 
 
+# A range band in a profile's range text, e.g. 'Short: 0-8'
+_RANGE_BAND = re.compile(r'(\w+):\s*(\d+)\s*-\s*(\d+)')
+
+
 class Rarity(str, Enum):
     COMMON = "Common"
     RARE = "Rare"
@@ -26,6 +33,7 @@ class WeaponTrait(BaseModel):
     description: Annotated[Optional[str], Field(description="A description of the trait and its effect on the weapon or ganger.")]
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -50,13 +58,21 @@ class WeaponProfile(BaseModel):
     traits: Annotated[List[WeaponTrait], Field(default_factory=list, description="Traits or special abilities associated with this profile.")]
 
     @model_validator(mode='after')
-    def validate_range_structure(self) -> 'WeaponProfile':
+    def validate_range_structure(self, info: ValidationInfo) -> 'WeaponProfile':
         """Ensure the range field has a valid structure."""
+        if is_trusted(info):
+            return self
         if not self.range or "Short:" not in self.range or "Long:" not in self.range:
             raise ValueError("Range must specify both short and long ranges, e.g., 'Short: 0-8, Long: 8-24'.")
         return self
 
+    @cached_property
+    def range_bands(self) -> Dict[str, Tuple[int, int]]:
+        """The profile's range bands parsed from its range text, e.g. {'Short': (0, 8), 'Long': (8, 24)}."""
+        return {band: (int(low), int(high)) for band, low, high in _RANGE_BAND.findall(self.range)}
+
     model_config = {
+        "frozen": True,
         "arbitrary_types_allowed": True,
         "json_schema_extra": {
             "examples": [
@@ -88,6 +104,7 @@ class Weapon(BaseModel):
     description: Annotated[Optional[str], Field(description="A detailed description of the weapon.")]
 
     model_config = {
+        "frozen": True,
         "arbitrary_types_allowed": True,
         "json_schema_extra": {
             "examples": [
@@ -117,12 +134,65 @@ class Weapon(BaseModel):
         }
     }
 
+    # Stats derived from the profiles and traits. Weapons are frozen, so each is computed once per instance
+    # and shared by every fighter carrying the same catalog weapon; model_copy() drops them (see below).
+    @cached_property
+    def max_strength(self) -> int:
+        """The highest strength among the weapon's profiles, or 0 without profiles."""
+        return max((profile.strength for profile in self.profiles), default=0)
+
+    @cached_property
+    def max_armor_penetration(self) -> int:
+        """The highest armor penetration among the weapon's profiles, or 0 without profiles."""
+        return max((profile.armor_penetration for profile in self.profiles), default=0)
+
+    @cached_property
+    def max_damage(self) -> int:
+        """The highest damage among the weapon's profiles, or 0 without profiles."""
+        return max((profile.damage for profile in self.profiles), default=0)
+
+    @cached_property
+    def range_modifiers(self) -> Dict[str, int]:
+        """The total hit modifier of the weapon's profiles at each range category ('Short' and 'Long')."""
+        return {
+            "Short": sum(profile.short_range_modifier or 0 for profile in self.profiles),
+            "Long": sum(profile.long_range_modifier or 0 for profile in self.profiles),
+        }
+
+    @cached_property
+    def range_bands(self) -> Dict[str, Tuple[int, int]]:
+        """The widest extent of each range band across the weapon's profiles, e.g. {'Short': (0, 8), 'Long': (8, 24)}."""
+        bands: Dict[str, Tuple[int, int]] = {}
+        for profile in self.profiles:
+            for band, (low, high) in profile.range_bands.items():
+                known = bands.get(band)
+                bands[band] = (low, high) if known is None else (min(known[0], low), max(known[1], high))
+        return bands
+
+    @cached_property
+    def trait_names(self) -> FrozenSet[str]:
+        """The lowercased names of the weapon's traits, for constant-time trait checks."""
+        return frozenset(trait.name.lower() for trait in self.traits)
+
+    def has_trait(self, name: str) -> bool:
+        """Check if the weapon has a trait, ignoring case."""
+        return name.lower() in self.trait_names
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'Weapon':
+        """Copy the weapon, recomputing derived stats for the copy since `update` may change its profiles."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _DERIVED_STATS:
+            copied.__dict__.pop(name, None)
+        return copied
+
     def calculate_effective_damage(self) -> int:
         """Calculate the effective damage of the weapon based on its profiles.
 
         Returns:
             int: The highest damage value among all weapon profiles
         """
-        if not self.profiles:
-            return 0
-        return max(profile.damage for profile in self.profiles)
\ No newline at end of file
+        return self.max_damage
+
+
+# Names of the cached stats on Weapon
+_DERIVED_STATS = tuple(name for name, value in vars(Weapon).items() if isinstance(value, cached_property))
\ No newline at end of file
@@ -0,0 +1,140 @@
+import logging
+from typing import Optional
+from models import GameEvent, ReplayCheckpoint, ReplayLog
+from game_logic import GameLogic, decode_checkpoint
+from database import Database
+from serialization import decode
+
+
+class ReplayEngine:
+    """
+    Rebuild a recorded game at any action or combat round.
+
+    Seeking restores the nearest checkpoint at or before the target and replays
+    only the events recorded since, so random access into a long game costs at
+    most `checkpoint_interval` actions. Moving forward from the last position
+    continues from there instead of going back to a checkpoint.
+
+    A live game keeps only its newest checkpoints in memory; given the game's
+    database, older ones are read from there. from_database() reviews a game
+    from its database alone, e.g. after it has ended.
+    """
+
+    def __init__(self, replay_log: ReplayLog, db: Optional[Database] = None):
+        """
+        Initialize the ReplayEngine.
+
+        Args:
+            replay_log (ReplayLog): The recorded history, usually `game_logic.replay_log`.
+            db (Optional[Database]): The game's database, holding the checkpoints no longer in
+                `replay_log`; also handed to the rebuilt GameLogic instances.
+        """
+        if not replay_log.checkpoints and replay_log.events and db is None:
+            raise ValueError("Replay log has events but no initial checkpoint.")
+        self.replay_log = replay_log
+        self.db = db
+        self._logic: Optional[GameLogic] = None
+        self._checkpoint: Optional[ReplayCheckpoint] = None
+        self._position = 0
+
+    @classmethod
+    def from_database(cls, db: Database) -> "ReplayEngine":
+        """
+        Review a game from the replay log saved in its database; see GameLogic.save_replay().
+
+        Args:
+            db (Database): The game's database.
+        """
+        events = [GameEvent.model_validate(decode(body)) for body in db.load_replay_events()]
+        return cls(ReplayLog(events=events), db)
+
+    @property
+    def length(self) -> int:
+        """Number of recorded actions."""
+        return len(self.replay_log.events)
+
+    @property
+    def position(self) -> int:
+        """Number of actions applied to the game returned by the last seek."""
+        return self._position
+
+    def seek(self, action_index: int) -> GameLogic:
+        """
+        Rebuild the game as it was after the first `action_index` actions.
+
+        The returned GameLogic is the engine's cursor: later seeks move it, so
+        copy its game state before changing anything.
+
+        Args:
+            action_index (int): Number of actions to apply, from 0 to `length`.
+
+        Returns:
+            GameLogic: The game at that point, with recording disabled.
+        """
+        if not 0 <= action_index <= self.length:
+            raise ValueError(f"Action index must be between 0 and {self.length}, got {action_index}.")
+
+        checkpoint = self._nearest_checkpoint(action_index)
+        # A checkpoint may follow a load, so the game is only continued up to one from the checkpoint itself
+        if (self._logic is None or not checkpoint.action_index <= self._position <= action_index
+                or (self._position == checkpoint.action_index and self._checkpoint is not checkpoint)):
+            self._restore(checkpoint)
+
+        for event in self.replay_log.events[self._position:action_index]:
+            self._apply(event)
+        self._position = action_index
+        return self._logic
+
+    def seek_round(self, round_number: int) -> GameLogic:
+        """
+        Rebuild the game at the start of a combat round.
+
+        Args:
+            round_number (int): The combat round to jump to.
+
+        Returns:
+            GameLogic: The game just before the first action issued in that round.
+        """
+        # Rounds only move forward, so the first event issued in the round marks its start.
+        for event in self.replay_log.events:
+            if event.round_number == round_number:
+                return self.seek(event.index)
+        final = self.seek(self.length)
+        current_round = final.get_current_combat_round()
+        if current_round and current_round.round_number == round_number:
+            return final
+        raise ValueError(f"Round {round_number} was not reached in this game.")
+
+    def _nearest_checkpoint(self, action_index: int) -> ReplayCheckpoint:
+        """The latest checkpoint at or before `action_index`, from memory or else from the database."""
+        checkpoint = self.replay_log.nearest_checkpoint(action_index)
+        if checkpoint is None and self.db is not None:
+            stored = self.db.load_replay_checkpoints(limit=1, before=action_index)
+            if stored:
+                # Reuse the cursor's checkpoint rather than decoding the same one again
+                current = self._checkpoint
+                checkpoint = (current if current is not None and current.action_index == stored[0][0]
+                              else decode_checkpoint(*stored[0]))
+        if checkpoint is None:
+            raise ValueError("Nothing has been recorded yet." if not self.length
+                             else f"No checkpoint at or before action {action_index}; pass the game's database.")
+        return checkpoint
+
+    def _restore(self, checkpoint: ReplayCheckpoint) -> None:
+        """Reset the cursor to a checkpoint."""
+        seed = checkpoint.seed if checkpoint.seed is not None else self.replay_log.seed
+        logic = GameLogic(self.db, seed=seed, game_state=checkpoint.game_state.model_copy(deep=True))
+        logic.d20.setstate(checkpoint.dice_state)
+        logic._recording = False
+        self._logic = logic
+        self._checkpoint = checkpoint
+        self._position = checkpoint.action_index
+        logging.debug(f"Replay restored checkpoint at action {checkpoint.action_index}")
+
+    def _apply(self, event: GameEvent) -> None:
+        """Re-issue a recorded action against the cursor."""
+        try:
+            getattr(self._logic, event.action)(*event.args, **event.kwargs)
+        except ValueError as e:
+            # The action failed the same way when it was first issued.
+            logging.debug(f"Replayed action {event.index} ({event.action}) raised: {e}")
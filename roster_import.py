@@ -0,0 +1,179 @@
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from pydantic import ValidationError
+from gang_builder import ItemCache, build_ganger
+from models import Ganger
+from models.item_catalog import ITEM_CATALOG
+from serialization import decode
+
+# Roster file formats by file extension
+ROSTER_FORMATS = {'.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv'}
+# CSV columns holding JSON, since a CSV cell can't hold a list or an object
+JSON_COLUMNS = ('weapons', 'equipment', 'skills', 'special_rules', 'armor')
+# Rows sent to a worker process at a time when importing in parallel
+DEFAULT_BATCH_SIZE = 100
+
+# A row as read from a roster file: (line number, the row's data or None, why it couldn't be read or None)
+RosterRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+class RosterImport:
+    """The fighters built from a roster file and the rows that could not be imported."""
+
+    def __init__(self):
+        self.members: List[Tuple[int, str, Ganger]] = []  # (line number, gang name, fighter)
+        self.errors: List[Tuple[int, str]] = []  # (line number, message)
+
+    @property
+    def rows(self) -> int:
+        """The number of rows read."""
+        return len(self.members) + len(self.errors)
+
+
+def roster_format(path: str) -> str:
+    """Get a roster file's format ('jsonl' or 'csv') from its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ROSTER_FORMATS:
+        raise ValueError(f"Unknown roster format: {extension or path}. Use one of: {', '.join(ROSTER_FORMATS)}")
+    return ROSTER_FORMATS[extension]
+
+
+def read_roster(file: TextIO, format: str) -> Iterator[RosterRow]:
+    """
+    Stream the rows of a roster file.
+
+    Each row is one fighter, with a 'gang' field naming the fighter's gang
+    and the fields of gang_builder.GangerInput. In CSV files the weapons,
+    equipment, skills, special_rules and armor columns hold JSON, and
+    empty cells are left out.
+
+    Args:
+        file (TextIO): The roster file, opened for reading (CSV files with newline='').
+        format (str): 'jsonl' or 'csv'.
+
+    Returns:
+        Iterator[RosterRow]: Each row's line number with its data, or with the reason it couldn't be read.
+    """
+    if format == 'jsonl':
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                data = decode(line)
+            except ValueError as e:
+                yield line_number, None, f"Invalid JSON: {e}"
+                continue
+            if isinstance(data, dict):
+                yield line_number, data, None
+            else:
+                yield line_number, None, "Row is not a JSON object"
+    elif format == 'csv':
+        reader = csv.DictReader(file)
+        for row in reader:
+            data: Dict[str, Any] = {key: value for key, value in row.items() if key and value not in ("", None)}
+            try:
+                for column in JSON_COLUMNS:
+                    if column in data:
+                        data[column] = decode(data[column])
+            except ValueError as e:
+                yield reader.line_num, None, f"Invalid JSON in column '{column}': {e}"
+                continue
+            yield reader.line_num, data, None
+    else:
+        raise ValueError(f"Unknown roster format: {format}. Use one of: jsonl, csv")
+
+
+def describe_error(error: ValueError) -> str:
+    """A one-line description of why a row is invalid."""
+    if isinstance(error, ValidationError):
+        return "; ".join(f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}" for e in error.errors())
+    return str(error)
+
+
+def share_items(member: Ganger) -> None:
+    """Swap a fighter's items for the shared instances in the item catalog."""
+    member.weapons = ITEM_CATALOG.intern_all(member.weapons)
+    member.equipment = ITEM_CATALOG.intern_all(member.equipment)
+    member.armor = ITEM_CATALOG.intern(member.armor) if member.armor is not None else None
+
+
+def _build_rows(rows: Iterable[RosterRow]) -> List[Tuple[int, Optional[str], Optional[Ganger], Optional[str]]]:
+    """Build the fighters for some rows: (line number, gang, fighter, error) each, sharing one item cache."""
+    cache = ItemCache()
+    built = []
+    for line_number, data, error in rows:
+        if data is not None:
+            gang = data.get("gang")
+            if not isinstance(gang, str) or not gang.strip():
+                error = "Row has no gang"
+            else:
+                try:
+                    built.append((line_number, gang.strip(), build_ganger(data, cache), None))
+                    continue
+                except ValueError as e:
+                    error = describe_error(e)
+        built.append((line_number, None, None, error))
+    return built
+
+
+def _batches(rows: Iterable[RosterRow], batch_size: int) -> Iterator[List[RosterRow]]:
+    batch: List[RosterRow] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_roster(rows: Iterable[RosterRow], workers: int = 0, batch_size: int = DEFAULT_BATCH_SIZE) -> RosterImport:
+    """
+    Validate roster rows and build their fighters.
+
+    Each row is validated once against GangerInput and built straight into
+    game models. Items that repeat across rows, such as a gang's standard
+    lasgun, are validated and built once and then shared. A row that fails
+    is reported with its line number and doesn't stop the import.
+
+    Args:
+        rows (Iterable[RosterRow]): Rows from read_roster().
+        workers (int): Worker processes to validate in, at most one per CPU; 0 or 1 validates in this
+            process. Worth it only for very large rosters, since every fighter is pickled back.
+        batch_size (int): Rows sent to a worker at a time.
+
+    Returns:
+        RosterImport: The fighters built and the rows that failed.
+    """
+    result = RosterImport()
+    # More processes than cores only adds start-up and pickling costs
+    workers = min(workers, os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            built = [row for batch in executor.map(_build_rows, _batches(rows, batch_size)) for row in batch]
+    else:
+        built = _build_rows(rows)
+
+    for line_number, gang, member, error in built:
+        if member is None:
+            result.errors.append((line_number, error))
+            continue
+        if workers > 1:
+            # Fighters from workers carry copies of the item definitions; share this process's instead
+            share_items(member)
+        result.members.append((line_number, gang, member))
+    return result
+
+
+def import_roster_file(path: str, workers: int = 0) -> RosterImport:
+    """
+    Read a roster file and build its fighters; see read_roster() and import_roster().
+
+    Raises:
+        ValueError: If the file's extension isn't a known roster format.
+    """
+    format = roster_format(path)
+    with open(path, newline='' if format == 'csv' else None) as file:
+        return import_roster(read_roster(file, format), workers=workers)
@@ -0,0 +1,171 @@
+import json
+import lzma
+import zlib
+from typing import Any, Callable, Dict, Tuple, Union
+from models import GameState
+from models.item_catalog import ITEM_CATALOG, ItemDefinition
+from models.validation_context import TRUSTED_CONTEXT
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library codec is used without it
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# Key of the saved item definitions in a dumped game state
+ITEM_CATALOG_KEY = 'item_catalog'
+# Fighter fields holding item definitions, which saves store once in the item catalog
+_EXCLUDE_MEMBER_ITEMS = {"gangs": {"__all__": {"members": {"__all__": {"weapons", "armor", "equipment"}}}}}
+
+# Standard library compression codecs by name: (compress, decompress)
+CODECS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+
+
+def encode(value: Any) -> str:
+    """
+    Encode plain data (dicts, lists, strings, numbers) as compact JSON.
+
+    Uses orjson when it is installed and falls back to the standard library
+    for anything orjson rejects, such as integers wider than 64 bits.
+
+    Args:
+        value (Any): The data to encode.
+
+    Returns:
+        str: The JSON text.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(',', ':'))
+
+
+def decode(data: Union[str, bytes]) -> Any:
+    """
+    Decode JSON text produced by encode().
+
+    Args:
+        data (Union[str, bytes]): The JSON text.
+
+    Returns:
+        Any: The decoded data.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_game_state(game_state: GameState) -> Dict[str, Any]:
+    """
+    Convert a game state into plain JSON-compatible data for saving.
+
+    Weapons, armor and equipment are written once each under the
+    'item_catalog' key, and fighters refer to them by catalog id, so the
+    size of a save grows with the number of distinct items, not fighters.
+
+    Args:
+        game_state (GameState): The game state to convert.
+
+    Returns:
+        Dict[str, Any]: The game state as plain data.
+    """
+    data = game_state.model_dump(mode="json", exclude=_EXCLUDE_MEMBER_ITEMS)
+    items: Dict[str, ItemDefinition] = {}
+
+    def ref(item: ItemDefinition) -> str:
+        key = ITEM_CATALOG.add(item)
+        items.setdefault(key, item)
+        return key
+
+    for gang, gang_data in zip(game_state.gangs, data["gangs"]):
+        for member, member_data in zip(gang.members, gang_data["members"]):
+            member_data["weapons"] = [ref(weapon) for weapon in member.weapons]
+            member_data["armor"] = ref(member.armor) if member.armor is not None else None
+            member_data["equipment"] = [ref(item) for item in member.equipment]
+    data[ITEM_CATALOG_KEY] = {key: item.model_dump(mode="json") for key, item in items.items()}
+    return data
+
+
+def _resolve_items(data: Dict[str, Any], items: Dict[str, ItemDefinition]) -> Dict[str, Any]:
+    """Replace the catalog ids in a dumped game state with the shared item definitions, without changing `data`."""
+    def resolve(key: str) -> ItemDefinition:
+        if key not in items:
+            raise ValueError(f"Saved game refers to an item missing from its catalog: {key}")
+        return items[key]
+
+    def resolve_member(member: Dict[str, Any]) -> Dict[str, Any]:
+        armor = member.get("armor")
+        return {
+            **member,
+            "weapons": [resolve(key) for key in member.get("weapons", [])],
+            "armor": resolve(armor) if isinstance(armor, str) else armor,
+            "equipment": [resolve(key) for key in member.get("equipment", [])],
+        }
+
+    data = {key: value for key, value in data.items() if key != ITEM_CATALOG_KEY}
+    data["gangs"] = [
+        {**gang, "members": [resolve_member(member) for member in gang.get("members", [])]}
+        for gang in data.get("gangs", [])
+    ]
+    return data
+
+
+def load_game_state(data: Dict[str, Any], trusted: bool = False) -> GameState:
+    """
+    Rebuild a game state from data produced by dump_game_state().
+
+    In trusted mode field types are still checked by pydantic, but the
+    cross-field model validators (gang composition, tile bounds, weapon range
+    format, active gang index) are skipped. On large games these are the only
+    part of loading written in Python.
+
+    Item definitions are validated once each and shared by every fighter
+    that carries them. Game states saved before the item catalog existed,
+    with items embedded in each fighter, are loaded too.
+
+    Args:
+        data (Dict[str, Any]): The saved game state.
+        trusted (bool): Skip the model validators. Only use this for data we
+            wrote ourselves from a valid game.
+
+    Returns:
+        GameState: The game state.
+    """
+    context = TRUSTED_CONTEXT if trusted else None
+    catalog = data.get(ITEM_CATALOG_KEY)
+    if catalog is not None:
+        return GameState.model_validate(_resolve_items(data, ITEM_CATALOG.load(catalog, trusted=trusted)),
+                                        context=context)
+
+    game_state = GameState.model_validate(data, context=context)
+    for gang in game_state.gangs:
+        for member in gang.members:
+            member.weapons = ITEM_CATALOG.intern_all(member.weapons)
+            member.armor = ITEM_CATALOG.intern(member.armor) if member.armor is not None else None
+            member.equipment = ITEM_CATALOG.intern_all(member.equipment)
+    return game_state
+
+
+def dump_game_state_json(game_state: GameState) -> bytes:
+    """Serialize a game state straight to JSON bytes, with items embedded in each fighter."""
+    return game_state.model_dump_json().encode()
+
+
+def load_game_state_json(data: Union[str, bytes], trusted: bool = False) -> GameState:
+    """
+    Rebuild a game state from JSON produced by dump_game_state_json().
+
+    Args:
+        data (Union[str, bytes]): The JSON text.
+        trusted (bool): Skip validation; see load_game_state().
+
+    Returns:
+        GameState: The game state.
+    """
+    return GameState.model_validate_json(data, context=TRUSTED_CONTEXT if trusted else None)
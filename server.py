@@ -0,0 +1,178 @@
+import asyncio
+import json
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from models import Scenario
+from session_manager import SessionManager, GameSession, GAMES_DIR, DEFAULT_MAX_RESIDENT
+
+
+class GameServer:
+    """
+    Host many games in one asyncio process.
+
+    Clients send one command per line as '<game_id> <command>'. Games are
+    created (or loaded from their save slot) on first use, commands for the
+    same game run one at a time under that game's lock, and saves and loads
+    are handed to a single writer thread so the event loop never waits on
+    disk. Only the most recently used games stay in memory; the
+    SessionManager pages idle games out to the games database and back in on
+    their next command.
+    Commands that read files on the server, such as import_roster, are
+    refused.
+
+    Server-level commands:
+        games                 List hosted games and which of them are in memory
+        <game_id> save        Save the game without blocking other games
+        <game_id> close       Save the game and page it out of memory
+    """
+
+    def __init__(self, games_dir: str = GAMES_DIR, scenario_factory: Optional[Callable[[], Scenario]] = None,
+                 max_resident: int = DEFAULT_MAX_RESIDENT):
+        """
+        Initialize the GameServer.
+
+        Args:
+            games_dir (str): Directory holding the shared games database.
+            scenario_factory (Optional[Callable[[], Scenario]]): Builds the scenario for new games.
+            max_resident (int): Maximum number of games kept in memory; idle games are paged to disk.
+        """
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-save")
+        self.sessions = SessionManager(
+            games_dir=games_dir,
+            max_resident=max_resident,
+            scenario_factory=scenario_factory,
+            write=lambda db, snapshot: self._writer.submit(db.save_game_state, snapshot)
+        )
+        # Games being paged in on the writer thread, so concurrent commands for one game share the load
+        self._loading: Dict[str, "asyncio.Task[GameSession]"] = {}
+        logging.info("GameServer initialized")
+
+    async def save(self, session: GameSession) -> None:
+        """Snapshot a game under its lock and wait for the writer thread to store it."""
+        async with session.lock:
+            future = self.sessions.persist(session)
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+    async def session(self, game_id: str) -> GameSession:
+        """
+        Get a hosted game, paging it in on the writer thread if it is not in memory.
+
+        Loading after the writer's queued saves also means a game closed a
+        moment ago is read back as it was saved.
+
+        Raises:
+            ValueError: If the game id is invalid.
+        """
+        session = self.sessions.resident(game_id)
+        if session is not None:
+            return session
+        loading = self._loading.get(game_id)
+        if loading is None:
+            loading = asyncio.ensure_future(self._page_in(game_id))
+            self._loading[game_id] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(game_id, None))
+        return await loading
+
+    async def _page_in(self, game_id: str) -> GameSession:
+        """Load a game on the writer thread and make it resident."""
+        game_logic = await asyncio.get_running_loop().run_in_executor(self._writer, self.sessions.load, game_id)
+        return self.sessions.add(game_id, game_logic)
+
+    async def handle_line(self, line: str) -> Dict[str, Any]:
+        """
+        Execute one protocol line.
+
+        Args:
+            line (str): '<game_id> <command>' or a server-level command.
+
+        Returns:
+            Dict[str, Any]: The response to send back to the client.
+        """
+        parts = line.strip().split(maxsplit=1)
+        if not parts:
+            return {"error": "Empty command"}
+        if parts[0].lower() == 'games':
+            return {"games": self.sessions.known_games(), "resident": self.sessions.resident_games}
+        if len(parts) < 2:
+            return {"error": "Use: <game_id> <command>"}
+
+        game_id, command = parts
+        try:
+            session = await self.session(game_id)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        action = command.split()[0].lower()
+        if action == 'save':
+            await self.save(session)
+            return {"game": game_id, "command": command, "output": "Game state saved.\n"}
+        if action == 'close':
+            async with session.lock:
+                future = self.sessions.close(game_id)
+            if future is not None:
+                await asyncio.wrap_future(future)
+            return {"game": game_id, "command": command, "output": "Game saved and closed.\n"}
+
+        async with session.lock:
+            output = session.execute(command)
+        return {"game": game_id, "command": command, "output": output}
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one socket connection until it disconnects or sends 'quit'."""
+        try:
+            while line := await reader.readline():
+                text = line.decode().strip()
+                if text.lower() == 'quit':
+                    break
+                if not text:
+                    continue
+                response = await self.handle_line(text)
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+        except ConnectionError as e:
+            logging.warning(f"Client connection error: {e}")
+        finally:
+            writer.close()
+
+    async def serve_unix(self, socket_path: str) -> None:
+        """
+        Accept clients on a local Unix socket until cancelled.
+
+        Args:
+            socket_path (str): Filesystem path of the socket.
+        """
+        server = await asyncio.start_unix_server(self.handle_client, path=socket_path)
+        logging.info(f"GameServer listening on {socket_path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+    async def serve_stdio(self) -> None:
+        """Read protocol lines from stdin and write JSON responses to stdout until EOF or 'quit'."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        try:
+            while line := await reader.readline():
+                text = line.decode().strip()
+                if text.lower() == 'quit':
+                    break
+                if not text:
+                    continue
+                response = await self.handle_line(text)
+                sys.stdout.write(json.dumps(response) + "\n")
+                sys.stdout.flush()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Save every loaded game and stop the writer thread once all writes are done."""
+        self.sessions.flush()
+        self._writer.shutdown(wait=True)
+        self.sessions.shutdown()
+        logging.info("GameServer closed")
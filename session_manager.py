@@ -0,0 +1,251 @@
+import asyncio
+import io
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+from rich.console import Console
+from database import Database
+from game_logic import GameLogic
+from models import Scenario
+from user_interface import UserInterface
+
+GAMES_DIR = 'data/games'
+GAMES_DB_FILE = 'games.db'
+DEFAULT_MAX_RESIDENT = 64
+SESSION_CONSOLE_WIDTH = 120
+GAME_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+class GameSession:
+    """A hosted game: its logic, a UserInterface rendering to plain text without file commands, and a per-game lock."""
+
+    def __init__(self, game_id: str, game_logic: GameLogic):
+        """
+        Initialize the GameSession.
+
+        Args:
+            game_id (str): Identifier of the game.
+            game_logic (GameLogic): The game logic instance for this game.
+        """
+        self.game_id = game_id
+        self.game_logic = game_logic
+        self.output = io.StringIO()
+        console = Console(file=self.output, color_system=None, force_terminal=False, width=SESSION_CONSOLE_WIDTH)
+        # Commands come from remote clients, who mustn't read files on the server
+        self.ui = UserInterface(console, game_logic, allow_file_commands=False)
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+    def execute(self, command: str) -> str:
+        """
+        Run one command through the UserInterface and return what it printed.
+
+        Args:
+            command (str): The command line, e.g. 'attack Crusher Venom'.
+
+        Returns:
+            str: The plain-text output of the command.
+        """
+        self.last_used = time.monotonic()
+        self.ui.process_command(command)
+        text = self.output.getvalue()
+        self.output.seek(0)
+        self.output.truncate()
+        return text
+
+
+class SessionManager:
+    """
+    Keep recently used games in memory and page the rest out to disk.
+
+    At most `max_resident` games stay loaded. Opening another one evicts the
+    least recently used game: its snapshot is written to the game's main save
+    slot and the GameLogic is dropped. The next command for an evicted game loads
+    it back transparently, dice and all.
+    """
+
+    def __init__(self, games_dir: str = GAMES_DIR, max_resident: int = DEFAULT_MAX_RESIDENT,
+                 scenario_factory: Optional[Callable[[], Scenario]] = None,
+                 write: Optional[Callable[[Database, Dict[str, Any]], Optional[Future]]] = None):
+        """
+        Initialize the SessionManager.
+
+        Args:
+            games_dir (str): Directory holding the shared games database.
+            max_resident (int): Maximum number of games kept in memory.
+            scenario_factory (Optional[Callable[[], Scenario]]): Builds the scenario for new games.
+            write (Optional[Callable]): Persists a snapshot; may return a Future to write in the
+                background. Defaults to a synchronous Database.save_game_state call.
+        """
+        if max_resident < 1:
+            raise ValueError("max_resident must be at least 1")
+        self.games_dir = games_dir
+        self.max_resident = max_resident
+        self.scenario_factory = scenario_factory
+        self._write = write or (lambda db, snapshot: db.save_game_state(snapshot))
+        self._resident: "OrderedDict[str, GameSession]" = OrderedDict()
+        # Snapshots handed to a background writer that has not finished yet
+        self._outgoing: Dict[str, Dict[str, Any]] = {}
+        # Writer threads remove their snapshots from _outgoing when done
+        self._outgoing_lock = threading.Lock()
+        os.makedirs(self.games_dir, exist_ok=True)
+        # One connection to the games database, shared by every game's handle
+        self.db = Database(os.path.join(self.games_dir, GAMES_DB_FILE))
+
+    def database_for(self, game_id: str) -> Database:
+        """Get the Database handle for a game's save slots in the shared games database."""
+        return self.db.for_game(game_id)
+
+    @property
+    def resident_games(self) -> List[str]:
+        """Games currently in memory, least recently used first."""
+        return list(self._resident)
+
+    def known_games(self) -> List[str]:
+        """All games, whether in memory or paged out to disk."""
+        on_disk = set(self.db.list_games())
+        with self._outgoing_lock:
+            outgoing = set(self._outgoing)
+        return sorted(on_disk | set(self._resident) | outgoing)
+
+    def is_resident(self, game_id: str) -> bool:
+        """Check whether a game is loaded in memory."""
+        return game_id in self._resident
+
+    def get(self, game_id: str) -> GameSession:
+        """
+        Get a game, reloading or starting it if it is not in memory.
+
+        Args:
+            game_id (str): Identifier of the game.
+
+        Returns:
+            GameSession: The session for the game, now the most recently used.
+        """
+        session = self.resident(game_id)
+        if session is None:
+            session = self.add(game_id, self.load(game_id))
+        return session
+
+    def resident(self, game_id: str) -> Optional[GameSession]:
+        """Get a game if it is in memory, making it the most recently used; None otherwise."""
+        session = self._resident.get(game_id)
+        if session:
+            self._resident.move_to_end(game_id)
+        return session
+
+    def load(self, game_id: str) -> GameLogic:
+        """
+        Rebuild a game from its snapshot, or start a new one, without adding it to the resident games.
+
+        This only reads the games database, so a server can run it on its
+        writer thread and add the result with add().
+
+        Raises:
+            ValueError: If the game id is invalid.
+        """
+        if not GAME_ID_PATTERN.match(game_id):
+            raise ValueError(f"Invalid game id: {game_id}")
+        db = self.database_for(game_id)
+        with self._outgoing_lock:
+            snapshot = self._outgoing.get(game_id)
+        if snapshot is None:
+            snapshot = db.load_game_state()
+        if snapshot:
+            if "game_state" not in snapshot:
+                # A plain game state, e.g. restored from an old single-save backup
+                snapshot = {"game_state": snapshot}
+            logging.info(f"Paged in game {game_id}")
+            # Paged-out snapshots were written by this server from valid games
+            return GameLogic.from_snapshot(db, snapshot, trusted=True)
+
+        game_logic = GameLogic(db)
+        if self.scenario_factory:
+            game_logic.game_state.scenario = self.scenario_factory()
+        logging.info(f"Started new game {game_id}")
+        return game_logic
+
+    def add(self, game_id: str, game_logic: GameLogic) -> GameSession:
+        """
+        Make a game loaded by load() resident, paging out others if over budget.
+
+        If the game was made resident in the meantime, that session is kept.
+
+        Returns:
+            GameSession: The session for the game, now the most recently used.
+        """
+        session = self.resident(game_id)
+        if session is None:
+            session = GameSession(game_id, game_logic)
+            self._resident[game_id] = session
+            self._evict_over_budget()
+        return session
+
+    def _evict_over_budget(self) -> None:
+        """Page out least recently used games until the budget is met."""
+        for game_id in list(self._resident):
+            if len(self._resident) <= self.max_resident:
+                break
+            if self._resident[game_id].lock.locked():
+                continue
+            self.evict(game_id)
+
+    def evict(self, game_id: str) -> Optional[Future]:
+        """
+        Write a game's snapshot and drop it from memory.
+
+        Args:
+            game_id (str): Identifier of the game to page out.
+
+        Returns:
+            Optional[Future]: The pending background write, if the writer is asynchronous.
+        """
+        session = self._resident.pop(game_id)
+        future = self.persist(session)
+        logging.info(f"Paged out game {game_id}")
+        return future
+
+    def persist(self, session: GameSession) -> Optional[Future]:
+        """
+        Write a game's snapshot and the rest of its replay log without evicting it.
+
+        Returns:
+            Optional[Future]: The pending background write, if the writer is asynchronous.
+        """
+        snapshot = session.game_logic.snapshot()
+        # The actions since the last replay checkpoint; a few small rows, so written right away
+        session.game_logic.save_replay()
+        future = self._write(session.game_logic.db, snapshot)
+        if isinstance(future, Future):
+            game_id = session.game_id
+            with self._outgoing_lock:
+                self._outgoing[game_id] = snapshot
+
+            def written(_: Future) -> None:
+                # Runs on the writer thread; a newer snapshot of the game must stay
+                with self._outgoing_lock:
+                    if self._outgoing.get(game_id) is snapshot:
+                        del self._outgoing[game_id]
+
+            future.add_done_callback(written)
+        return future
+
+    def close(self, game_id: str) -> Optional[Future]:
+        """Page out a game if it is loaded."""
+        if game_id in self._resident:
+            return self.evict(game_id)
+        return None
+
+    def flush(self) -> None:
+        """Write snapshots of every loaded game, keeping them in memory."""
+        for session in list(self._resident.values()):
+            self.persist(session)
+
+    def shutdown(self) -> None:
+        """Commit outstanding writes and close the games database; call once all writes are done."""
+        self.db.close()
@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import unittest
+from archive import GameArchive
+from database import Database
+from game_logic import GameLogic
+
+
+class TestGameArchive(unittest.TestCase):
+    """Test the append-only campaign archive."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "season.arc")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_random_access_across_tables(self):
+        with GameArchive(self.path, table_capacity=3) as archive:
+            for n in range(10):
+                archive.append(f"game-{n}", {"turn": n})
+            self.assertEqual(archive.get("game-4"), {"turn": 4})
+
+        # Reopening reads the chained offset tables, not the games
+        with GameArchive(self.path) as archive:
+            self.assertEqual(archive.table_capacity, 3)
+            self.assertEqual(len(archive), 10)
+            self.assertEqual(archive.get("game-9"), {"turn": 9})
+            self.assertIsNone(archive.get("game-10"))
+            self.assertIn("game-0", archive)
+            self.assertEqual(sorted(archive.ids()), sorted(f"game-{n}" for n in range(10)))
+
+            # Archiving an id again appends a new record that replaces the old one
+            archive.append("game-2", {"turn": 20})
+            self.assertEqual(archive.get("game-2"), {"turn": 20})
+        with GameArchive(self.path) as archive:
+            self.assertEqual(len(archive), 10)
+            self.assertEqual(archive.get("game-2"), {"turn": 20})
+
+    def test_corruption_and_bad_files(self):
+        with GameArchive(self.path) as archive:
+            archive.append("game", {"event_log": ["A long game"] * 10})
+        with open(self.path, "r+b") as file:
+            file.seek(-3, os.SEEK_END)
+            file.write(b"xyz")
+        with GameArchive(self.path) as archive, self.assertRaises(ValueError):
+            archive.get("game")
+
+        not_archive = os.path.join(self.tmp_dir, "notes.txt")
+        with open(not_archive, "w") as file:
+            file.write("This is not an archive at all")
+        with self.assertRaises(ValueError):
+            GameArchive(not_archive)
+
+    def test_database_archive_and_export(self):
+        db = Database(os.path.join(self.tmp_dir, "game.db"))
+        try:
+            snapshot = GameLogic(db, seed=3).snapshot()
+            db.save_game_state(snapshot, game_id="final-1")
+            db.save_game_state({"turn": 7}, game_id="final-2")
+
+            self.assertTrue(db.archive_game(self.path, game_id="final-1", delete=True))
+            self.assertIsNone(db.load_game_state(game_id="final-1"))
+            self.assertFalse(db.archive_game(self.path, game_id="missing"))
+            self.assertEqual(db.export_archive(self.path), 1)
+
+            self.assertEqual(db.load_archived_game(self.path, "final-2"), {"turn": 7})
+            self.assertTrue(db.restore_archived_game(self.path, "final-1"))
+            self.assertEqual(db.load_game_state(game_id="final-1")["game_state"], snapshot["game_state"])
+            self.assertIsNone(db.load_archived_game(os.path.join(self.tmp_dir, "none.arc"), "final-1"))
+        finally:
+            db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
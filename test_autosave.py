@@ -0,0 +1,133 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from rich.console import Console
+from autosave import Autosaver, BackgroundAutosaver, diff_state, apply_delta
+from database import Database
+from game_logic import GameLogic
+from serialization import encode, decode
+from user_interface import UserInterface
+
+
+class TestAutosave(unittest.TestCase):
+    """Test compressed, delta-encoded autosaves."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = Database(os.path.join(self.tmp_dir, "game.db"))
+        self.game_logic = GameLogic(self.db, seed=5)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def play(self, actions: int) -> None:
+        for i in range(actions):
+            if i % 2:
+                self.game_logic.end_fighter_activation()
+            else:
+                self.game_logic.attack("Crusher", "Venom")
+
+    def test_diff_and_apply(self):
+        old = {"a": 1, "b": [1, 2, 3], "c": {"x": True}, "gone": 0}
+        new = {"a": 1, "b": [1, 5, 3, 4], "c": {"x": 1}, "d": None}
+        delta = decode(encode(diff_state(old, new)))
+        self.assertEqual(apply_delta(old, delta), new)
+        self.assertEqual(apply_delta(new, diff_state(new, {"b": [1]})), {"b": [1]})
+        self.assertIsNone(diff_state(old, dict(old)))
+
+    def test_full_snapshot_every_n_saves(self):
+        self.game_logic.autosaver = Autosaver(self.db, full_every=4)
+        self.play(10)
+
+        chain = self.db.load_autosave_chain()
+        self.assertEqual([is_full for _, is_full, _, _ in chain], [True, False])
+        # Entries before the newest full snapshot are dropped
+        self.assertEqual(chain[0][0], 8)
+
+        latest = self.game_logic.autosaver.load_latest()
+        self.assertEqual(latest["game_state"], self.game_logic.snapshot()["game_state"])
+
+    def test_failed_actions_are_not_saved(self):
+        self.game_logic.autosaver = Autosaver(self.db)
+        with self.assertRaises(ValueError):
+            self.game_logic.use_consumable("Nobody", "Stimm")
+        self.assertEqual(self.db.load_autosave_chain(), [])
+        self.game_logic.move_fighter("Crusher", 1, 1)
+        self.assertEqual(len(self.db.load_autosave_chain()), 1)
+
+    def test_deltas_are_much_smaller_than_snapshots(self):
+        autosaver = Autosaver(self.db)
+        full_size = autosaver.save(self.game_logic.snapshot())
+        self.game_logic.move_fighter("Crusher", 1, 1)
+        move_size = autosaver.save(self.game_logic.snapshot())
+        # Rolling dice only changes the dice's draw count, not a whole generator state
+        self.game_logic.attack("Crusher", "Venom")
+        attack_size = autosaver.save(self.game_logic.snapshot())
+
+        self.assertLess(move_size * 10, full_size)
+        self.assertLess(attack_size * 10, full_size)
+        self.assertGreater(len(encode(self.game_logic.snapshot())), full_size * 5)
+        self.assertEqual(autosaver.save(self.game_logic.snapshot()), 0)
+
+    def test_resume_continues_log(self):
+        self.game_logic.autosaver = Autosaver(self.db, full_every=3)
+        self.play(4)
+        expected = self.game_logic.snapshot()
+
+        resumed = GameLogic(self.db, seed=99)
+        resumed.restore(Autosaver(self.db).load_latest(), trusted=True)
+        self.assertEqual(resumed.snapshot()["game_state"], expected["game_state"])
+
+        # A new session's autosaver carries on after the existing entries
+        resumed.autosaver = Autosaver(self.db, full_every=3)
+        resumed.end_fighter_activation()
+        self.assertEqual(self.db.last_autosave_sequence(), 4)
+        self.assertEqual(resumed.autosaver.load_latest()["game_state"], resumed.snapshot()["game_state"])
+
+    def test_resume_command_with_a_downed_fighter(self):
+        self.game_logic.autosaver = Autosaver(self.db)
+        self.game_logic.move_fighter("Crusher", 1, 1)
+        self.game_logic.game_state.get_fighter("Venom").wounds = 0  # As resolve_combat leaves a fighter taken down
+        self.game_logic.end_fighter_activation()
+        expected = self.game_logic.snapshot()
+
+        output = io.StringIO()
+        resumed = GameLogic(self.db, seed=99)
+        UserInterface(Console(file=output, color_system=None, width=120), resumed).process_command("resume")
+        self.assertIn("Game resumed", output.getvalue())
+        self.assertEqual(resumed.game_state.get_fighter("Venom").wounds, 0)
+        self.assertEqual(resumed.snapshot(), expected)
+
+    def test_background_autosaver_coalesces_bursts(self):
+        # A long delay keeps every save of the burst pending until the flush
+        autosaver = BackgroundAutosaver(self.db, delay=60)
+        self.game_logic.autosaver = autosaver
+        self.play(10)
+        autosaver.flush()
+
+        self.assertEqual(autosaver.writes, 1)
+        self.assertEqual(autosaver.coalesced, 9)
+        self.assertEqual(autosaver.load_latest()["game_state"], self.game_logic.snapshot()["game_state"])
+
+        autosaver.close()
+        with self.assertRaises(ValueError):
+            autosaver.save(self.game_logic.snapshot())
+
+    def test_background_autosaver_writes_after_delay(self):
+        autosaver = BackgroundAutosaver(self.db, delay=0)
+        self.game_logic.autosaver = autosaver
+        self.game_logic.move_fighter("Crusher", 1, 1)
+        autosaver.close()
+        self.assertEqual(autosaver.writes, 1)
+        self.assertEqual(Autosaver(self.db).load_latest()["game_state"], self.game_logic.snapshot()["game_state"])
+
+    def test_invalid_codec(self):
+        with self.assertRaises(ValueError):
+            Autosaver(self.db, codec="rar")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import io
+import unittest
+from rich.console import Console
+from cli import read_script_commands, run_script
+from database import Database
+from game_logic import GameLogic
+from user_interface import UserInterface
+from utils import percentile
+
+
+class TestScriptMode(unittest.TestCase):
+    """Test running command scripts and their throughput report."""
+
+    def setUp(self):
+        self.output = io.StringIO()
+        self.console = Console(file=self.output, color_system=None, force_terminal=False, width=120)
+        self.ui = UserInterface(self.console, GameLogic(Database(), seed=1))
+
+    def test_read_script_commands(self):
+        script = io.StringIO("# opening moves\nmove Crusher 1 1\n\n   \n  end_activation  \n#status\nstatus\n")
+        self.assertEqual(list(read_script_commands(script)), ["move Crusher 1 1", "end_activation", "status"])
+
+    def test_run_script(self):
+        latencies = run_script(self.ui, self.console, ["move Crusher 1 1", "bogus", "status", "quit", "map"])
+        self.assertEqual(len(latencies), 3)  # Stops at quit
+        self.assertEqual(self.ui.output, 'direct')
+        self.assertIs(self.ui.console, self.console)
+        text = self.output.getvalue()
+        self.assertIn("Move successful", text)
+        self.assertNotIn("Battlefield Map", text)
+        self.assertIn("Script Throughput", text)
+
+    def test_quiet_run_script_restores_output_mode(self):
+        self.ui.set_output('buffered', flush_every=5)
+        latencies = run_script(self.ui, self.console, ["status", "move Crusher 1 1"], quiet=True)
+        self.assertEqual(len(latencies), 2)
+        self.assertEqual((self.ui.output, self.ui.flush_every), ('buffered', 5))
+        text = self.output.getvalue()
+        self.assertNotIn("Processing command", text)
+        self.assertIn("Script Throughput", text)
+
+
+class TestPercentile(unittest.TestCase):
+    """Test the nearest-rank percentile used in the throughput report."""
+
+    def test_edge_cases(self):
+        self.assertEqual(percentile([], 50), 0.0)
+        values = [4.0, 1.0, 3.0, 2.0]
+        self.assertEqual(percentile(values, 0), 1.0)
+        self.assertEqual(percentile(values, 100), 4.0)
+        self.assertEqual(percentile(values, 50), 2.0)
+        self.assertEqual(percentile(values, 51), 3.0)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,278 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from database import Database
+from game_logic import GameLogic
+
+
+class TestDatabase(unittest.TestCase):
+    """Test the SQLite storage backend."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = Database(os.path.join(self.tmp_dir, "game.db"))
+        self.game_logic = GameLogic(self.db, seed=7)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def stored_digests(self):
+        with self.db.get_connection() as conn:
+            return {
+                (kind, gang_index, position): digest
+                for kind, gang_index, position, digest in conn.db.execute(
+                    "SELECT kind, gang_index, position, digest FROM game_parts"
+                )
+            }
+
+    def test_round_trip(self):
+        state = self.game_logic.game_state.model_dump(mode="json")
+        self.db.save_game_state(state)
+        self.assertEqual(self.db.load_game_state(), state)
+
+    def test_save_only_rewrites_changed_rows(self):
+        self.db.save_game_state(self.game_logic.game_state.model_dump(mode="json"))
+        before = self.stored_digests()
+        self.assertIn(("fighter", 0, 0), before)
+        self.assertIn(("battlefield", -1, 0), before)
+
+        self.game_logic.move_fighter("Crusher", 1, 1)
+        self.db.save_game_state(self.game_logic.game_state.model_dump(mode="json"))
+        after = self.stored_digests()
+
+        changed = {key for key in after if before.get(key) != after[key]}
+        self.assertIn(("fighter", 0, 0), changed)
+        self.assertNotIn(("fighter", 1, 0), changed)
+        self.assertNotIn(("gang", -1, 1), changed)
+
+    def test_removed_rows_are_deleted(self):
+        state = self.game_logic.game_state.model_dump(mode="json")
+        self.db.save_game_state(state)
+        state["gangs"][1]["members"] = []
+        self.db.save_game_state(state)
+
+        self.assertNotIn(("fighter", 1, 0), self.stored_digests())
+        self.assertEqual(self.db.load_game_state(), state)
+
+    def test_query_and_backup(self):
+        state = {"turn": 3, "scenario": "Ambush", "battlefield": {"width": 10, "height": 10}}
+        self.db.save_game_state(state)
+        self.assertEqual(self.db.query_game_state("turn", 3), state)
+        self.assertIsNone(self.db.query_game_state("turn", 4))
+
+        backup_file = os.path.join(self.tmp_dir, "backup.jsonl")
+        self.db.backup_database(backup_file)
+        self.db.save_game_state({"turn": 9})
+        self.db.restore_database(backup_file)
+        self.assertEqual(self.db.load_game_state(), state)
+
+    def test_save_slots_and_index(self):
+        first = self.game_logic.snapshot()
+        self.db.save_game_state(first, slot=1)
+        self.game_logic.move_fighter("Crusher", 1, 1)
+        self.db.save_game_state(self.game_logic.snapshot(), slot="before-assault")
+        self.db.save_game_state({"turn": 4}, game_id="league-2")
+
+        self.assertEqual(self.db.load_game_state(slot="1")["game_state"], first["game_state"])
+        self.assertIsNone(self.db.load_game_state(slot="missing"))
+        self.assertEqual(self.db.list_games(), ["default", "league-2"])
+
+        saves = self.db.list_saves("default")
+        self.assertEqual([save.slot for save in saves], ["before-assault", "1"])
+        self.assertEqual(saves[0].gangs, ["Goliaths", "Eschers"])
+        self.assertEqual(saves[0].turn, 1)
+
+        self.assertTrue(self.db.delete_game_state(slot=1))
+        self.assertEqual([save.slot for save in self.db.list_saves("default")], ["before-assault"])
+
+    def test_snapshot_is_split_into_rows(self):
+        self.db.save_game_state(self.game_logic.snapshot())
+        self.assertIn(("fighter", 0, 0), self.stored_digests())
+
+        restored = GameLogic(self.db, seed=99)
+        restored.restore(self.db.load_game_state())
+        self.assertEqual(restored.game_state.model_dump(mode="json"),
+                         self.game_logic.game_state.model_dump(mode="json"))
+        self.assertEqual(restored.d20.roll('1d6').total, self.game_logic.d20.roll('1d6').total)
+
+    def test_connection_is_reused(self):
+        self.db.save_game_state({"turn": 1})
+        connection = self.db.db
+        self.db.load_game_state()
+        self.db.list_saves()
+        self.assertIs(self.db.db, connection)
+
+    def test_manual_flush_policy(self):
+        batched = Database(self.db.db_path, flush_every=0)
+        batched.save_game_state({"turn": 1}, slot="a")
+        batched.save_game_state({"turn": 2}, slot="b")
+        # Pending saves are visible through the same connection but not yet committed
+        self.assertEqual(len(batched.list_saves()), 2)
+        self.assertEqual(self.db.list_saves(), [])
+
+        batched.flush()
+        self.assertEqual(len(self.db.list_saves()), 2)
+        batched.close()
+
+    def test_failed_save_keeps_pending_saves(self):
+        batched = Database(self.db.db_path, flush_every=0)
+        batched.save_game_state({"turn": 1}, slot="a")
+        with self.assertRaises(OverflowError):
+            # Fails on the index row, after the slot's parts were written
+            batched.save_game_state({"turn": 2 ** 70}, slot="b")
+        batched.close()
+        self.assertEqual([save.slot for save in self.db.list_saves()], ["a"])
+        self.assertIsNone(self.db.load_game_state(slot="b"))
+
+    def test_background_writers_share_connection(self):
+        def save_many(game_id):
+            handle = self.db.for_game(game_id)
+            for turn in range(20):
+                handle.save_game_state({"turn": turn})
+
+        threads = [threading.Thread(target=save_many, args=(f"game-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.db.list_games(), ["game-0", "game-1", "game-2", "game-3"])
+        self.assertEqual(self.db.load_game_state(game_id="game-2"), {"turn": 19})
+
+
+    def test_streaming_backup_chunks_and_compression(self):
+        for n in range(7):
+            self.db.save_game_state({"turn": n, "gangs": [{"name": f"Gang {n}", "members": []}]}, slot=n)
+        self.db.save_game_state(self.game_logic.snapshot(), game_id="league-2")
+        expected = {(info.game_id, info.slot): info for info in self.db.list_saves() + self.db.list_saves("league-2")}
+
+        for compression in (None, "zlib", "lzma"):
+            backup_file = os.path.join(self.tmp_dir, f"backup-{compression}.jsonl")
+            self.assertEqual(self.db.backup_database(backup_file, compression=compression, chunk_size=3), 8)
+            self.db.delete_game_state(slot=0)
+            self.assertEqual(self.db.restore_database(backup_file), 8)
+            self.assertEqual(self.db.load_game_state(slot=5), {"turn": 5, "gangs": [{"name": "Gang 5", "members": []}]})
+            restored = {(info.game_id, info.slot): info for info in self.db.list_saves() + self.db.list_saves("league-2")}
+            self.assertEqual(restored, expected)
+
+        with self.assertRaises(ValueError):
+            self.db.backup_database(os.path.join(self.tmp_dir, "bad.jsonl"), compression="rar")
+
+    def test_corrupted_backup_is_rejected(self):
+        for n in range(4):
+            self.db.save_game_state({"turn": n}, slot=n)
+        backup_file = os.path.join(self.tmp_dir, "backup.jsonl")
+        self.db.backup_database(backup_file, chunk_size=2)
+        with open(backup_file, "rb") as file:
+            lines = file.readlines()
+
+        # Tamper with a save in the second chunk; the first chunk restores before the check fails
+        lines[-2] = lines[-2].replace(b'"turn":3', b'"turn":8')
+        with open(backup_file, "wb") as file:
+            file.writelines(lines)
+        self.db.save_game_state({"turn": 42}, slot="latest")
+        with self.assertRaises(ValueError):
+            self.db.restore_database(backup_file)
+        self.assertEqual(self.db.load_game_state(slot="latest"), {"turn": 42})
+        self.assertEqual(len(self.db.list_saves()), 5)
+
+        # A truncated backup is rejected as well
+        with open(backup_file, "wb") as file:
+            file.writelines(lines[:-1])
+        with self.assertRaises(ValueError):
+            self.db.restore_database(backup_file)
+
+    def test_restore_legacy_json_backup(self):
+        backup_file = os.path.join(self.tmp_dir, "backup.json")
+        with open(backup_file, "w") as file:
+            json.dump([{"turn": 2}], file, indent=4)
+        self.assertEqual(self.db.restore_database(backup_file), 1)
+        self.assertEqual(self.db.load_game_state(), {"turn": 2})
+
+    def test_secondary_indexes(self):
+        snapshot = self.game_logic.snapshot()
+        gang_names = [gang["name"] for gang in snapshot["game_state"]["gangs"]]
+        self.db.save_game_state(snapshot, slot="opening")
+        self.db.save_game_state({"turn": 5, "scenario": {"name": "Ambush"}, "winner": gang_names[1]}, slot="final")
+
+        self.assertEqual([info.slot for info in self.db.find_saves("gang", gang_names[0])], ["opening"])
+        self.assertEqual([info.slot for info in self.db.find_saves("winner", gang_names[1])], ["final"])
+        self.assertEqual(self.db.find_game_state("scenario_name", "Ambush")["turn"], 5)
+        self.assertEqual(self.db.find_game_state("current_turn", 1)["game_state"], snapshot["game_state"])
+        # query_game_state still compares top-level keys as stored
+        self.assertIsNone(self.db.query_game_state("scenario", "Ambush"))
+        self.assertEqual(self.db.query_game_state("scenario", {"name": "Ambush"})["turn"], 5)
+        self.assertIsNone(self.db.query_game_state("turn", 1))
+        with self.assertRaises(ValueError):
+            self.db.find_saves("weather", "rain")
+
+        # Overwriting or deleting a slot updates its index entries
+        self.db.save_game_state({"turn": 6}, slot="final")
+        self.assertEqual(self.db.find_saves("winner", gang_names[1]), [])
+        self.assertEqual([info.slot for info in self.db.find_saves("current_turn", 6)], ["final"])
+        self.db.delete_game_state(slot="final")
+        self.assertIsNone(self.db.find_game_state("current_turn", 6))
+
+        # Databases written before the indexes existed are reindexed when opened
+        with self.db.get_connection() as conn:
+            conn.db.execute("DELETE FROM save_fields")
+            conn.db.execute("PRAGMA user_version = 0")
+        self.db.close()
+        self.assertEqual(len(self.db.find_saves("gang", gang_names[1])), 1)
+
+    def test_query_saved_snapshots(self):
+        snapshot = self.game_logic.snapshot()
+        game_state = snapshot["game_state"]
+        self.db.save_game_state(snapshot, slot="opening")
+        self.db.save_game_state({"turn": 5}, slot="other")
+
+        # Snapshots are matched on the game state they wrap
+        self.assertEqual(self.db.query_game_state("current_turn", 1)["game_state"], game_state)
+        self.assertEqual(self.db.query_game_state("max_turns", game_state["max_turns"])["game_state"], game_state)
+        self.assertIsNotNone(self.db.query_game_state("gangs", game_state["gangs"]))
+        self.assertIsNotNone(self.db.query_game_state("battlefield", game_state["battlefield"]))
+        self.assertIsNone(self.db.query_game_state("gangs", game_state["gangs"][:1]))
+        self.assertIsNone(self.db.query_game_state("seed", snapshot["seed"]))
+
+        # Indexed keys only check the slots their index lists
+        with self.db.get_connection() as conn:
+            conn.db.execute("DELETE FROM save_fields")
+        self.assertIsNone(self.db.query_game_state("current_turn", 1))
+        self.assertIsNotNone(self.db.query_game_state("max_turns", game_state["max_turns"]))
+    def test_crash_keeps_last_commit(self):
+        self.db.save_game_state({"turn": 1})
+        self.db.close()
+        # A process that dies with saves still waiting for a commit point
+        script = (
+            "import os\n"
+            "from database import Database\n"
+            f"db = Database({self.db.db_path!r}, flush_every=0)\n"
+            "db.save_game_state({'turn': 2})\n"
+            "db.save_game_state({'turn': 3}, slot='b')\n"
+            "os._exit(1)\n"
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)), check=False)
+
+        self.assertEqual(self.db.load_game_state(), {"turn": 1})
+        self.assertEqual([info.slot for info in self.db.list_saves()], ["main"])
+
+    def test_failed_backup_keeps_previous_file(self):
+        self.db.save_game_state({"turn": 1})
+        backup_file = os.path.join(self.tmp_dir, "backup.jsonl")
+        self.db.backup_database(backup_file)
+        with open(backup_file, "rb") as file:
+            previous = file.read()
+
+        with self.assertRaises(ValueError):
+            self.db.backup_database(backup_file, compression="rar")
+        with open(backup_file, "rb") as file:
+            self.assertEqual(file.read(), previous)
+        self.assertEqual([name for name in os.listdir(self.tmp_dir) if name.endswith(".tmp")], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -94,6 +94,17 @@ class TestInjuryMechanic(unittest.TestCase):
         self.assertEqual(injury_result, InjuryResult.OUT_OF_ACTION,
                          "Roll of 6 should result in OUT_OF_ACTION")
 
+    def test_injury_records(self):
+        """Test that each applied injury gets its own record from the injury templates."""
+        self.game_logic.apply_injury_effect(self.target, InjuryResult.FLESH_WOUND)
+        self.game_logic.apply_injury_effect(self.attacker, InjuryResult.FLESH_WOUND)
+        self.game_logic.apply_injury_effect(self.target, InjuryResult.OUT_OF_ACTION)
+
+        self.assertEqual([injury.type for injury in self.target.injuries], ["Flesh Wound", "Out of Action"])
+        self.assertEqual([injury.severity for injury in self.target.injuries], ["Minor", "Critical"])
+        self.target.injuries[0].attribute_modifiers["Toughness"] = -1
+        self.assertEqual(self.attacker.injuries[0].attribute_modifiers, {})
+
     def test_multiple_injury_dice_for_excess_damage(self):
         """Test that excess damage causes multiple injury dice rolls."""
         # Reset the target's wounds
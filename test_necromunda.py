@@ -1,7 +1,8 @@
 import unittest
 from game_logic import GameLogic
 from database import Database
-from models.gang_models import Ganger, Gang, GangerRole, GangType
+from models.gang_models import Ganger, Gang, GangerRole, GangType, Injury
+from models.item_models import Equipment, Modifier
 from models.weapon_models import Weapon, WeaponProfile, WeaponType, WeaponTrait, Rarity # Added Rarity import
 from models.armor_models import Armor, ArmorType
 from models import TileType, Tile
@@ -378,6 +379,7 @@ class TestNecromundaSimulation(unittest.TestCase):
         self.assertEqual(trait_mods['ap'], 1, "Power weapon should give +1 AP")
 
         # Test combat with weapon traits
+        self.game_logic.d20.roll = lambda _: type('MockRoll', (), {'total': 6})()
         result = self.game_logic.resolve_combat(attacker, defender, power_weapon)
         self.assertIn("PowerFighter hit Target", result)
 
@@ -785,6 +787,165 @@ class TestNecromundaSimulation(unittest.TestCase):
         self.assertEqual(condition_mods['leadership_bonus'], 1)
         self.assertEqual(condition_mods['to_hit'], 2)  # +1 from height, +1 from prone target
 
+    def test_bulk_update_defers_validation(self):
+        """Test that bulk_update() validates changed models once, on exit."""
+        game_state = self.game_logic.game_state
+        gang = game_state.gangs[0]
+        tile = game_state.battlefield.tiles[0]
+        with game_state.bulk_update():
+            gang.credits = "250"  # Coerced on exit, as an assignment would be
+            gang.reputation = 4
+            tile.occupier = "Crusher"
+            with gang.bulk_update():
+                gang.victory_points = 2
+        self.assertEqual((gang.credits, gang.reputation, gang.victory_points), (250, 4, 2))
+        self.assertEqual(tile.occupier, "Crusher")
+
+        with self.assertRaises(ValueError):
+            with game_state.bulk_update():
+                gang.credits = "lots"
+        self.assertEqual(gang.credits, 250)  # The invalid model keeps its old values
+
+        # Also when the block raises: invalid changes are undone, valid ones kept
+        with self.assertRaises(RuntimeError):
+            with game_state.bulk_update():
+                gang.credits = "lots"
+                gang.reputation = 7
+                tile.occupier = "Venom"
+                raise RuntimeError("interrupted")
+        self.assertEqual((gang.credits, gang.reputation, tile.occupier), (250, 4, "Venom"))
+        # Assignments validate immediately again after the block
+        with self.assertRaises(ValueError):
+            tile.elevation = -1
+
+    def test_gang_roster_tracking(self):
+        """Test that add_member/remove_member keep the role counts and name index current."""
+        gang = self.game_logic.game_state.gangs[0]
+        champion = gang.members[0].model_copy(update={"name": "Brute", "role": GangerRole.CHAMPION})
+        gang.add_member(champion)
+        self.assertIs(gang.get_member("Brute"), champion)
+        self.assertIs(gang.get_member("BRUTE"), champion)  # Names match ignoring case, as in find_fighter
+        self.assertEqual(gang.role_count(GangerRole.CHAMPION), 1)
+        with self.assertRaises(ValueError):
+            gang.add_member(champion)  # Name already taken
+        with self.assertRaises(ValueError):
+            gang.add_member(champion.model_copy(update={"name": "brute", "role": GangerRole.GANGER}))
+        with self.assertRaises(ValueError):
+            gang.add_member(champion.model_copy(update={"name": "Boss", "role": GangerRole.LEADER}))
+
+        gang.remove_member("bRUTE")
+        self.assertIsNone(gang.get_member("Brute"))
+        self.assertEqual(gang.role_count(GangerRole.CHAMPION), 0)
+        leader = next(m for m in gang.members if m.role == GangerRole.LEADER)
+        with self.assertRaises(ValueError):
+            gang.remove_member(leader.name)
+
+        # Direct edits to the members list are picked up too
+        gang.members.append(champion)
+        self.assertIs(gang.get_member("Brute"), champion)
+
+    def test_derived_weapon_stats(self):
+        """Test the weapon stats derived once from its profiles and traits."""
+        weapon = self.test_weapon.model_copy(update={
+            "traits": [WeaponTrait(name="Gas Weapon", description=None)],
+            "profiles": self.test_weapon.profiles + [self.test_weapon.profiles[0].model_copy(
+                update={"range": "Short: 0-2, Long: 2-4", "strength": 3, "damage": 3})],
+        })
+        self.assertEqual((weapon.max_strength, weapon.max_armor_penetration, weapon.max_damage), (5, 2, 3))
+        self.assertEqual(weapon.calculate_effective_damage(), 3)
+        self.assertEqual(weapon.range_bands, {"Short": (0, 2), "Long": (1, 4)})
+        self.assertEqual(weapon.range_modifiers, {"Short": 0, "Long": -2})
+        self.assertTrue(weapon.has_trait("gas weapon"))
+
+        # Copies with other profiles get their own stats
+        stripped = weapon.model_copy(update={"profiles": []})
+        self.assertEqual((stripped.max_strength, stripped.max_damage), (0, 0))
+        self.assertEqual(weapon.max_strength, 5)
+
+        defender = self.game_logic.game_state.gangs[1].members[0]
+        self.assertFalse(self.game_logic.resolve_armor_save(defender, weapon)[0])
+
+    def test_effective_stats(self):
+        """Test that equipment, injuries and armor fold into cached effective stats."""
+        fighter = self.game_logic.game_state.gangs[0].members[0]
+        base_toughness = fighter.toughness
+        self.assertEqual(fighter.effective_stat("toughness"), base_toughness)
+        self.assertEqual(fighter.effective_save, 7)
+
+        fighter.equipment.append(Equipment(
+            name="Stimm Harness", cost=None, rarity=None, weight=None, description=None,
+            modifiers=[Modifier(stat="Toughness", value=1, condition=None),
+                       Modifier(stat="Strength", value=1, condition="When charging")]
+        ))
+        self.assertEqual(fighter.effective_stat("toughness"), base_toughness + 1)
+        self.assertEqual(fighter.effective_stat("strength"), fighter.strength)  # Conditional modifier
+
+        fighter.injuries.append(Injury(type="Old Battle Wound", severity="Major", effect=None,
+                                       attribute_modifiers={"Toughness": -2}))
+        self.assertEqual(fighter.effective_stat("toughness"), base_toughness - 1)
+
+        fighter.armor = self.test_armor
+        self.assertEqual(fighter.effective_save, self.test_armor.save_value)
+        # Base characteristic changes apply straight away
+        fighter.toughness += 1
+        self.assertEqual(fighter.effective_stat("toughness"), base_toughness)
+
+    def test_rules_use_effective_stats(self):
+        """Test that movement, charges and activation order use the modified characteristics."""
+        fighter, target = (gang.members[0] for gang in self.game_logic.game_state.gangs)
+        fighter.x, fighter.y = 0, 0
+        target.x, target.y = 0, fighter.movement * 2 + 2
+        self.assertFalse(self.game_logic.move_fighter(fighter.name, fighter.movement + 1, 0))
+        self.assertFalse(self.game_logic.can_charge(fighter, target))
+
+        fighter.equipment.append(Equipment(
+            name="Ridgehauler Legs", cost=None, rarity=None, weight=None, description=None,
+            modifiers=[Modifier(stat="Movement", value=1, condition=None)]
+        ))
+        self.assertTrue(self.game_logic.can_charge(fighter, target))
+        self.assertTrue(self.game_logic.move_fighter(fighter.name, fighter.movement + 1, 0))
+
+        # With equal rolls the leader's modified initiative decides who goes first
+        self.game_logic.d20.roll = lambda _: type('MockRoll', (), {'total': 10})()
+        goliaths, eschers = self.game_logic.game_state.gangs
+        self.assertEqual(self.game_logic.calculate_activation_order(), [eschers, goliaths])
+        fighter.injuries.append(Injury(type="Adrenal Surge", severity="Minor", effect=None,
+                                       attribute_modifiers={"Initiative": 2}))
+        self.assertEqual(self.game_logic.calculate_activation_order(), [goliaths, eschers])
+
+    def test_fighter_registry(self):
+        """Test case-folded fighter lookups and duplicate name detection across gangs."""
+        game_state = self.game_logic.game_state
+        goliaths, eschers = game_state.gangs
+        crusher = goliaths.members[0]
+        self.assertEqual(game_state.find_fighter("CRUSHER"), (goliaths, crusher))
+        self.assertIsNone(game_state.get_fighter("Nobody"))
+
+        straße = crusher.model_copy(update={"name": "Straße", "role": GangerRole.GANGER})
+        game_state.add_member(goliaths, straße)
+        self.assertIs(self.game_logic._get_fighter_by_name("STRASSE"), straße)
+        with self.assertRaises(ValueError):
+            # Taken in another gang, ignoring case
+            game_state.add_member(eschers, straße.model_copy(update={"name": "strasse"}))
+        self.assertIs(game_state.remove_member("straße"), straße)
+        self.assertIsNone(game_state.get_fighter("Straße"))
+
+        # Fighters added, removed or renamed through the gangs directly are picked up too
+        eschers.members.append(straße)
+        self.assertEqual(game_state.find_fighter("strasse"), (eschers, straße))
+        eschers.members.remove(straße)
+        self.assertIsNone(game_state.find_fighter("strasse"))
+        crusher.name = "Smasher"
+        self.assertIsNone(game_state.get_fighter("Crusher"))
+        self.assertIs(game_state.get_fighter("smasher"), crusher)
+
+        # Whole games with a name used twice are rejected up front
+        data = game_state.model_dump()
+        data["gangs"][1]["members"][0]["name"] = "SMASHER"
+        with self.assertRaises(ValueError):
+            type(game_state).model_validate(data)
+
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,119 @@
+import unittest
+from game_logic import GameLogic
+from database import Database
+from replay import ReplayEngine
+from dice import SeededDice
+
+
+class TestReplayEngine(unittest.TestCase):
+    """Test rebuilding recorded games from checkpoints and events."""
+
+    def setUp(self):
+        self.game_logic = GameLogic(Database(), seed=1234, checkpoint_interval=4)
+        self.commands = [
+            ("attack", ("Crusher", "Venom")),
+            ("end_fighter_activation", ()),
+            ("attack", ("Venom", "Crusher")),
+            ("end_fighter_activation", ()),
+            ("advance_combat_phase", ()),
+            ("move_fighter", ("Crusher", 1, 1)),
+            ("advance_combat_phase", ()),
+            ("advance_combat_phase", ()),
+        ] * 3
+
+        # Record the state before every action so seeks can be compared against it
+        self.states = []
+        for action, args in self.commands:
+            self.states.append(self.game_logic.game_state.model_dump())
+            getattr(self.game_logic, action)(*args)
+        self.states.append(self.game_logic.game_state.model_dump())
+
+    def test_events_and_checkpoints_recorded(self):
+        log = self.game_logic.replay_log
+        self.assertEqual(len(log.events), len(self.commands))
+        self.assertEqual([c.action_index for c in log.checkpoints], list(range(0, len(self.commands), 4)))
+        self.assertEqual(log.events[0].action, "attack")
+        self.assertEqual(log.events[0].args, ["Crusher", "Venom"])
+
+    def test_seek_matches_original_game(self):
+        engine = ReplayEngine(self.game_logic.replay_log)
+        # Jump around in both directions to exercise checkpoint restores and forward continuation
+        for action_index in [len(self.commands), 5, 6, 13, 2, 0, 21, 9]:
+            replayed = engine.seek(action_index)
+            self.assertEqual(replayed.game_state.model_dump(), self.states[action_index],
+                             f"State after {action_index} actions should match the original game")
+
+    def test_seek_round(self):
+        engine = ReplayEngine(self.game_logic.replay_log)
+        replayed = engine.seek_round(2)
+        self.assertEqual(replayed.get_current_combat_round().round_number, 2)
+        self.assertEqual(engine.position, 8)
+
+        with self.assertRaises(ValueError):
+            engine.seek_round(99)
+
+    def test_replay_does_not_record(self):
+        engine = ReplayEngine(self.game_logic.replay_log)
+        replayed = engine.seek(len(self.commands))
+        self.assertEqual(len(replayed.replay_log.events), 0)
+
+    def test_history_is_kept_in_the_database(self):
+        self.game_logic.save_replay()
+        engine = ReplayEngine.from_database(self.game_logic.db)
+        self.assertEqual(engine.length, len(self.commands))
+        for action_index in [len(self.commands), 5, 0, 13]:
+            self.assertEqual(engine.seek(action_index).game_state.model_dump(), self.states[action_index])
+
+    def test_checkpoints_in_memory_are_bounded(self):
+        game_logic = GameLogic(Database(), seed=1234, checkpoint_interval=4, max_checkpoints=2)
+        for action, args in self.commands:
+            getattr(game_logic, action)(*args)
+        self.assertEqual([c.action_index for c in game_logic.replay_log.checkpoints], [16, 20])
+
+        # Older checkpoints are read back from the database
+        engine = ReplayEngine(game_logic.replay_log, game_logic.db)
+        for action_index in [22, 5, 6, 17, 0]:
+            self.assertEqual(engine.seek(action_index).game_state.model_dump(), self.states[action_index])
+        with self.assertRaises(ValueError):
+            ReplayEngine(game_logic.replay_log).seek(5)
+
+    def test_restored_game_continues_the_history(self):
+        db = self.game_logic.db
+        db.save_game_state(GameLogic(db, seed=1).snapshot(), slot="other")
+        self.game_logic.restore(db.load_game_state(slot="other"))
+
+        log = self.game_logic.replay_log
+        self.assertEqual(len(log.events), len(self.commands))
+        self.assertEqual(log.checkpoints[-1].action_index, len(self.commands))
+        self.game_logic.end_fighter_activation()
+        after_load = self.game_logic.game_state.model_dump()
+
+        engine = ReplayEngine(log, db)
+        self.assertEqual(engine.seek(13).game_state.model_dump(), self.states[13])
+        self.assertEqual(engine.seek(len(self.commands) + 1).game_state.model_dump(), after_load)
+        # Played up to the load, the game jumps to the loaded state
+        engine.seek(len(self.commands) - 1)
+        self.assertNotEqual(engine.seek(len(self.commands)).game_state.model_dump(), self.states[-1])
+
+    def test_plain_rolls_match_d20(self):
+        """Rolls made without d20's parser draw the same dice, so seeds replay identically."""
+        import d20
+        from d20 import expression as d20_expression
+        expressions = ['1d6', '2d6', 'd20', '3d6'] * 10
+        dice = SeededDice(7)
+        fast = [str(dice.roll(expr)) for expr in expressions]
+
+        reference = SeededDice(7)
+        previous = d20_expression.random
+        d20_expression.random = reference.rng
+        try:
+            expected = [str(d20.roll(expr)) for expr in expressions]
+        finally:
+            d20_expression.random = previous
+        self.assertEqual(fast, expected)
+        # Anything else still goes through d20
+        self.assertEqual(SeededDice(7).roll('1d6+1').total, SeededDice(7).roll('1d6').total + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
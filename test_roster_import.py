@@ -0,0 +1,127 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from database import Database
+from game_logic import GameLogic
+from replay import ReplayEngine
+from roster_import import import_roster_file
+
+LASGUN = {"name": "Lasgun", "weapon_type": "Basic", "cost": 15, "rarity": "Common",
+          "profiles": [{"range": "Short: 0-8, Long: 8-24", "strength": 3, "armor_penetration": 0, "damage": 1}]}
+
+
+def fighter(name, gang, role="Ganger", affiliation="Goliath", **fields):
+    row = {"gang": gang, "name": name, "role": role, "gang_affiliation": affiliation,
+           "movement": 4, "weapon_skill": 4, "ballistic_skill": 4, "strength": 3, "toughness": 3, "wounds": 1,
+           "initiative": 4, "attacks": 1, "leadership": 7, "cool": 7, "will": 7, "intelligence": 7,
+           "credits_value": 50, "weapons": [LASGUN]}
+    row.update(fields)
+    return row
+
+
+class TestRosterImport(unittest.TestCase):
+    """Test bulk fighter imports from roster files."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.game_logic = GameLogic(Database(), seed=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_jsonl(self, rows):
+        path = os.path.join(self.tmp_dir, "roster.jsonl")
+        with open(path, "w") as file:
+            file.writelines(row if isinstance(row, str) else json.dumps(row) + "\n" for row in rows)
+        return path
+
+    def test_import_into_existing_and_new_gangs(self):
+        path = self.write_jsonl([
+            fighter("Brute", "Goliaths", armor={"name": "Flak Armour", "armor_rating": 6, "locations": ["Body"]}),
+            fighter("Tusk", "goliaths"),
+            "{not json\n",
+            fighter("Sable", "Night Cats", role="Leader", affiliation="Escher"),
+            fighter("Wisp", "Night Cats", affiliation="Escher", wounds=-1),
+            fighter("Hex", "Night Cats", affiliation="Escher"),
+        ])
+        result = self.game_logic.import_roster(path)
+
+        self.assertEqual([(line, gang, member.name) for line, gang, member in result.members],
+                         [(1, "Goliaths", "Brute"), (2, "Goliaths", "Tusk"), (4, "Night Cats", "Sable"),
+                          (6, "Night Cats", "Hex")])
+        self.assertEqual([line for line, _ in result.errors], [3, 5])
+        self.assertIn("wounds", result.errors[1][1])
+
+        goliaths = self.game_logic.game_state.gangs[0]
+        self.assertEqual([m.name for m in goliaths.members], ["Crusher", "Brute", "Tusk"])
+        self.assertEqual(goliaths.members[1].effective_save, 6)
+        # Rows with the same weapon share one validated instance
+        self.assertIs(goliaths.members[1].weapons[0], goliaths.members[2].weapons[0])
+
+        night_cats = self.game_logic.game_state.gangs[2]
+        self.assertEqual((night_cats.name, night_cats.type.value), ("Night Cats", "Escher"))
+        self.assertEqual([m.name for m in night_cats.members], ["Sable", "Hex"])
+
+    def test_new_gang_failing_composition_rules_is_reported(self):
+        path = self.write_jsonl([fighter("Stray", "Leaderless"), fighter("Drift", "Leaderless")])
+        result = self.game_logic.import_roster(path)
+
+        self.assertEqual(result.members, [])
+        self.assertEqual([line for line, _ in result.errors], [1, 2])
+        self.assertTrue(all(message.startswith("Gang Leaderless:") for _, message in result.errors))
+        self.assertEqual(len(self.game_logic.game_state.gangs), 2)
+
+    def test_names_already_in_the_game_are_rejected(self):
+        path = self.write_jsonl([
+            fighter("crusher", "Goliaths"),
+            fighter("Sable", "Night Cats", role="Leader", affiliation="Escher"),
+            fighter("SABLE", "Eschers", affiliation="Escher"),
+        ])
+        result = self.game_logic.import_roster(path)
+
+        self.assertEqual([(line, member.name) for line, _, member in result.members], [(2, "Sable")])
+        self.assertEqual([line for line, _ in result.errors], [1, 3])
+        self.assertIs(self.game_logic.game_state.get_fighter("sable"), result.members[0][2])
+
+    def test_replay_does_not_read_the_file_again(self):
+        path = self.write_jsonl([fighter("Brute", "Goliaths"), fighter("Tusk", "Goliaths")])
+        read = import_roster_file(path)
+        tusk = read.members[1][2]
+        with mock.patch("roster_import.import_roster_file", return_value=read):
+            self.game_logic.import_roster(path)
+        # The fighters read join the game as they are; only the replay rebuilds them from the log
+        self.assertIs(self.game_logic.game_state.get_fighter("Tusk"), tusk)
+        self.assertEqual(self.game_logic.replay_log.events[0].action, "add_roster_members")
+        self.game_logic.move_fighter("Crusher", 1, 1)
+        os.remove(path)
+
+        replayed = ReplayEngine(self.game_logic.replay_log).seek(len(self.game_logic.replay_log.events))
+        self.assertEqual(replayed.game_state.model_dump(mode="json"), self.game_logic.game_state.model_dump(mode="json"))
+        self.assertEqual(replayed.game_state.get_fighter("Tusk").weapons[0].name, "Lasgun")
+
+    def test_csv_roster(self):
+        path = os.path.join(self.tmp_dir, "roster.csv")
+        rows = [fighter("Brute", "Goliaths"), fighter("Tusk", "Goliaths", weapons="[oops")]
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({key: value if isinstance(value, str) else json.dumps(value) for key, value in row.items()})
+        result = import_roster_file(path)
+
+        self.assertEqual([(line, member.name) for line, _, member in result.members], [(2, "Brute")])
+        self.assertEqual(result.members[0][2].weapons[0].name, "Lasgun")
+        self.assertEqual([line for line, _ in result.errors], [3])
+        self.assertIn("weapons", result.errors[0][1])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            import_roster_file(os.path.join(self.tmp_dir, "roster.xlsx"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from pydantic import ValidationError
+from database import Database
+from game_logic import GameLogic
+import serialization
+from models import Weapon, WeaponProfile
+from models.weapon_models import Rarity, WeaponType
+
+
+class TestSerialization(unittest.TestCase):
+    """Test the game state serialization layer."""
+
+    def setUp(self):
+        self.game_state = GameLogic(Database(), seed=3).game_state
+
+    def test_round_trip(self):
+        data = serialization.decode(serialization.encode(serialization.dump_game_state(self.game_state)))
+        self.assertEqual(serialization.load_game_state(data), self.game_state)
+        self.assertEqual(serialization.load_game_state(data, trusted=True), self.game_state)
+
+        raw = serialization.dump_game_state_json(self.game_state)
+        self.assertEqual(serialization.load_game_state_json(raw, trusted=True), self.game_state)
+
+    def test_trusted_load_skips_model_validators_only(self):
+        data = serialization.dump_game_state(self.game_state)
+        data["gangs"][0]["members"][0]["role"] = "Ganger"  # A gang without a leader
+
+        with self.assertRaises(ValidationError):
+            serialization.load_game_state(data)
+        self.assertEqual(serialization.load_game_state(data, trusted=True).gangs[0].members[0].role.value, "Ganger")
+
+        # Field types are still enforced
+        data["gangs"][0]["members"][0]["wounds"] = "many"
+        with self.assertRaises(ValidationError):
+            serialization.load_game_state(data, trusted=True)
+
+    def test_items_are_saved_once_and_shared(self):
+        for gang in self.game_state.gangs:
+            for member in gang.members:
+                # A separate but identical lasgun for every fighter
+                member.weapons = [Weapon(
+                    name="Lasgun", weapon_type=WeaponType.BASIC, cost=15, rarity=Rarity.COMMON, description=None,
+                    profiles=[WeaponProfile(range="Short: 0-8, Long: 8-24", strength=3, armor_penetration=0, damage=1,
+                                            short_range_modifier=1, long_range_modifier=0, ammo_roll="2+",
+                                            blast_radius=None, traits=[])]
+                )]
+        data = serialization.dump_game_state(self.game_state)
+        members = [member for gang in data["gangs"] for member in gang["members"]]
+        self.assertIn(serialization.ITEM_CATALOG_KEY, data)
+        self.assertEqual(len(data[serialization.ITEM_CATALOG_KEY]), 1)
+        self.assertEqual({member["weapons"][0] for member in members}, set(data[serialization.ITEM_CATALOG_KEY]))
+
+        for trusted in (False, True):
+            loaded = serialization.load_game_state(data, trusted=trusted)
+            self.assertEqual(loaded, self.game_state)
+            first, second = (gang.members[0].weapons[0] for gang in loaded.gangs)
+            self.assertIs(first, second)
+
+        # Saves with items embedded in each fighter still load, and their items are shared too
+        legacy = self.game_state.model_dump(mode="json")
+        loaded = serialization.load_game_state(legacy)
+        self.assertEqual(loaded, self.game_state)
+        self.assertIs(loaded.gangs[0].members[0].weapons[0],
+                      serialization.load_game_state(data).gangs[0].members[0].weapons[0])
+
+        del data[serialization.ITEM_CATALOG_KEY][members[0]["weapons"][0]]
+        with self.assertRaises(ValueError):
+            serialization.load_game_state(data)
+
+    def test_encode_handles_wide_integers(self):
+        self.assertEqual(serialization.decode(serialization.encode({"n": 2 ** 70})), {"n": 2 ** 70})
+
+
+if __name__ == '__main__':
+    unittest.main()
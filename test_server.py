@@ -0,0 +1,82 @@
+import asyncio
+import shutil
+import tempfile
+import threading
+import unittest
+from server import GameServer
+
+
+class TestGameServer(unittest.TestCase):
+    """Test routing protocol lines to hosted games."""
+
+    def setUp(self):
+        self.games_dir = tempfile.mkdtemp()
+        self.server = GameServer(games_dir=self.games_dir)
+
+    def tearDown(self):
+        asyncio.run(self.server.close())
+        shutil.rmtree(self.games_dir)
+
+    def handle(self, line):
+        return asyncio.run(self.server.handle_line(line))
+
+    def test_games_are_isolated(self):
+        response = self.handle("g1 move Crusher 1 1")
+        self.assertEqual((response["game"], response["command"]), ("g1", "move Crusher 1 1"))
+        self.assertIn("Move successful", response["output"])
+        self.handle("g2 status")
+
+        crusher = {game_id: self.server.sessions.get(game_id).game_logic.game_state.get_fighter("Crusher")
+                   for game_id in ("g1", "g2")}
+        self.assertEqual((crusher["g1"].x, crusher["g1"].y), (1, 1))
+        self.assertNotEqual((crusher["g2"].x, crusher["g2"].y), (1, 1))
+        self.assertEqual(self.handle("games"), {"games": ["g1", "g2"], "resident": ["g1", "g2"]})
+
+    def test_malformed_lines(self):
+        self.assertEqual(self.handle("   "), {"error": "Empty command"})
+        self.assertIn("error", self.handle("g1"))
+        self.assertIn("Invalid game id", self.handle("../escape status")["error"])
+        self.assertIn("Unknown command", self.handle("g1 dance")["output"])
+
+    def test_save_and_close_persist(self):
+        self.handle("g1 move Crusher 1 1")
+        self.assertEqual(self.handle("g1 save")["output"], "Game state saved.\n")
+        saved = self.server.sessions.database_for("g1").load_game_state()
+        self.assertEqual(saved["game_state"], self.server.sessions.get("g1").game_logic.snapshot()["game_state"])
+
+        self.handle("g1 move Crusher 2 2")
+        self.assertEqual(self.handle("g1 close")["output"], "Game saved and closed.\n")
+        self.assertEqual(self.handle("games"), {"games": ["g1"], "resident": []})
+
+        # The next command pages the game back in where it was left
+        crusher = self.server.sessions.get("g1").game_logic.game_state.get_fighter("Crusher")
+        self.assertEqual((crusher.x, crusher.y), (2, 2))
+
+
+    def test_games_are_paged_in_on_the_writer_thread(self):
+        server = GameServer(games_dir=self.games_dir, max_resident=1)
+        load = server.sessions.load
+        threads = []
+
+        def recording_load(game_id):
+            threads.append(threading.current_thread().name)
+            return load(game_id)
+
+        server.sessions.load = recording_load
+
+        async def play():
+            await server.handle_line("g1 move Crusher 1 1")
+            await server.handle_line("g2 status")  # Pages g1 out
+            # Commands arriving together for a paged-out game share one load
+            return await asyncio.gather(server.handle_line("g1 status"), server.handle_line("g1 status"))
+
+        try:
+            responses = asyncio.run(play())
+        finally:
+            asyncio.run(server.close())
+        self.assertEqual(len(threads), 3)
+        self.assertTrue(all(name.startswith("game-save") for name in threads))
+        self.assertTrue(all("Crusher" in response["output"] for response in responses))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import Future
+from session_manager import SessionManager
+
+
+class TestSessionManager(unittest.TestCase):
+    """Test paging idle games out to disk and back."""
+
+    def setUp(self):
+        self.games_dir = tempfile.mkdtemp()
+        self.manager = SessionManager(games_dir=self.games_dir, max_resident=2)
+
+    def tearDown(self):
+        self.manager.shutdown()
+        shutil.rmtree(self.games_dir)
+
+    def test_least_recently_used_game_is_paged_out(self):
+        self.manager.get("g1")
+        self.manager.get("g2")
+        self.manager.get("g1")  # g2 is now the least recently used
+        self.manager.get("g3")
+
+        self.assertEqual(self.manager.resident_games, ["g1", "g3"])
+        self.assertEqual(self.manager.known_games(), ["g1", "g2", "g3"])
+
+    def test_paged_out_game_resumes_where_it_left_off(self):
+        session = self.manager.get("g1")
+        session.execute("move Crusher 1 1")
+        session.execute("end_activation")
+        original = session.game_logic
+        expected_state = original.game_state.model_dump(mode="json")
+        dice_state = original.d20.getstate()
+
+        self.manager.close("g1")
+        self.assertFalse(self.manager.is_resident("g1"))
+
+        reloaded = self.manager.get("g1").game_logic
+        self.assertIsNot(reloaded, original)
+        self.assertEqual(reloaded.game_state.model_dump(mode="json"), expected_state)
+        self.assertEqual(reloaded.get_active_gang().name, "Eschers")
+        # The game's history survives paging out
+        self.assertEqual([event.action for event in reloaded.replay_log.events], ["move_fighter", "end_fighter_activation"])
+
+        # The reloaded game continues the same dice sequence
+        original.d20.setstate(dice_state)
+        self.assertEqual([reloaded.d20.roll('1d6').total for _ in range(10)],
+                         [original.d20.roll('1d6').total for _ in range(10)])
+
+    def test_downed_fighters_page_back_in(self):
+        manager = SessionManager(games_dir=self.games_dir, max_resident=1)
+        try:
+            venom = manager.get("g1").game_logic.game_state.get_fighter("Venom")
+            venom.wounds = 0  # As resolve_combat leaves a fighter taken down
+            manager.get("g2")
+            self.assertFalse(manager.is_resident("g1"))
+            self.assertEqual(manager.get("g1").game_logic.game_state.get_fighter("Venom").wounds, 0)
+        finally:
+            manager.shutdown()
+
+    def test_newer_pending_snapshot_is_kept(self):
+        futures = []
+
+        def write(db, snapshot):
+            # A background write that never reaches the database
+            futures.append(Future())
+            return futures[-1]
+
+        manager = SessionManager(games_dir=self.games_dir, write=write)
+        try:
+            session = manager.get("g1")
+            manager.persist(session)
+            session.execute("move Crusher 1 1")
+            manager.close("g1")
+            futures[0].set_result(None)  # The older write finishing must not drop the newer snapshot
+
+            crusher = manager.get("g1").game_logic.game_state.get_fighter("Crusher")
+            self.assertEqual((crusher.x, crusher.y), (1, 1))
+        finally:
+            manager.shutdown()
+
+    def test_sessions_cannot_read_files(self):
+        output = self.manager.get("g1").execute("import_roster /etc/passwd.csv")
+        self.assertIn("not available", output)
+
+    def test_invalid_game_id(self):
+        with self.assertRaises(ValueError):
+            self.manager.get("../escape")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import io
+import unittest
+from rich.console import Console
+from database import Database
+from game_logic import GameLogic
+from gang_builder import WeaponInput, build_weapon
+from models.gang_models import GangerRole
+from user_interface import STATUS_PAGE_SIZE, UserInterface
+
+
+class CountingWriter(io.StringIO):
+    """A text stream that counts its writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+class TestUserInterface(unittest.TestCase):
+    """Test the command console's output modes."""
+
+    def setUp(self):
+        self.game_logic = GameLogic(Database(), seed=1)
+        self.output = CountingWriter()
+        self.console = Console(file=self.output, color_system=None, force_terminal=False, width=120)
+
+    def test_buffered_output_is_written_once_per_command(self):
+        direct = io.StringIO()
+        UserInterface(Console(file=direct, color_system=None, force_terminal=False, width=120),
+                      self.game_logic).process_command("status")
+
+        ui = UserInterface(self.console, self.game_logic, output='buffered')
+        ui.process_command("status")
+        self.assertEqual(self.output.writes, 1)
+        self.assertEqual(self.output.getvalue(), direct.getvalue())
+
+        ui.set_output('buffered', flush_every=3)
+        ui.process_command("victory_points")
+        ui.process_command("bogus")  # Errors are buffered too
+        self.assertEqual(self.output.writes, 1)
+        ui.set_output('direct')  # Writes out what is still buffered
+        self.assertEqual(self.output.writes, 2)
+        self.assertIn("Unknown command: bogus", self.output.getvalue())
+
+    def test_null_output(self):
+        ui = UserInterface(self.console, self.game_logic, output='null')
+        ui.process_command("status")
+        ui.process_command("move Crusher 1 1")
+        self.assertEqual(self.output.getvalue(), "")
+        self.assertEqual((self.game_logic.game_state.get_fighter("Crusher").x,
+                          self.game_logic.game_state.get_fighter("Crusher").y), (1, 1))
+        with self.assertRaises(ValueError):
+            ui.set_output('loud')
+
+    def test_status_pages_and_render_cache(self):
+        game_state = self.game_logic.game_state
+        goliaths = game_state.gangs[0]
+        crusher = goliaths.members[0]
+        for n in range(STATUS_PAGE_SIZE + 5):
+            game_state.add_member(goliaths, crusher.model_copy(update={"name": f"Brute{n}", "role": GangerRole.GANGER}))
+        ui = UserInterface(self.console, self.game_logic)
+
+        ui.process_command("status goliaths 2")
+        text = self.output.getvalue()
+        self.assertIn("page 2 of 2", text)
+        self.assertIn(f"Brute{STATUS_PAGE_SIZE + 4}", text)
+        self.assertNotIn("Crusher", text.split("Current Turn")[0])
+        self.assertNotIn("Eschers Gang", text)
+
+        ui.process_command("status 3")
+        self.assertIn("Page 3 doesn't exist", self.output.getvalue())
+
+        # A refresh redraws a fighter whose version changed, and only then
+        ui.process_command("status")
+        first = self.output.getvalue()
+        version = crusher.version
+        crusher.xp = 37
+        self.assertEqual(crusher.version, version + 1)
+        ui.process_command("status")
+        refreshed = self.output.getvalue()[len(first):]
+        self.assertIn("│ Crusher ", refreshed)
+        self.assertNotIn(" 37 ", first)
+        self.assertIn(" 37 ", refreshed.split("│ Crusher ")[1].split("\n")[0])
+
+    def test_replaced_item_is_redrawn(self):
+        lasgun = {"name": "Lasgun", "weapon_type": "Basic", "cost": 15, "rarity": "Common",
+                  "profiles": [{"range": "Short: 0-8, Long: 8-24", "strength": 3, "armor_penetration": 0, "damage": 1}]}
+        crusher = self.game_logic.game_state.get_fighter("Crusher")
+        crusher.weapons = [build_weapon(WeaponInput.model_validate(lasgun))]
+        ui = UserInterface(self.console, self.game_logic)
+        ui.process_command("status")
+
+        # Replaced in place: same list, same length, same version
+        crusher.weapons[0] = build_weapon(WeaponInput.model_validate({**lasgun, "name": "Autogun"}))
+        start = len(self.output.getvalue())
+        ui.process_command("status")
+        self.assertIn("Autogun", self.output.getvalue()[start:])
+
+    def test_status_gang_names_ending_in_a_number(self):
+        game_state = self.game_logic.game_state
+        game_state.gangs[0].name = "Gang 7"
+        ui = UserInterface(self.console, self.game_logic)
+        ui.process_command("status gang 7")
+        ui.process_command("status gang 7 1")
+        text = self.output.getvalue()
+        self.assertEqual(text.count("Gang 7 Gang"), 2)
+        self.assertNotIn("Eschers Gang", text)
+        self.assertNotIn("Error", text)
+
+        game_state.gangs = []
+        ui.process_command("status")
+        self.assertNotIn("doesn't exist", self.output.getvalue())
+
+    def test_show_fighter(self):
+        ui = UserInterface(self.console, self.game_logic)
+        ui.process_command("show_fighter venom")
+        self.assertIn("Venom", self.output.getvalue())
+        self.assertNotIn("error", self.output.getvalue().lower())
+
+    def test_save_and_load_a_downed_fighter(self):
+        ui = UserInterface(self.console, self.game_logic)
+        venom = self.game_logic.game_state.get_fighter("Venom")
+        venom.wounds = 0  # As resolve_combat leaves a fighter taken down
+        venom.is_out_of_action = True
+        ui.process_command("save s2")
+        ui.process_command("load s2")
+        self.assertIn("Game loaded from slot 's2'", self.output.getvalue())
+        restored = self.game_logic.game_state.get_fighter("Venom")
+        self.assertIsNot(restored, venom)
+        self.assertEqual((restored.wounds, restored.is_out_of_action), (0, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,24 +1,121 @@
+import io
 import logging
 from rich.console import Console
+from rich.segment import Segment, Segments
 from rich.table import Table
 from game_logic import GameLogic
+from database import DEFAULT_SLOT
+from autosave import Autosaver
 import json
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+# Commands whose arguments keep their case, e.g. file paths
+CASE_SENSITIVE_COMMANDS = {'import_roster'}
+# Failed roster rows listed after an import
+MAX_ROSTER_ERRORS_SHOWN = 20
+# How command output reaches the console: printed as it is rendered, rendered into a buffer
+# written out once per command (or every `flush_every` commands), or not rendered at all
+OUTPUT_MODES = ('direct', 'buffered', 'null')
+# Fighters shown per gang by the status command; bigger gangs are shown a page at a time
+STATUS_PAGE_SIZE = 20
+# Commands that read files on the host, which remote players must not be able to do
+FILE_COMMANDS = {'import_roster'}
+# Commands that only display the game; in null output mode they are skipped entirely
+DISPLAY_COMMANDS = {'help', 'status', 'map', 'objectives', 'victory_points', 'saves', 'show_equipment',
+                    'show_scenario', 'show_combat_round', 'show_fighter'}
+
+
+class NullConsole:
+    """A console that discards everything without rendering it, for headless and piped runs."""
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        pass
+
 
 class UserInterface:
-    def __init__(self, console: Console, game_logic: GameLogic):
-        """Initialize the UserInterface."""
-        self.console = console
+    def __init__(self, console: Console, game_logic: GameLogic, output: str = 'direct', flush_every: int = 1,
+                 allow_file_commands: bool = True):
+        """
+        Initialize the UserInterface.
+
+        Args:
+            console (Console): The console command output is shown on.
+            game_logic (GameLogic): The game logic instance.
+            output (str): The output mode; see set_output().
+            flush_every (int): In buffered mode, the commands between writes to the console.
+            allow_file_commands (bool): Whether commands that read files on this host (FILE_COMMANDS) may be used.
+        """
+        self.target = console
         self.game_logic = game_logic
+        self.allow_file_commands = allow_file_commands
+        # Rendered status rows, fighter details and table pages, with the fighter or gang and the key they were rendered for
+        self._fragment_cache: Dict[Tuple[str, int], Tuple[Any, tuple, Any]] = {}
+        self._table_cache: Dict[int, Tuple[Any, tuple, List[Segment]]] = {}
+        self.set_output(output, flush_every)
         logging.info("UserInterface initialized")
 
+    def set_output(self, output: str, flush_every: int = 1) -> None:
+        """
+        Choose how command output reaches the console, writing out anything still buffered first.
+
+        'direct' prints to the console as output is rendered. 'buffered'
+        renders into memory, with the console's width and colors, and
+        writes it to the console in one go after every `flush_every`
+        commands. 'null' renders nothing and skips the display-only
+        commands, for headless and piped runs.
+
+        Args:
+            output (str): 'direct', 'buffered' or 'null'.
+            flush_every (int): In buffered mode, the commands between writes to the console.
+
+        Raises:
+            ValueError: If the output mode is unknown.
+        """
+        if output not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode: {output}. Use one of: {', '.join(OUTPUT_MODES)}")
+        if getattr(self, 'output', None) == 'buffered':
+            self.flush()
+        self.output = output
+        self.flush_every = max(1, flush_every)
+        self._buffer = io.StringIO()
+        self._unflushed = 0
+        if output == 'buffered':
+            self.console = Console(file=self._buffer, width=self.target.width, force_terminal=self.target.is_terminal,
+                                   color_system=self.target.color_system)
+        elif output == 'null':
+            self.console = NullConsole()
+        else:
+            self.console = self.target
+
+    def flush(self) -> None:
+        """Write buffered command output to the console."""
+        self._unflushed = 0
+        text = self._buffer.getvalue()
+        if not text:
+            return
+        self.target.file.write(text)
+        self.target.file.flush()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
     def process_command(self, command: str) -> None:
         """Process user commands and execute corresponding methods."""
+        try:
+            self._process_command(command)
+        finally:
+            if self.output == 'buffered':
+                self._unflushed += 1
+                if self._unflushed >= self.flush_every:
+                    self.flush()
+
+    def _process_command(self, command: str) -> None:
         self.console.print(f"[bold cyan]Processing command:[/bold cyan] {command}")
         try:
             parts = command.lower().split()
             if not parts:
                 raise ValueError("Empty command")
+            if parts[0] in CASE_SENSITIVE_COMMANDS:
+                parts = [parts[0]] + command.split()[1:]
 
             command_handlers = {
                 'help': self.show_help,
@@ -27,10 +124,14 @@ class UserInterface:
                 'attack': self._handle_attack,
                 'end_activation': self._handle_end_activation,
                 'save': self._handle_save,
+                'saves': self._handle_list_saves,
+                'load': self._handle_load,
+                'resume': self._handle_resume,
                 'map': self.show_battlefield,
                 'objectives': self.show_mission_objectives,
                 'victory_points': self.show_victory_points,
                 'create_gang_member': self._handle_create_gang_member,
+                'import_roster': self._handle_import_roster,
                 'use_consumable': self._handle_use_consumable,
                 'show_equipment': self._handle_show_equipment,
                 'show_scenario': self.show_scenario,
@@ -43,6 +144,10 @@ class UserInterface:
 
             handler = command_handlers.get(parts[0])
             if handler:
+                if parts[0] in FILE_COMMANDS and not self.allow_file_commands:
+                    raise ValueError(f"The {parts[0]} command is not available here")
+                if self.output == 'null' and parts[0] in DISPLAY_COMMANDS:
+                    return
                 handler(parts[1:] if len(parts) > 1 else [])
             else:
                 raise ValueError(f"Unknown command: {parts[0]}")
@@ -59,15 +164,19 @@ class UserInterface:
         self.console.print("[bold]Available commands:[/bold]")
         help_text = [
             ("help", "Show this help message"),
-            ("status", "Show detailed status of all gang members"),
+            ("status [gang_name] [page]", f"Show detailed status of gang members, {STATUS_PAGE_SIZE} per gang per page"),
             ("move <fighter_name> <x> <y>", "Move the active fighter"),
             ("attack <attacker_name> <target_name> [weapon_name] [attack_type]", "Perform an attack (attack_type can be 'melee', 'ranged', or 'auto')"),
             ("end_activation", "End the current fighter's activation"),
-            ("save", "Save the current game state"),
+            ("save [slot]", "Save the current game state to a save slot (default 'main')"),
+            ("saves", "List the save slots of this game"),
+            ("load [slot]", "Load the game saved in a save slot (default 'main')"),
+            ("resume", "Resume from the latest autosave (use before taking any action)"),
             ("map", "Show the battlefield map"),
             ("objectives", "Show current mission objectives"),
             ("victory_points", "Show current victory points"),
             ("create_gang_member <gang_name> <member_data_json>", "Create a custom gang member"),
+            ("import_roster <file> [workers]", "Import fighters from a JSON lines or CSV roster file"),
             ("use_consumable <fighter_name> <consumable_name>", "Use a consumable item"),
             ("show_equipment <fighter_name>", "Show equipment details for a fighter"),
             ("show_scenario", "Display information about the current scenario"),
@@ -81,11 +190,36 @@ class UserInterface:
         for command, description in help_text:
             self.console.print(f"  {command} - {description}")
 
-    def show_status(self, _: Optional[List[str]] = None) -> None:
-        """Display current status of all gang members."""
+    def show_status(self, args: Optional[List[str]] = None) -> None:
+        """
+        Display the status of the gangs' members, a page of STATUS_PAGE_SIZE fighters per gang at a time.
+
+        Args:
+            args (Optional[List[str]]): Optionally a gang name, then optionally a page number.
+
+        Raises:
+            ValueError: If the gang isn't in the game or the page number isn't a page of it.
+        """
+        args = list(args or [])
+        gangs = self.game_logic.game_state.gangs
+        by_name = {gang.name.lower(): gang for gang in gangs}
+        page = 1
+        if args and " ".join(args).lower() not in by_name and args[-1].isdigit():
+            # A trailing number is the page, unless it is part of the gang's name (e.g. 'Gang 7')
+            page = int(args.pop())
+        if args:
+            gang_name = " ".join(args)
+            if gang_name.lower() not in by_name:
+                raise ValueError(f"Gang '{gang_name}' not found")
+            gangs = [by_name[gang_name.lower()]]
+        pages = max((self._status_pages(gang) for gang in gangs), default=1)
+        if page < 1 or page > pages:
+            raise ValueError(f"Page {page} doesn't exist; there {'is 1 page' if pages == 1 else f'are {pages} pages'}")
+
         try:
-            for gang in self.game_logic.game_state.gangs:
-                self._display_gang_status(gang)
+            self._prune_render_cache()
+            for gang in gangs:
+                self._display_gang_status(gang, page)
 
             self.console.print(f"\nCurrent Turn: {self.game_logic.game_state.current_turn}")
             self.console.print(f"Active Gang: {self.game_logic.get_active_gang().name}")
@@ -96,18 +230,39 @@ class UserInterface:
             self.console.print(f"[bold red]Error displaying status:[/bold red] {str(e)}")
             logging.error(f"Error in show_status: {str(e)}", exc_info=True)
 
-    def _display_gang_status(self, gang: Any) -> None:
-        """Display status of a gang."""
-        self.console.print(f"\n[bold]{gang.name} Gang[/bold] (Credits: {gang.credits}, Victory Points: {gang.victory_points})")
-        table = self._create_gang_status_table()
+    @staticmethod
+    def _status_pages(gang: Any) -> int:
+        """The number of status pages a gang's members take up."""
+        return max(1, -(-len(gang.members) // STATUS_PAGE_SIZE))
 
-        for member in gang.members:
-            is_active = (gang == self.game_logic.get_active_gang() and
-                       member == self.game_logic.get_active_fighter())
-            self._add_member_to_status_table(table, member, is_active)
+    def _display_gang_status(self, gang: Any, page: int = 1) -> None:
+        """Display one page of a gang's status: its table, then each member's details."""
+        self.console.print(f"\n[bold]{gang.name} Gang[/bold] (Credits: {gang.credits}, Victory Points: {gang.victory_points})")
+        pages = self._status_pages(gang)
+        if page > pages:
+            self.console.print(f"No fighters on page {page}; the gang has {pages}.")
+            return
+        start = (page - 1) * STATUS_PAGE_SIZE
+        members = gang.members[start:start + STATUS_PAGE_SIZE]
+        active_fighter = self.game_logic.get_active_fighter() if gang is self.game_logic.get_active_gang() else None
+        active = next((n for n, member in enumerate(members) if member is active_fighter), None)
 
-        self.console.print(table)
-        self._display_member_details(gang)
+        # The table is laid out again only if a row on the page changed, the active fighter moved or the width changed
+        key = (page, self.console.width, active, tuple(self._render_key(member) for member in members))
+        cached = self._table_cache.get(id(gang))
+        if cached is not None and cached[0] is gang and cached[1] == key:
+            segments = cached[2]
+        else:
+            table = self._create_gang_status_table()
+            for n, member in enumerate(members):
+                self._add_member_to_status_table(table, member, n == active)
+            segments = list(self.console.render(table))
+            self._table_cache[id(gang)] = (gang, key, segments)
+        self.console.print(Segments(segments))
+        if pages > 1:
+            self.console.print(f"Fighters {start + 1}-{start + len(members)} of {len(gang.members)}, page {page} of {pages}. "
+                               f"Use 'status {gang.name} <page>' for another page.")
+        self._display_member_details(members)
 
     def _create_gang_status_table(self) -> Table:
         """Create a table for displaying gang member status."""
@@ -119,39 +274,92 @@ class UserInterface:
 
     def _add_member_to_status_table(self, table: Table, member: Any, is_active: bool) -> None:
         """Add a gang member's information to the status table."""
-        table.add_row(
+        table.add_row(*self._cached_fragment('row', member, self._status_row), "Yes" if is_active else "No")
+
+    @staticmethod
+    def _status_row(member: Any) -> tuple:
+        """A member's status table cells, bar the Active column."""
+        return (
             member.name, member.role,
             str(member.movement), str(member.weapon_skill), str(member.ballistic_skill),
             str(member.strength), str(member.toughness), str(member.wounds),
             str(member.initiative), str(member.attacks), str(member.leadership),
             str(member.cool), str(member.will), str(member.intelligence),
-            str(member.xp), "Yes" if is_active else "No"
+            str(member.xp)
         )
 
-    def _display_member_details(self, gang: Any) -> None:
-        """Display detailed information for each member of a gang."""
-        for member in gang.members:
-            self.console.print(f"\n[bold]{member.name}[/bold]")
-            if member.weapons:
-                self.console.print("  Weapons:")
-                for weapon in member.weapons:
-                    self.console.print(f"    - {weapon.name}")
-                    if weapon.profiles:
-                        for profile in weapon.profiles:
-                            self.console.print(f"      Profile: Range={profile.range}, S={profile.strength}, AP={profile.armor_penetration}, D={profile.damage}")
-            
-            if member.equipment:
-                self.console.print("  Equipment:")
-                for equipment in member.equipment:
-                    self.console.print(f"    - {equipment.name}: {equipment.description}")
-            
-            if member.skills:
-                self.console.print(f"  Skills: {', '.join(member.skills)}")
-            
-            if member.special_rules:
-                self.console.print("  Special Rules:")
-                for rule in member.special_rules:
-                    self.console.print(f"    - {rule.name}: {rule.description}")
+    def _display_member_details(self, members: List[Any]) -> None:
+        """Display detailed information for each of some gang members."""
+        segments: List[Segment] = []
+        for member in members:
+            segments.extend(self._cached_fragment('details', member, self._render_member_details))
+        self.console.print(Segments(segments))
+
+    def _render_member_details(self, member: Any) -> List[Segment]:
+        """Render a member's details."""
+        lines = [f"\n[bold]{member.name}[/bold]"]
+        if member.weapons:
+            lines.append("  Weapons:")
+            for weapon in member.weapons:
+                lines.append(f"    - {weapon.name}")
+                for profile in weapon.profiles:
+                    lines.append(f"      Profile: Range={profile.range}, S={profile.strength}, AP={profile.armor_penetration}, D={profile.damage}")
+
+        if member.equipment:
+            lines.append("  Equipment:")
+            for equipment in member.equipment:
+                lines.append(f"    - {equipment.name}: {equipment.description}")
+
+        if member.skills:
+            lines.append(f"  Skills: {', '.join(member.skills)}")
+
+        if member.special_rules:
+            lines.append("  Special Rules:")
+            for rule in member.special_rules:
+                lines.append(f"    - {rule.name}: {rule.description}")
+        return list(self.console.render(self.console.render_str("\n".join(lines)), self.console.options))
+
+    @staticmethod
+    def _render_key(member: Any) -> tuple:
+        """
+        What a member's rendering depends on: their version, plus the displayed lists, which change in place.
+
+        The lists' items are part of the key, so replacing an item is seen even if the list keeps its length.
+        Comparing keys compares items by identity first, so unchanged lists cost a pointer check per item.
+        """
+        return (member.version, tuple(member.weapons), tuple(member.equipment), tuple(member.skills),
+                tuple(member.special_rules))
+
+    def _cached_fragment(self, kind: str, member: Any, render: Callable[[Any], Any]) -> Any:
+        """
+        Get part of a member's rendering, rebuilding it only if the member changed since it was cached.
+
+        Args:
+            kind (str): Which part, e.g. 'row' or 'details'.
+            member (Any): The gang member.
+            render (Callable[[Any], Any]): Builds the part from the member.
+
+        Returns:
+            Any: The cached or freshly built part.
+        """
+        key = (self._render_key(member), self.console.width)
+        cached = self._fragment_cache.get((kind, id(member)))
+        # The member is kept with the entry, so its id can't be reused by another fighter while cached
+        if cached is not None and cached[0] is member and cached[1] == key:
+            return cached[2]
+        fragment = render(member)
+        self._fragment_cache[(kind, id(member))] = (member, key, fragment)
+        return fragment
+
+    def _prune_render_cache(self) -> None:
+        """Drop cached renderings of fighters and gangs that have left the game."""
+        gangs = self.game_logic.game_state.gangs
+        if len(self._fragment_cache) <= 2 * sum(len(gang.members) for gang in gangs) and len(self._table_cache) <= len(gangs):
+            return
+        members = {id(member) for gang in gangs for member in gang.members}
+        self._fragment_cache = {key: entry for key, entry in self._fragment_cache.items() if key[1] in members}
+        gang_ids = {id(gang) for gang in gangs}
+        self._table_cache = {key: entry for key, entry in self._table_cache.items() if key in gang_ids}
 
     def _handle_move(self, args: list) -> None:
         """Handle the move command."""
@@ -201,11 +409,45 @@ class UserInterface:
         result = self.game_logic.end_fighter_activation()
         self.console.print(result)
 
-    def _handle_save(self, _: list) -> None:
+    def _handle_save(self, args: list) -> None:
         """Handle saving the game state."""
-        with self.game_logic.db.get_connection() as db:
-            db.save_game_state(self.game_logic.game_state.dict())
-        self.console.print("Game state saved.")
+        slot = args[0] if args else DEFAULT_SLOT
+        self.game_logic.db.save_game_state(self.game_logic.snapshot(), slot=slot)
+        self.game_logic.save_replay()
+        self.console.print(f"Game state saved to slot '{slot}'.")
+
+    def _handle_list_saves(self, _: list) -> None:
+        """Handle listing the save slots of the current game."""
+        saves = self.game_logic.db.list_saves(self.game_logic.db.game_id)
+        if not saves:
+            self.console.print("No saved games.")
+            return
+        table = Table(title="Saved Games", show_header=True, header_style="bold magenta")
+        for col in ["Slot", "Turn", "Gangs", "Scenario", "Saved At"]:
+            table.add_column(col)
+        for save in saves:
+            table.add_row(save.slot, str(save.turn or "-"), ", ".join(save.gangs), save.scenario or "-",
+                          save.saved_at.strftime("%Y-%m-%d %H:%M:%S"))
+        self.console.print(table)
+
+    def _handle_load(self, args: list) -> None:
+        """Handle loading a game from a save slot."""
+        slot = args[0] if args else DEFAULT_SLOT
+        snapshot = self.game_logic.db.load_game_state(slot=slot)
+        if snapshot is None:
+            raise ValueError(f"No saved game in slot '{slot}'")
+        self.game_logic.restore(snapshot)
+        self.console.print(f"Game loaded from slot '{slot}'.")
+
+    def _handle_resume(self, _: list) -> None:
+        """Handle resuming the game from its latest autosave."""
+        autosaver = self.game_logic.autosaver or Autosaver(self.game_logic.db)
+        snapshot = autosaver.load_latest()
+        if snapshot is None:
+            raise ValueError("No autosave to resume from")
+        # Autosaves are written by this program from valid games
+        self.game_logic.restore(snapshot, trusted=True)
+        self.console.print("Game resumed from the latest autosave.")
 
     def show_battlefield(self, _: Optional[List[str]] = None) -> None:
         """Display the current battlefield map."""
@@ -278,40 +520,33 @@ class UserInterface:
         member_data_json = " ".join(args[1:])
         try:
             member_data = json.loads(member_data_json)
-            for gang in self.game_logic.game_state.gangs:
-                if gang.name.lower() == gang_name.lower():
-                    from gang_builder import create_gang_member
-                    new_member = create_gang_member(member_data)
-                    gang.members.append(new_member)
-                    self.console.print(f"Successfully created new gang member: {new_member.name}")
-                    return
-            raise ValueError(f"Gang '{gang_name}' not found")
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON format for member data")
+        new_member = self.game_logic.add_gang_member(gang_name, member_data)
+        self.console.print(f"Successfully created new gang member: {new_member.name}")
+
+    def _handle_import_roster(self, args: list) -> None:
+        """Handle importing fighters from a roster file."""
+        if len(args) not in (1, 2) or (len(args) == 2 and not args[1].isdigit()):
+            raise ValueError("Invalid import_roster command. Use: import_roster <file> [workers]")
+        workers = int(args[1]) if len(args) == 2 else 0
+        result = self.game_logic.import_roster(args[0], workers)
+        self.console.print(f"Imported {len(result.members)} of {result.rows} fighters from {args[0]}")
+        for line_number, message in result.errors[:MAX_ROSTER_ERRORS_SHOWN]:
+            self.console.print(f"[bold red]Line {line_number}:[/bold red] {message}")
+        if len(result.errors) > MAX_ROSTER_ERRORS_SHOWN:
+            self.console.print(f"... and {len(result.errors) - MAX_ROSTER_ERRORS_SHOWN} more failed rows")
 
     def _handle_use_consumable(self, args: list) -> None:
         """Handle using a consumable item."""
         if len(args) != 2:
             raise ValueError("Invalid use_consumable command. Use: use_consumable <fighter_name> <consumable_name>")
         fighter_name, consumable_name = args
+        consumable = self.game_logic.use_consumable(fighter_name, consumable_name)
         fighter = self.game_logic._get_fighter_by_name(fighter_name)
-        if not fighter:
-            raise ValueError(f"Fighter '{fighter_name}' not found")
-        
-        if not fighter.consumables:
-            raise ValueError(f"Fighter {fighter_name} has no consumables")
-            
-        for consumable in fighter.consumables:
-            if consumable.name.lower() == consumable_name.lower():
-                if consumable.uses > 0:
-                    consumable.uses -= 1
-                    self.console.print(f"{fighter.name} used {consumable.name}: {consumable.effect}")
-                    if consumable.side_effects:
-                        self.console.print(f"Side effects: {consumable.side_effects}")
-                    return
-                else:
-                    raise ValueError(f"No uses remaining for {consumable.name}")
-        raise ValueError(f"Consumable '{consumable_name}' not found")
+        self.console.print(f"{fighter.name} used {consumable.name}: {consumable.effect}")
+        if consumable.side_effects:
+            self.console.print(f"Side effects: {consumable.side_effects}")
 
     def _handle_show_equipment(self, args: list) -> None:
         """Handle displaying equipment details for a fighter."""
@@ -348,8 +583,7 @@ class UserInterface:
         fighter_name = args[0]
         fighter = self.game_logic._get_fighter_by_name(fighter_name)
         if fighter:
-            self.console.print(f"[bold]{fighter.name}[/bold]")
-            self._display_member_details({"members": [fighter]})
+            self._display_member_details([fighter])
         else:
             self.console.print(f"Fighter {fighter_name} not found.")
 
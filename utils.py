@@ -1,5 +1,9 @@
+import contextlib
+import math
+import os
 import random
-from typing import List, Tuple
+import tempfile
+from typing import BinaryIO, Iterator, List, Tuple
 
 def roll_dice(number_of_dice: int, sides: int) -> List[int]:
     """
@@ -41,3 +45,55 @@ def generate_random_position(max_x: int, max_y: int) -> Tuple[int, int]:
         Tuple[int, int]: A tuple containing the random x and y coordinates.
     """
     return random.randint(0, max_x), random.randint(0, max_y)
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Get a percentile of a list of values using the nearest-rank method.
+
+    Args:
+        values (List[float]): The values; they do not need to be sorted.
+        pct (float): The percentile to get, between 0 and 100.
+
+    Returns:
+        float: The value at that percentile, or 0.0 if there are no values.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+@contextlib.contextmanager
+def atomic_write(path: str) -> Iterator[BinaryIO]:
+    """
+    Write a file so that a crash leaves either the old or the new contents, never a partial file.
+
+    The contents go to a temporary file in the same directory, which is
+    fsynced and then renamed over `path`. If the block raises, the temporary
+    file is removed and `path` is left untouched.
+
+    Args:
+        path (str): The file to write.
+
+    Yields:
+        BinaryIO: The temporary file, opened for binary writing.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    # Make the rename itself durable
+    with contextlib.suppress(OSError):
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)